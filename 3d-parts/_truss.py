@@ -0,0 +1,71 @@
+"""
+Numba-compiled triangular truss grid generation with keep-out filtering.
+
+The staggered triangle grid plus its keep-out test is pure arithmetic,
+so the whole candidate loop compiles to native code (same approach as
+battery_cover's honeycomb grid). For fine truss patterns the candidate
+count grows with rows x cols and the compiled loop stays effectively
+free next to the OCCT boolean work.
+"""
+
+import math
+
+import numpy as np
+from numba import boolean, float64, njit, types
+
+
+# Explicit signature: compiled ahead of the first call, cached to disk,
+# and dispatch never has to infer types.
+@njit(types.Tuple((float64[:, :], boolean[:]))(
+    float64, float64, float64, float64,
+    float64[:, :], float64[:], float64), cache=True)
+def gen(length, width, tri_size, wall, keepout_xy, keepout_r_sq, center_r_sq):
+    """In-bounds, keep-out-filtered triangle centers.
+
+    keepout_xy is an (M, 2) array of feature centers with matching
+    squared radii in keepout_r_sq; center_r_sq is the squared radius of
+    the central (IMU) exclusion zone. Returns (xy (N, 2), pointing_up).
+    """
+    tri_height = tri_size * math.sqrt(3.0) / 2.0
+
+    x_spacing = tri_size + wall
+    y_spacing = tri_height + wall * 0.866
+
+    cols = int(length / x_spacing)
+    rows = int(width / y_spacing)
+
+    # Center the pattern
+    x_offset = -(cols - 1) * x_spacing / 2.0
+    y_offset = -(rows - 1) * y_spacing / 2.0
+
+    out = np.empty((rows * cols, 2))
+    up = np.empty(rows * cols, np.bool_)
+    k = 0
+    for row in range(rows):
+        y = y_offset + row * y_spacing
+        if abs(y) >= width / 2.0 - tri_size * 0.6:
+            continue
+        for col in range(cols):
+            # Offset alternating rows
+            x = x_offset + col * x_spacing
+            if row % 2 == 1:
+                x += x_spacing / 2.0
+            if abs(x) >= length / 2.0 - tri_size * 0.6:
+                continue
+            if x * x + y * y < center_r_sq:
+                continue
+            blocked = False
+            for j in range(keepout_xy.shape[0]):
+                dx = x - keepout_xy[j, 0]
+                dy = y - keepout_xy[j, 1]
+                if dx * dx + dy * dy < keepout_r_sq[j]:
+                    blocked = True
+                    break
+            if blocked:
+                continue
+            out[k, 0] = x
+            out[k, 1] = y
+            # Alternate triangle direction
+            up[k] = (row + col) % 2 == 0
+            k += 1
+    return out[:k], up[:k]
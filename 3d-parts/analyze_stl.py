@@ -5,21 +5,36 @@ Extracts dimensions from power-source-box-schematic.stl for reverse-engineering
 the design into build123d CSG primitives.
 """
 
+import os
+
 import numpy as np
-from stl import mesh
-import pyransac3d as pyrsc
+from numba import njit, prange
 from collections import defaultdict
+from joblib import Memory
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.spatial.distance import pdist
 import trimesh
 
 
-def load_stl_points(filepath):
-    """Load STL and extract unique vertices as point cloud."""
-    stl_mesh = mesh.Mesh.from_file(filepath)
-    # Flatten triangles to points
-    points = stl_mesh.vectors.reshape(-1, 3)
-    # Remove duplicates
-    points = np.unique(points, axis=0)
-    return points, stl_mesh
+def load_stl_points(tmesh):
+    """Extract unique vertices (and their normals) as a point cloud.
+
+    Returns (points, normals), both float32 and row-aligned.
+    """
+    points = np.ascontiguousarray(tmesh.vertices, dtype=np.float32)
+
+    # Remove duplicates. trimesh merges vertices on load for well-formed
+    # STLs, but unprocessed meshes can still repeat them bit-exactly, so
+    # dedup on the packed float32 bit patterns: one sort over a 96-bit
+    # integer key instead of np.unique(axis=0)'s three stable float sorts.
+    raw = points.view(np.uint32).reshape(-1, 3)
+    key = np.empty(len(raw), dtype=[('hi', 'u8'), ('lo', 'u4')])
+    key['hi'] = (raw[:, 0].astype(np.uint64) << 32) | raw[:, 1]
+    key['lo'] = raw[:, 2]
+    _, idx = np.unique(key, return_index=True)
+
+    normals = np.asarray(tmesh.vertex_normals, dtype=np.float32)[idx]
+    return points[idx], normals
 
 
 def analyze_bounding_box(points):
@@ -38,116 +53,415 @@ def analyze_bounding_box(points):
 
 def detect_z_levels(points, tolerance=0.3):
     """Find distinct Z levels in the model (for layer detection)."""
-    z_values = points[:, 2]
-    z_unique = np.unique(np.round(z_values / tolerance) * tolerance)
-    return sorted(z_unique)
+    # Bucket Z on the tolerance grid and histogram the buckets: a single
+    # linear pass instead of sorting the whole column with np.unique.
+    zq = np.rint(points[:, 2] / tolerance).astype(np.int32)
+    z_min = zq.min()
+    counts = np.bincount(zq - z_min)
+    levels = (np.flatnonzero(counts) + z_min) * tolerance
+    return levels.tolist()  # Bucket indices ascend, so already sorted
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _ransac_plane(xs, ys, zs, alive, thresh, seeds):
+    """Parallel RANSAC plane kernel: 3-point model, inlier-count reduction.
+
+    Each trial in the pre-sampled `seeds` array builds a plane from three
+    points and counts inliers with thread-local scalars (no per-trial mask
+    allocation). The cloud arrives as three contiguous float32 columns so
+    the inner loop reads unit-strided SIMD-friendly streams. Points with
+    `alive[i] == 0` were claimed by an earlier primitive and are skipped.
+    Returns per-trial equations and counts; the caller picks the best
+    trial and rebuilds its inlier set vectorized. Degenerate samples
+    leave their trial at zero inliers instead of raising, so callers
+    need no exception handling around the fit.
+    """
+    n_iter = seeds.shape[0]
+    n = xs.shape[0]
+    counts = np.zeros(n_iter, dtype=np.int64)
+    eqs = np.zeros((n_iter, 4), dtype=xs.dtype)
+
+    for t in prange(n_iter):
+        i0, i1, i2 = seeds[t, 0], seeds[t, 1], seeds[t, 2]
+        # Edge vectors from the first sample point
+        ax = xs[i1] - xs[i0]
+        ay = ys[i1] - ys[i0]
+        az = zs[i1] - zs[i0]
+        bx = xs[i2] - xs[i0]
+        by = ys[i2] - ys[i0]
+        bz = zs[i2] - zs[i0]
+        # Plane normal via cross product
+        nx = ay * bz - az * by
+        ny = az * bx - ax * bz
+        nz = ax * by - ay * bx
+        norm = np.sqrt(nx * nx + ny * ny + nz * nz)
+        if norm < 1e-12:
+            continue  # Degenerate (collinear) sample
+        nx /= norm
+        ny /= norm
+        nz /= norm
+        d = -(nx * xs[i0] + ny * ys[i0] + nz * zs[i0])
+
+        count = 0
+        for i in range(n):
+            if alive[i] == 0:
+                continue
+            dist = nx * xs[i] + ny * ys[i] + nz * zs[i] + d
+            if abs(dist) <= thresh:
+                count += 1
+
+        counts[t] = count
+        eqs[t, 0] = nx
+        eqs[t, 1] = ny
+        eqs[t, 2] = nz
+        eqs[t, 3] = d
+
+    return eqs, counts
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _ransac_cylinder(xs, ys, zs, nxs, nys, nzs, alive, thresh, seeds):
+    """Parallel RANSAC cylinder kernel: normal-guided 2-point model.
+
+    Schnabel-style efficient RANSAC: two samples with surface normals
+    determine the axis direction (cross product of the normals); the
+    normal rays, projected into the plane perpendicular to the axis,
+    intersect at a point on the axis, and the radius is the distance from
+    a sample to that axis. Converges in far fewer trials than the 3-point
+    circumcircle model and is numerically better conditioned. The cloud
+    and normals arrive as contiguous float32 columns (see _ransac_plane).
+    Inliers are alive points whose distance to the axis is within
+    `thresh` of the radius. Returns per-trial (center, axis, radius) and
+    counts. As in _ransac_plane, degenerate samples score zero inliers
+    rather than raising.
+    """
+    n_iter = seeds.shape[0]
+    n = xs.shape[0]
+    counts = np.zeros(n_iter, dtype=np.int64)
+    models = np.zeros((n_iter, 7), dtype=xs.dtype)  # cx,cy,cz, ax,ay,az, r
+
+    for t in prange(n_iter):
+        i0, i1 = seeds[t, 0], seeds[t, 1]
+        p0x, p0y, p0z = xs[i0], ys[i0], zs[i0]
+        n0x, n0y, n0z = nxs[i0], nys[i0], nzs[i0]
+        n1x, n1y, n1z = nxs[i1], nys[i1], nzs[i1]
+
+        # Axis direction = cross product of the two surface normals
+        ux = n0y * n1z - n0z * n1y
+        uy = n0z * n1x - n0x * n1z
+        uz = n0x * n1y - n0y * n1x
+        uu = ux * ux + uy * uy + uz * uz
+        if uu < 1e-8:
+            continue  # Normals (near-)parallel: axis undetermined
+        unorm = np.sqrt(uu)
+        dx, dy, dz = ux / unorm, uy / unorm, uz / unorm
+
+        # 2D basis (e1, e2) for the plane perpendicular to the axis
+        nd = n0x * dx + n0y * dy + n0z * dz
+        e1x = n0x - nd * dx
+        e1y = n0y - nd * dy
+        e1z = n0z - nd * dz
+        e1n = np.sqrt(e1x * e1x + e1y * e1y + e1z * e1z)
+        if e1n < 1e-8:
+            continue  # Normal parallel to axis: degenerate
+        e1x /= e1n
+        e1y /= e1n
+        e1z /= e1n
+        e2x = dy * e1z - dz * e1y
+        e2y = dz * e1x - dx * e1z
+        e2z = dx * e1y - dy * e1x
+
+        # Project the second normal and the point offset into (e1, e2)
+        m1u = n1x * e1x + n1y * e1y + n1z * e1z
+        m1v = n1x * e2x + n1y * e2y + n1z * e2z
+        wx = xs[i1] - p0x
+        wy = ys[i1] - p0y
+        wz = zs[i1] - p0z
+        wu = wx * e1x + wy * e1y + wz * e1z
+        wv = wx * e2x + wy * e2y + wz * e2z
+
+        # Intersect p0 + s*(1,0) with p1 + r*(m1u,m1v) in plane coords:
+        # v-components give r, then s follows from the u-components.
+        if abs(m1v) < 1e-8:
+            continue  # Projected normals parallel: no intersection
+        r1 = -wv / m1v
+        s0 = wu + r1 * m1u
+
+        # Axis point in 3D and cylinder radius
+        cx = p0x + s0 * e1x
+        cy = p0y + s0 * e1y
+        cz = p0z + s0 * e1z
+        radius = abs(s0)
+        if radius < 1e-6:
+            continue
+
+        count = 0
+        for i in range(n):
+            if alive[i] == 0:
+                continue
+            # Distance from point to axis line = |axis x (p - c)|
+            rx = xs[i] - cx
+            ry = ys[i] - cy
+            rz = zs[i] - cz
+            qx = dy * rz - dz * ry
+            qy = dz * rx - dx * rz
+            qz = dx * ry - dy * rx
+            dist = np.sqrt(qx * qx + qy * qy + qz * qz)
+            if abs(dist - radius) <= thresh:
+                count += 1
+
+        counts[t] = count
+        models[t, 0] = cx
+        models[t, 1] = cy
+        models[t, 2] = cz
+        models[t, 3] = dx
+        models[t, 4] = dy
+        models[t, 5] = dz
+        models[t, 6] = radius
+
+    return models, counts
+
+
+def _trials_needed(inlier_ratio, sample_size, confidence=0.99):
+    """Classical adaptive RANSAC bound: N = log(1-p) / log(1 - u^m).
+
+    Number of trials needed to sample at least one all-inlier minimal set
+    with probability `confidence`, given the best inlier ratio seen so far.
+    """
+    if inlier_ratio <= 0.0:
+        return np.inf
+    if inlier_ratio >= 1.0:
+        return 0.0
+    return np.log(1.0 - confidence) / np.log(1.0 - inlier_ratio ** sample_size)
+
+
+def _soa_columns(points):
+    """Split an (N, 3) cloud into three contiguous float32 columns.
+
+    float32 halves the bytes the kernels stream per trial, and separate
+    unit-stride columns double the SIMD lanes per load vs the (N, 3)
+    row layout.
+    """
+    xs = np.ascontiguousarray(points[:, 0], dtype=np.float32)
+    ys = np.ascontiguousarray(points[:, 1], dtype=np.float32)
+    zs = np.ascontiguousarray(points[:, 2], dtype=np.float32)
+    return xs, ys, zs
+
+
+def fit_plane(xs, ys, zs, alive, thresh=0.1, max_iterations=1000, batch_size=128,
+              rng=None):
+    """Fit a single plane with the parallel RANSAC kernel.
+
+    Takes the cloud as SoA columns from _soa_columns; only points flagged
+    in `alive` participate. Trials run in parallel batches; after each
+    batch the adaptive bound decides whether further trials can still beat
+    the best model, so clean CAD clouds (where the first plane often holds
+    40%+ of the points) exit after a few dozen trials instead of the full
+    budget. Returns (equation, inlier_indices) like pyransac3d's
+    Plane.fit, with indices into the full cloud. Pass `rng` (a NumPy
+    Generator) for a reproducible sampling stream.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    alive_idx = np.flatnonzero(alive)
+    n_alive = len(alive_idx)
+    best_eq = np.zeros(4, dtype=xs.dtype)
+    best_count = 0
+    trials_done = 0
+
+    while trials_done < max_iterations:
+        n_trials = min(batch_size, max_iterations - trials_done)
+        seeds = alive_idx[rng.integers(0, n_alive, (n_trials, 3))]
+        eqs, counts = _ransac_plane(xs, ys, zs, alive, thresh, seeds)
+        best = int(np.argmax(counts))
+        if counts[best] > best_count:
+            best_count = int(counts[best])
+            best_eq = eqs[best].copy()
+        trials_done += n_trials
+        if trials_done >= _trials_needed(best_count / n_alive, 3):
+            break
+
+    if best_count == 0:
+        return best_eq, np.empty(0, dtype=np.int64)
+
+    distances = best_eq[0] * xs + best_eq[1] * ys + best_eq[2] * zs + best_eq[3]
+    inliers = np.flatnonzero((np.abs(distances) <= thresh) & (alive != 0))
+    return best_eq, inliers
+
+
+def fit_cylinder(xs, ys, zs, normals, alive, thresh=0.1, max_iterations=1000,
+                 batch_size=128, rng=None):
+    """Fit a single cylinder with the parallel RANSAC kernel.
+
+    Takes the cloud as SoA columns from _soa_columns plus per-point
+    surface normals; only points flagged in `alive` participate. Same
+    batched adaptive stopping as fit_plane, with minimal sample size 2
+    for the normal-guided model. Returns
+    (center, axis, radius, inlier_indices) like pyransac3d's Cylinder.fit,
+    with indices into the full cloud. Pass `rng` (a NumPy Generator) for
+    a reproducible sampling stream.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    nxs, nys, nzs = normals
+    alive_idx = np.flatnonzero(alive)
+    n_alive = len(alive_idx)
+    best_model = np.zeros(7, dtype=xs.dtype)
+    best_count = 0
+    trials_done = 0
+
+    while trials_done < max_iterations:
+        n_trials = min(batch_size, max_iterations - trials_done)
+        seeds = alive_idx[rng.integers(0, n_alive, (n_trials, 2))]
+        models, counts = _ransac_cylinder(
+            xs, ys, zs, nxs, nys, nzs, alive, thresh, seeds
+        )
+        best = int(np.argmax(counts))
+        if counts[best] > best_count:
+            best_count = int(counts[best])
+            best_model = models[best].copy()
+        trials_done += n_trials
+        if trials_done >= _trials_needed(best_count / n_alive, 2):
+            break
+
+    center = best_model[0:3]
+    axis = best_model[3:6]
+    radius = best_model[6]
+    if best_count == 0:
+        return center, axis, radius, np.empty(0, dtype=np.int64)
+
+    rx, ry, rz = xs - center[0], ys - center[1], zs - center[2]
+    qx = axis[1] * rz - axis[2] * ry
+    qy = axis[2] * rx - axis[0] * rz
+    qz = axis[0] * ry - axis[1] * rx
+    axis_dist = np.sqrt(qx * qx + qy * qy + qz * qz)
+    inliers = np.flatnonzero((np.abs(axis_dist - radius) <= thresh) & (alive != 0))
+    return center, axis, radius, inliers
+
+
+# One detected plane as a flat record (equation, centroid, AABB, support),
+# same scheme as CYLINDER_DTYPE below.
+PLANE_DTYPE = np.dtype([
+    ('a', 'f4'), ('b', 'f4'), ('c', 'f4'), ('d', 'f4'),
+    ('cx', 'f4'), ('cy', 'f4'), ('cz', 'f4'),
+    ('xmin', 'f4'), ('xmax', 'f4'),
+    ('ymin', 'f4'), ('ymax', 'f4'),
+    ('zmin', 'f4'), ('zmax', 'f4'),
+    ('n', 'i4'),
+])
 
 
 def detect_planes(points, max_planes=10, thresh=0.1, min_inlier_ratio=0.02):
-    """Detect planar surfaces using RANSAC."""
+    """Detect planar surfaces using RANSAC.
+
+    Primitives are peeled sequentially: the strongest plane is accepted,
+    its inliers are masked out of `alive` in place, and the next round
+    fits only the survivors. Each round's dominant plane can't drown out
+    the rest of the cloud, so equal-support faces all get found; the
+    trial batches inside fit_plane stay numba-parallel, which is where
+    the wall time goes. Returns a structured array with PLANE_DTYPE
+    records.
+    """
     detected_planes = []
-    remaining_points = points.copy()
     min_inliers = int(len(points) * min_inlier_ratio)
 
-    plane_detector = pyrsc.Plane()
+    alive = np.ones(len(points), dtype=np.uint8)
+    xs, ys, zs = _soa_columns(points)
 
     for _ in range(max_planes):
-        if len(remaining_points) < min_inliers:
+        if int(alive.sum()) < min_inliers:
             break
-
-        try:
-            equation, inliers = plane_detector.fit(remaining_points, thresh=thresh)
-            if len(inliers) < min_inliers:
-                break
-
-            inlier_points = remaining_points[inliers]
-            plane_info = {
-                'equation': equation,  # [a, b, c, d] for ax + by + cz + d = 0
-                'normal': equation[:3],
-                'num_points': len(inliers),
-                'centroid': inlier_points.mean(axis=0),
-                'bounds': {
-                    'min': inlier_points.min(axis=0),
-                    'max': inlier_points.max(axis=0)
-                }
-            }
-            detected_planes.append(plane_info)
-
-            # Remove inliers for next iteration
-            mask = np.ones(len(remaining_points), dtype=bool)
-            mask[inliers] = False
-            remaining_points = remaining_points[mask]
-
-        except Exception as e:
-            print(f"Plane detection error: {e}")
+        equation, inliers = fit_plane(xs, ys, zs, alive, thresh=thresh)
+        if len(inliers) < min_inliers:
             break
 
-    return detected_planes
-
-
-def detect_cylinders(points, max_cylinders=20, thresh=0.1, min_inlier_ratio=0.005):
-    """Detect cylindrical features (holes, posts) using RANSAC."""
+        inlier_points = points[inliers]
+        centroid = inlier_points.mean(axis=0)
+        lo = inlier_points.min(axis=0)
+        hi = inlier_points.max(axis=0)
+        detected_planes.append((
+            equation[0], equation[1], equation[2], equation[3],
+            centroid[0], centroid[1], centroid[2],
+            lo[0], hi[0], lo[1], hi[1], lo[2], hi[2],
+            len(inliers),
+        ))
+        alive[inliers] = 0
+
+    return np.array(detected_planes, dtype=PLANE_DTYPE)
+
+
+# One detected cylinder as a flat record: field access and aggregation
+# become NumPy fancy indexing instead of per-element dict lookups.
+CYLINDER_DTYPE = np.dtype([
+    ('cx', 'f4'), ('cy', 'f4'), ('cz', 'f4'),
+    ('ax', 'f4'), ('ay', 'f4'), ('az', 'f4'),
+    ('r', 'f4'), ('zmin', 'f4'), ('zmax', 'f4'), ('n', 'i4'),
+])
+
+
+def detect_cylinders(points, normals, max_cylinders=20, thresh=0.1,
+                     min_inlier_ratio=0.005):
+    """Detect cylindrical features (holes, posts) using RANSAC.
+
+    `normals` are the per-point surface normals (row-aligned with
+    `points`) driving the 2-point model. Returns a structured array with
+    CYLINDER_DTYPE records.
+
+    Like detect_planes, accepted inliers are peeled out of `alive` in
+    place so every round fits a cylinder the earlier rounds haven't
+    claimed yet.
+    """
     detected_cylinders = []
-    remaining_points = points.copy()
     min_inliers = max(int(len(points) * min_inlier_ratio), 20)
 
-    cylinder_detector = pyrsc.Cylinder()
+    alive = np.ones(len(points), dtype=np.uint8)
+    xs, ys, zs = _soa_columns(points)
+    normal_cols = _soa_columns(normals)
 
     for _ in range(max_cylinders):
-        if len(remaining_points) < min_inliers:
+        if int(alive.sum()) < min_inliers:
+            break
+        center, axis, radius, inliers = fit_cylinder(
+            xs, ys, zs, normal_cols, alive, thresh=thresh,
+            max_iterations=1000)
+        if len(inliers) < min_inliers:
             break
 
-        try:
-            center, axis, radius, inliers = cylinder_detector.fit(
-                remaining_points, thresh=thresh, maxIteration=1000
-            )
-
-            if len(inliers) < min_inliers:
-                break
-
-            # Filter out unreasonably large cylinders (likely false positives)
-            if radius > 10:  # More than 10mm radius is too large for holes/posts
-                # Remove inliers and continue
-                mask = np.ones(len(remaining_points), dtype=bool)
-                mask[inliers] = False
-                remaining_points = remaining_points[mask]
-                continue
+        # Peel the surface either way, so the next round can't just
+        # rediscover it
+        alive[inliers] = 0
 
-            inlier_points = remaining_points[inliers]
-            z_min = inlier_points[:, 2].min()
-            z_max = inlier_points[:, 2].max()
-
-            cylinder_info = {
-                'center': center,
-                'axis': axis,
-                'radius': radius,
-                'diameter': radius * 2,
-                'num_points': len(inliers),
-                'z_range': (z_min, z_max),
-                'height': z_max - z_min
-            }
-            detected_cylinders.append(cylinder_info)
+        # Filter out unreasonably large cylinders (likely false positives)
+        if radius > 10:  # More than 10mm radius is too large for holes/posts
+            continue
 
-            # Remove inliers
-            mask = np.ones(len(remaining_points), dtype=bool)
-            mask[inliers] = False
-            remaining_points = remaining_points[mask]
+        inlier_points = points[inliers]
+        z_min = inlier_points[:, 2].min()
+        z_max = inlier_points[:, 2].max()
 
-        except Exception as e:
-            print(f"Cylinder detection error: {e}")
-            break
+        detected_cylinders.append((
+            center[0], center[1], center[2],
+            axis[0], axis[1], axis[2],
+            radius, z_min, z_max, len(inliers),
+        ))
 
-    return detected_cylinders
+    return np.array(detected_cylinders, dtype=CYLINDER_DTYPE)
 
 
 def analyze_cross_sections(points, z_levels):
     """Analyze cross-sections at each Z level to find feature dimensions."""
     cross_sections = {}
 
+    # Sort by Z once; each level then becomes a contiguous slice located
+    # with two binary searches instead of a full-cloud mask per level.
+    sorted_pts = points[np.argsort(points[:, 2])]
+    pz = sorted_pts[:, 2]
+
     for z in z_levels:
         # Get points near this Z level
-        mask = np.abs(points[:, 2] - z) < 0.5
-        section_points = points[mask]
+        lo = np.searchsorted(pz, z - 0.5, side='right')
+        hi = np.searchsorted(pz, z + 0.5, side='left')
+        section_points = sorted_pts[lo:hi]
 
         if len(section_points) > 10:
             cross_sections[z] = {
@@ -162,113 +476,124 @@ def analyze_cross_sections(points, z_levels):
 
 
 def cluster_cylinders_by_position(cylinders, xy_tolerance=1.0):
-    """Group cylinders that are at similar XY positions (same hole at different Z)."""
-    if not cylinders:
-        return []
-
-    clusters = []
-    used = set()
+    """Group cylinders that are at similar XY positions (same hole at different Z).
 
-    for i, cyl in enumerate(cylinders):
-        if i in used:
-            continue
-
-        cluster = [cyl]
-        used.add(i)
+    `cylinders` is the CYLINDER_DTYPE structured array from
+    detect_cylinders.
+    """
+    if len(cylinders) == 0:
+        return []
 
-        for j, other in enumerate(cylinders):
-            if j in used:
-                continue
+    # Single-linkage clustering on XY with a Chebyshev radius replaces the
+    # O(N^2) Python pair loop: one C call yields all cluster labels.
+    xy = np.column_stack((cylinders['cx'], cylinders['cy'])).astype(np.float64)
+    if len(cylinders) == 1:
+        labels = np.array([1])
+    else:
+        labels = fcluster(
+            linkage(pdist(xy, metric='chebyshev'), method='single'),
+            t=xy_tolerance, criterion='distance'
+        )
+
+    # Sort records by label so every cluster is one contiguous segment,
+    # then aggregate all clusters at once with segmented reductions.
+    order = np.argsort(labels)
+    recs = cylinders[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(labels[order])) + 1))
+    counts = np.diff(np.concatenate((starts, [len(recs)])))
+    avg_x = np.add.reduceat(recs['cx'], starts) / counts
+    avg_y = np.add.reduceat(recs['cy'], starts) / counts
+    avg_radius = np.add.reduceat(recs['r'], starts) / counts
+    z_min = np.minimum.reduceat(recs['zmin'], starts)
+    z_max = np.maximum.reduceat(recs['zmax'], starts)
+
+    return [
+        {
+            'x': avg_x[i],
+            'y': avg_y[i],
+            'radius': avg_radius[i],
+            'diameter': avg_radius[i] * 2,
+            'z_min': z_min[i],
+            'z_max': z_max[i],
+            'height': z_max[i] - z_min[i],
+            'num_detections': int(counts[i]),
+        }
+        for i in range(len(starts))
+    ]
+
+
+def analyze_stl(filepath, points, normals):
+    """Main analysis function - pure computation, no output.
+
+    `points`/`normals` are the shared row-aligned unique-vertex cloud
+    from load_stl_points. Rendering lives in print_analysis so the
+    returned dict can be memoized on disk and the report re-printed
+    from it on warm runs.
+    """
+    bbox = analyze_bounding_box(points)
+    z_levels = detect_z_levels(points, tolerance=0.3)
+    cross_sections = analyze_cross_sections(points, z_levels)
+    planes = detect_planes(points, max_planes=8, thresh=0.15)
+    cylinders = detect_cylinders(points, normals, max_cylinders=15, thresh=0.08)
 
-            # Check if XY positions are similar
-            dx = abs(cyl['center'][0] - other['center'][0])
-            dy = abs(cyl['center'][1] - other['center'][1])
-
-            if dx < xy_tolerance and dy < xy_tolerance:
-                cluster.append(other)
-                used.add(j)
-
-        # Merge cluster info
-        avg_x = np.mean([c['center'][0] for c in cluster])
-        avg_y = np.mean([c['center'][1] for c in cluster])
-        avg_radius = np.mean([c['radius'] for c in cluster])
-        z_min = min(c['z_range'][0] for c in cluster)
-        z_max = max(c['z_range'][1] for c in cluster)
-
-        clusters.append({
-            'x': avg_x,
-            'y': avg_y,
-            'radius': avg_radius,
-            'diameter': avg_radius * 2,
-            'z_min': z_min,
-            'z_max': z_max,
-            'height': z_max - z_min,
-            'num_detections': len(cluster)
-        })
+    # Cluster by position
+    cylinder_clusters = cluster_cylinders_by_position(cylinders)
+    cylinder_clusters.sort(key=lambda c: c['diameter'], reverse=True)
 
-    return clusters
+    return {
+        'num_vertices': len(points),
+        'bbox': bbox,
+        'z_levels': z_levels,
+        'cross_sections': cross_sections,
+        'planes': planes,
+        'cylinders': cylinder_clusters
+    }
 
 
-def analyze_stl(filepath):
-    """Main analysis function."""
+def print_analysis(filepath, results):
+    """Render the RANSAC report from an analyze_stl result dict."""
     print("=" * 70)
     print(f"ANALYZING: {filepath}")
     print("=" * 70)
 
-    # Load point cloud
-    points, stl_mesh = load_stl_points(filepath)
-    print(f"\nLoaded {len(points)} unique vertices")
+    print(f"\nLoaded {results['num_vertices']} unique vertices")
 
-    # Bounding box
-    bbox = analyze_bounding_box(points)
+    bbox = results['bbox']
     print(f"\n--- BOUNDING BOX ---")
     print(f"Dimensions: {bbox['dimensions'][0]:.2f} x {bbox['dimensions'][1]:.2f} x {bbox['dimensions'][2]:.2f} mm")
     print(f"Min corner: ({bbox['min'][0]:.2f}, {bbox['min'][1]:.2f}, {bbox['min'][2]:.2f})")
     print(f"Max corner: ({bbox['max'][0]:.2f}, {bbox['max'][1]:.2f}, {bbox['max'][2]:.2f})")
     print(f"Center: ({bbox['center'][0]:.2f}, {bbox['center'][1]:.2f}, {bbox['center'][2]:.2f})")
 
-    # Z levels
-    z_levels = detect_z_levels(points, tolerance=0.3)
+    z_levels = results['z_levels']
     print(f"\n--- Z LEVELS (horizontal layers) ---")
     for z in z_levels:
         print(f"  Z = {z:.2f} mm")
 
-    # Cross sections
     print(f"\n--- CROSS SECTIONS AT Z LEVELS ---")
-    cross_sections = analyze_cross_sections(points, z_levels)
-    for z, section in sorted(cross_sections.items()):
+    # z_levels arrive ascending, so insertion order is already sorted
+    for z, section in results['cross_sections'].items():
         print(f"  Z={z:.1f}mm: {section['x_span']:.1f} x {section['y_span']:.1f} mm ({section['num_points']} pts)")
 
-    # Detect planes
     print(f"\n--- DETECTED PLANES ---")
-    planes = detect_planes(points, max_planes=8, thresh=0.15)
-    for i, plane in enumerate(planes):
-        normal = plane['normal']
-        # Classify plane orientation
-        if abs(normal[2]) > 0.9:
+    for i, plane in enumerate(results['planes']):
+        # Classify plane orientation from the normal (a, b, c)
+        if abs(plane['c']) > 0.9:
             orientation = "horizontal (XY)"
-        elif abs(normal[0]) > 0.9:
+        elif abs(plane['a']) > 0.9:
             orientation = "vertical (YZ)"
-        elif abs(normal[1]) > 0.9:
+        elif abs(plane['b']) > 0.9:
             orientation = "vertical (XZ)"
         else:
             orientation = "angled"
 
-        centroid = plane['centroid']
-        bounds = plane['bounds']
         print(f"  Plane {i+1}: {orientation}")
-        print(f"    Centroid: ({centroid[0]:.2f}, {centroid[1]:.2f}, {centroid[2]:.2f})")
-        print(f"    Size: {bounds['max'][0]-bounds['min'][0]:.1f} x {bounds['max'][1]-bounds['min'][1]:.1f} mm")
-        print(f"    Points: {plane['num_points']}")
+        print(f"    Centroid: ({plane['cx']:.2f}, {plane['cy']:.2f}, {plane['cz']:.2f})")
+        print(f"    Size: {plane['xmax']-plane['xmin']:.1f} x {plane['ymax']-plane['ymin']:.1f} mm")
+        print(f"    Points: {plane['n']}")
 
-    # Detect cylinders
+    cylinder_clusters = results['cylinders']
     print(f"\n--- DETECTED CYLINDERS (holes/posts) ---")
-    cylinders = detect_cylinders(points, max_cylinders=15, thresh=0.08)
-
-    # Cluster by position
-    cylinder_clusters = cluster_cylinders_by_position(cylinders)
-    cylinder_clusters.sort(key=lambda c: c['diameter'], reverse=True)
-
     for i, cyl in enumerate(cylinder_clusters):
         print(f"  Cylinder {i+1}:")
         print(f"    Position: ({cyl['x']:.2f}, {cyl['y']:.2f}) mm")
@@ -294,22 +619,46 @@ CYLINDERS = [""")
         print(f"    {{'x': {cyl['x']:.1f}, 'y': {cyl['y']:.1f}, 'dia': {cyl['diameter']:.1f}, 'z_min': {cyl['z_min']:.1f}, 'z_max': {cyl['z_max']:.1f}}},")
     print("]")
 
-    return {
-        'bbox': bbox,
-        'z_levels': z_levels,
-        'cross_sections': cross_sections,
-        'planes': planes,
-        'cylinders': cylinder_clusters
-    }
+
+# Disk cache for the full RANSAC pipeline. Iterating on the build123d
+# reconstruction reruns this script against an unchanged STL constantly;
+# the cache key is the file's identity (path + mtime + size), so edits
+# invalidate it automatically.
+_memory = Memory(location=os.path.join(os.path.expanduser('~'),
+                                       '.cache', 'dyi-drone-stl'),
+                 verbose=0)
+
+
+@_memory.cache
+def _analyze_stl_cached(filepath, mtime_ns, size):
+    tmesh = trimesh.load(filepath)
+    points, normals = load_stl_points(tmesh)
+    return analyze_stl(filepath, points, normals)
 
 
-def analyze_with_trimesh(filepath):
-    """Use trimesh for more detailed geometric analysis."""
+def analyze_stl_file(filepath):
+    """Run analyze_stl on a file, memoized on disk by mtime and size.
+
+    Only the computation is cached; the report is rendered from the
+    returned dict so warm runs print it too.
+    """
+    st = os.stat(filepath)
+    results = _analyze_stl_cached(filepath, st.st_mtime_ns, st.st_size)
+    print_analysis(filepath, results)
+    return results
+
+
+def analyze_with_trimesh(tmesh, enumerate_holes=False):
+    """Use trimesh for more detailed geometric analysis.
+
+    With `enumerate_holes` the slice loops are polygonized with Shapely to
+    list interior holes; by default only per-level extent and net area are
+    reported, straight from the raw intersection segments.
+    """
     print("\n" + "=" * 70)
     print("TRIMESH DETAILED ANALYSIS")
     print("=" * 70)
 
-    tmesh = trimesh.load(filepath)
     print(f"\nMesh info:")
     print(f"  Vertices: {len(tmesh.vertices)}")
     print(f"  Faces: {len(tmesh.faces)}")
@@ -329,59 +678,81 @@ def analyze_with_trimesh(filepath):
 
     print(f"\nUnique Z levels: {list(z_vals)}")
 
-    # For each Z level, find the outline
+    # For each Z level, find the outline. All slices come from a single
+    # mesh_multiplane call, which shares one triangle-plane intersection
+    # pass instead of re-slicing the mesh per level.
     print(f"\n--- SLICE ANALYSIS ---")
-    for z in z_vals:
-        if z < 0 or z > 7:
+    slice_zs = [z for z in z_vals if 0 <= z <= 7]
+    try:
+        slice_lines, _, _ = trimesh.intersections.mesh_multiplane(
+            tmesh, plane_origin=[0, 0, 0], plane_normal=[0, 0, 1],
+            heights=slice_zs
+        )
+    except Exception:
+        slice_lines = [None] * len(slice_zs)
+
+    for z, segments in zip(slice_zs, slice_lines):
+        if segments is None or len(segments) == 0:
+            continue
+
+        # Fast path: extent and net enclosed area come straight from the
+        # raw 2D segments. The shoelace sum over oriented segments equals
+        # outer area minus hole areas, with no Shapely polygonization.
+        flat = segments.reshape(-1, 2)
+        x_min, y_min = flat.min(axis=0)
+        x_max, y_max = flat.max(axis=0)
+        net_area = 0.5 * abs(np.sum(
+            segments[:, 0, 0] * segments[:, 1, 1]
+            - segments[:, 1, 0] * segments[:, 0, 1]
+        ))
+        print(f"\n  Z = {z:.1f} mm: extent {x_max - x_min:.1f} x "
+              f"{y_max - y_min:.1f} mm, net area={net_area:.1f} mm²")
+
+        if not enumerate_holes:
             continue
 
         try:
-            # Create a slice at this Z level
-            slice_2d = tmesh.section(plane_origin=[0, 0, z], plane_normal=[0, 0, 1])
-            if slice_2d is not None:
-                # Get 2D path
-                path_2d, transform = slice_2d.to_planar()
-                if hasattr(path_2d, 'polygons_full') and len(path_2d.polygons_full) > 0:
-                    print(f"\n  Z = {z:.1f} mm:")
-                    for i, polygon in enumerate(path_2d.polygons_full):
-                        bounds = polygon.bounds  # (minx, miny, maxx, maxy)
-                        width = bounds[2] - bounds[0]
-                        height = bounds[3] - bounds[1]
-                        area = polygon.area
-                        print(f"    Polygon {i+1}: {width:.1f} x {height:.1f} mm, area={area:.1f} mm²")
-
-                        # Check for holes (interior rings)
-                        if hasattr(polygon, 'interiors') and len(polygon.interiors) > 0:
-                            print(f"      Interior holes: {len(polygon.interiors)}")
-                            for j, hole in enumerate(polygon.interiors):
-                                h_bounds = hole.bounds
-                                h_width = h_bounds[2] - h_bounds[0]
-                                h_height = h_bounds[3] - h_bounds[1]
-                                # Calculate centroid of hole
-                                h_coords = np.array(hole.coords)
-                                h_center = h_coords.mean(axis=0)
-                                print(f"        Hole {j+1}: {h_width:.1f} x {h_height:.1f} mm at ({h_center[0]:.1f}, {h_center[1]:.1f})")
+            # Full polygonization only when hole enumeration was requested
+            path_2d = trimesh.load_path(segments)
+            if hasattr(path_2d, 'polygons_full') and len(path_2d.polygons_full) > 0:
+                for i, polygon in enumerate(path_2d.polygons_full):
+                    bounds = polygon.bounds  # (minx, miny, maxx, maxy)
+                    width = bounds[2] - bounds[0]
+                    height = bounds[3] - bounds[1]
+                    area = polygon.area
+                    print(f"    Polygon {i+1}: {width:.1f} x {height:.1f} mm, area={area:.1f} mm²")
+
+                    # Check for holes (interior rings)
+                    if hasattr(polygon, 'interiors') and len(polygon.interiors) > 0:
+                        print(f"      Interior holes: {len(polygon.interiors)}")
+                        for j, hole in enumerate(polygon.interiors):
+                            h_bounds = hole.bounds
+                            h_width = h_bounds[2] - h_bounds[0]
+                            h_height = h_bounds[3] - h_bounds[1]
+                            # Calculate centroid of hole
+                            h_coords = np.array(hole.coords)
+                            h_center = h_coords.mean(axis=0)
+                            print(f"        Hole {j+1}: {h_width:.1f} x {h_height:.1f} mm at ({h_center[0]:.1f}, {h_center[1]:.1f})")
         except Exception as e:
             pass  # Skip levels that fail
 
-    # Convex hull analysis for overall shape
-    print(f"\n--- CONVEX HULL ---")
-    hull = tmesh.convex_hull
-    hull_bounds = hull.bounds
-    print(f"  Bounds: X[{hull_bounds[0][0]:.1f}, {hull_bounds[1][0]:.1f}], "
-          f"Y[{hull_bounds[0][1]:.1f}, {hull_bounds[1][1]:.1f}], "
-          f"Z[{hull_bounds[0][2]:.1f}, {hull_bounds[1][2]:.1f}]")
+    # Overall extents. The convex hull's bounds are identical to the
+    # mesh's own (cached) bounds, so no QHull run is needed here.
+    print(f"\n--- BOUNDS ---")
+    mesh_bounds = tmesh.bounds
+    print(f"  Bounds: X[{mesh_bounds[0][0]:.1f}, {mesh_bounds[1][0]:.1f}], "
+          f"Y[{mesh_bounds[0][1]:.1f}, {mesh_bounds[1][1]:.1f}], "
+          f"Z[{mesh_bounds[0][2]:.1f}, {mesh_bounds[1][2]:.1f}]")
 
     return tmesh
 
 
-def find_rectangular_features(filepath):
+def find_rectangular_features(tmesh):
     """Analyze the mesh to find rectangular features and holes."""
     print("\n" + "=" * 70)
     print("RECTANGULAR FEATURE DETECTION")
     print("=" * 70)
 
-    tmesh = trimesh.load(filepath)
     vertices = tmesh.vertices
 
     # Find all distinct Z levels more carefully
@@ -431,10 +802,13 @@ if __name__ == "__main__":
     else:
         filepath = "3d-parts/components/power-source-box-schematic.stl"
 
-    results = analyze_stl(filepath)
+    # RANSAC results come from the disk cache when the STL is unchanged
+    results = analyze_stl_file(filepath)
+
+    tmesh = trimesh.load(filepath)
 
     # Additional trimesh analysis
-    tmesh = analyze_with_trimesh(filepath)
+    analyze_with_trimesh(tmesh)
 
     # Feature detection
-    features = find_rectangular_features(filepath)
+    features = find_rectangular_features(tmesh)
@@ -3,9 +3,26 @@ Detailed STL analysis to understand box structure.
 """
 
 import numpy as np
+from numba import njit
 import trimesh
 
 
+@njit(cache=True)
+def _inner_mask(pts, x_lo, x_hi, y_lo, y_hi):
+    """Fused four-condition bounds test in one pass over the slab.
+
+    A single loop producing the final mask directly, instead of NumPy
+    materializing four boolean arrays and combining them.
+    """
+    n = pts.shape[0]
+    mask = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        x = pts[i, 0]
+        y = pts[i, 1]
+        mask[i] = x_lo < x < x_hi and y_lo < y < y_hi
+    return mask
+
+
 def analyze_box_structure(filepath):
     """Analyze the box structure from the reference STL."""
     print("=" * 70)
@@ -32,17 +49,26 @@ def analyze_box_structure(filepath):
     # Analyze each Z level to find features
     print(f"\n--- LAYER-BY-LAYER ANALYSIS ---")
 
+    # Sort once by Z: every level becomes a contiguous slab located by two
+    # binary searches, and the per-level bounds are single contiguous
+    # axis reductions instead of masked scans over the whole array.
+    sorted_verts = np.ascontiguousarray(vertices[np.argsort(vertices[:, 2])])
+    vz = sorted_verts[:, 2]
+
     for z in z_levels:
-        mask = np.abs(vertices[:, 2] - z) < 0.15
-        pts = vertices[mask]
+        lo = np.searchsorted(vz, z - 0.15, side='right')
+        hi = np.searchsorted(vz, z + 0.15, side='left')
+        pts = sorted_verts[lo:hi]
         if len(pts) < 4:
             continue
 
         print(f"\nZ = {z:.1f} mm ({len(pts)} vertices):")
 
-        # Find outer boundary
-        outer_x_min, outer_x_max = pts[:, 0].min(), pts[:, 0].max()
-        outer_y_min, outer_y_max = pts[:, 1].min(), pts[:, 1].max()
+        # Find outer boundary (both extremes in one pass per axis)
+        outer_min = pts.min(axis=0)
+        outer_max = pts.max(axis=0)
+        outer_x_min, outer_y_min = outer_min[0], outer_min[1]
+        outer_x_max, outer_y_max = outer_max[0], outer_max[1]
         outer_width = outer_x_max - outer_x_min
         outer_height = outer_y_max - outer_y_min
 
@@ -51,14 +77,15 @@ def analyze_box_structure(filepath):
         print(f"    Y: [{outer_y_min:.1f}, {outer_y_max:.1f}]")
 
         # Find inner boundary by looking at points not on the outer edge
-        inner_pts = pts[(pts[:, 0] > outer_x_min + 0.5) &
-                        (pts[:, 0] < outer_x_max - 0.5) &
-                        (pts[:, 1] > outer_y_min + 0.5) &
-                        (pts[:, 1] < outer_y_max - 0.5)]
+        inner_pts = pts[_inner_mask(pts,
+                                    outer_x_min + 0.5, outer_x_max - 0.5,
+                                    outer_y_min + 0.5, outer_y_max - 0.5)]
 
         if len(inner_pts) > 4:
-            inner_x_min, inner_x_max = inner_pts[:, 0].min(), inner_pts[:, 0].max()
-            inner_y_min, inner_y_max = inner_pts[:, 1].min(), inner_pts[:, 1].max()
+            inner_min = inner_pts.min(axis=0)
+            inner_max = inner_pts.max(axis=0)
+            inner_x_min, inner_y_min = inner_min[0], inner_min[1]
+            inner_x_max, inner_y_max = inner_max[0], inner_max[1]
             inner_width = inner_x_max - inner_x_min
             inner_height = inner_y_max - inner_y_min
 
@@ -81,14 +108,32 @@ def analyze_box_structure(filepath):
     analyze_slice(tmesh, 6.0, "Top (Z=6.0)")
 
 
+# Planar section cache: tmesh.section + to_planar rerun triangle-plane
+# intersection over all faces, so slicing the same mesh at the same Z
+# (analyze_box_structure and __main__ both walk the Z levels) is memoized.
+_slice_cache = {}
+
+
+def _section_path(tmesh, z):
+    """Slice the mesh at Z and return the planar path (cached per mesh)."""
+    key = (id(tmesh), z)
+    if key not in _slice_cache:
+        section = tmesh.section(plane_origin=[0, 0, z], plane_normal=[0, 0, 1])
+        if section is None:
+            _slice_cache[key] = None
+        else:
+            path, _ = section.to_planar()
+            _slice_cache[key] = path
+    return _slice_cache[key]
+
+
 def analyze_slice(tmesh, z, label):
     """Analyze a horizontal slice at given Z."""
     try:
-        section = tmesh.section(plane_origin=[0, 0, z], plane_normal=[0, 0, 1])
-        if section is None:
+        path = _section_path(tmesh, z)
+        if path is None:
             return
 
-        path, _ = section.to_planar()
         if not hasattr(path, 'polygons_full') or len(path.polygons_full) == 0:
             return
 
@@ -99,26 +144,30 @@ def analyze_slice(tmesh, z, label):
             height = bounds[3] - bounds[1]
             print(f"  Polygon {i+1}: {width:.1f} x {height:.1f} mm, area={poly.area:.1f} mm²")
 
-            # Check for holes
-            if hasattr(poly, 'interiors'):
-                for j, hole in enumerate(list(poly.interiors)):
-                    coords = np.array(hole.coords)
-                    h_bounds = (coords[:, 0].min(), coords[:, 1].min(),
-                                coords[:, 0].max(), coords[:, 1].max())
-                    h_width = h_bounds[2] - h_bounds[0]
-                    h_height = h_bounds[3] - h_bounds[1]
-                    center_x = (h_bounds[0] + h_bounds[2]) / 2
-                    center_y = (h_bounds[1] + h_bounds[3]) / 2
-
-                    # Determine if it's a circle or rectangle
-                    perimeter = coords.shape[0]
-                    if perimeter > 16:  # More vertices = likely circle
-                        shape = "circle"
+            # Check for holes — batch all interior rings into one array and
+            # compute per-ring bounds with segmented reductions instead of
+            # four small NumPy calls per hole.
+            rings = [np.asarray(h.coords, dtype=np.float32)
+                     for h in getattr(poly, 'interiors', [])]
+            if rings:
+                vertex_counts = np.fromiter((len(r) for r in rings), dtype=np.int32)
+                starts = np.concatenate(([0], np.cumsum(vertex_counts)[:-1]))
+                coords = np.vstack(rings)
+                mins = np.minimum.reduceat(coords, starts, axis=0)
+                maxs = np.maximum.reduceat(coords, starts, axis=0)
+                sizes = maxs - mins
+                centers = (mins + maxs) / 2
+                # More vertices = likely circle
+                is_circle = vertex_counts > 16
+
+                for j in range(len(rings)):
+                    h_width, h_height = sizes[j]
+                    center_x, center_y = centers[j]
+                    if is_circle[j]:
                         diameter = max(h_width, h_height)
-                        print(f"    Hole {j+1}: {shape}, d={diameter:.1f}mm at ({center_x:.1f}, {center_y:.1f})")
+                        print(f"    Hole {j+1}: circle, d={diameter:.1f}mm at ({center_x:.1f}, {center_y:.1f})")
                     else:
-                        shape = "rect"
-                        print(f"    Hole {j+1}: {shape}, {h_width:.1f}x{h_height:.1f}mm at ({center_x:.1f}, {center_y:.1f})")
+                        print(f"    Hole {j+1}: rect, {h_width:.1f}x{h_height:.1f}mm at ({center_x:.1f}, {center_y:.1f})")
 
     except Exception as e:
         print(f"  Slice error: {e}")
@@ -139,8 +188,10 @@ def find_ventilation_slots(tmesh):
 
     if len(front_pts) > 10:
         print(f"\nFront wall (Y={y_max:.1f}):")
-        # Find X positions of vertical features
-        x_vals = np.sort(np.unique(np.round(front_pts[:, 0], 1)))
+        # Find X positions of vertical features. Quantize to 0.1mm integer
+        # buckets first so the unique/sort runs on int32 instead of floats.
+        xq = np.rint(front_pts[:, 0] * 10).astype(np.int32)
+        x_vals = np.unique(xq).astype(np.float32) / 10
         print(f"  X positions: {[float(x) for x in x_vals[:20]]}...")
 
         # Find gaps (slots) by looking for large jumps in X
@@ -155,7 +206,8 @@ def find_ventilation_slots(tmesh):
 
     if len(back_pts) > 10:
         print(f"\nBack wall (Y={y_min:.1f}):")
-        x_vals = np.sort(np.unique(np.round(back_pts[:, 0], 1)))
+        xq = np.rint(back_pts[:, 0] * 10).astype(np.int32)
+        x_vals = np.unique(xq).astype(np.float32) / 10
         print(f"  X positions: {[float(x) for x in x_vals[:20]]}...")
 
 
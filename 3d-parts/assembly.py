@@ -15,18 +15,29 @@ Electronics:
 """
 
 from build123d import *
-from ocp_vscode import show, set_defaults
+import cmath
 import math
 
 # Import frame parts
 from frame_body import create_body
 from frame_arm import create_arm, ARM_TOTAL_LENGTH, ARM_HEIGHT, MOTOR_MOUNT_DEPTH
-from prop_guard import create_prop_guard
+from prop_guard import create_prop_guard, get_guard
 from battery_cover import create_battery_cover
 
 # Import electronic components
 from components import create_arduino_r4, create_mpu6050, create_lipo_2s, create_motor_driver
 
+from brep_cache import brep_cached, build_parallel
+
+# Warm runs load finished BREPs from disk; editing a part module
+# invalidates its entries (see brep_cache). The frame factories are
+# decorated in their own modules already; wrapping is idempotent.
+create_battery_cover = brep_cached(create_battery_cover)
+create_arduino_r4 = brep_cached(create_arduino_r4)
+create_mpu6050 = brep_cached(create_mpu6050)
+create_lipo_2s = brep_cached(create_lipo_2s)
+create_motor_driver = brep_cached(create_motor_driver)
+
 # Assembly constants (matching frame_body.py)
 ARM_MOUNT_DISTANCE = 40  # mm from center (diagonal)
 BODY_THICKNESS = 4       # mm
@@ -36,28 +47,57 @@ ARM_PLATFORM_HEIGHT = 4  # mm
 ARDUINO_STANDOFF_HEIGHT = 8   # mm
 IMU_PLATFORM_HEIGHT = 2       # mm
 
-
-def rotate_point(x, y, angle_deg):
-    """Rotate a 2D point around origin by angle in degrees."""
-    angle_rad = math.radians(angle_deg)
-    cos_a = math.cos(angle_rad)
-    sin_a = math.sin(angle_rad)
-    return (x * cos_a - y * sin_a, x * sin_a + y * cos_a)
+# The four arm headings are fixed, so each is folded at import time into
+# a unit complex number (one multiply rotates a point) plus the -90° arm
+# body rotation: (direction, angle, arm_rotation, name) per arm.
+ARM_CONFIGS = [
+    (cmath.rect(1.0, math.radians(a)), a, a - 90, name)
+    for a, name in [
+        (45, "Front-Right"),
+        (135, "Front-Left"),
+        (225, "Rear-Left"),
+        (315, "Rear-Right"),
+    ]
+]
 
 
-def create_assembly(include_electronics=True):
+def create_assembly(include_electronics=True, verbose=False,
+                    body=None, arm=None, guard=None, cover=None):
     """Create the complete drone assembly.
 
     Args:
         include_electronics: If True, include Arduino, IMU, battery, and driver
+        verbose: If True, print the placement report
+        body, arm, guard, cover: already-built parts to reuse; anything
+            not supplied is built here
     """
 
-    print("\n" + "=" * 60)
-    print("DRONE ASSEMBLY")
-    print("=" * 60)
+    if verbose:
+        print("\n" + "=" * 60)
+        print("DRONE ASSEMBLY")
+        print("=" * 60)
+
+    # The factories are independent, so cold runs build them in parallel
+    # worker processes; the create_* calls below then load the finished
+    # BREPs from the cache. Parts handed in by the caller skip both.
+    factories = []
+    if body is None:
+        factories.append(create_body)
+    if arm is None:
+        factories.append(create_arm)
+    if guard is None:
+        factories.append(create_prop_guard)
+    if cover is None:
+        factories.append(create_battery_cover)
+    if include_electronics:
+        factories += [create_arduino_r4, create_mpu6050, create_lipo_2s,
+                      create_motor_driver]
+    if factories:
+        build_parallel(factories)
 
     # Create body first
-    body = create_body()
+    if body is None:
+        body = create_body()
 
     # Store parts by category for colored display
     body_parts = [body]
@@ -66,37 +106,35 @@ def create_assembly(include_electronics=True):
     cover_parts = []
     electronics_parts = []
 
-    print("\nFrame Components:")
-    print("  Body: center at (0, 0, 0)")
+    if verbose:
+        print("\nFrame Components:")
+        print("  Body: center at (0, 0, 0)")
 
     # Z position where arms sit
     arm_z = BODY_THICKNESS + ARM_PLATFORM_HEIGHT
 
-    # Add 4 arms at 45 degree positions
-    arm_configs = [
-        (45, "Front-Right"),
-        (135, "Front-Left"),
-        (225, "Rear-Left"),
-        (315, "Rear-Right"),
-    ]
+    # Build each repeated part once; placements below only apply a
+    # Location to the template, which never reruns the CSG pipeline.
+    arm_template = arm if arm is not None else create_arm()
+    guard_template = guard if guard is not None else get_guard()
 
-    for angle, name in arm_configs:
-        angle_rad = math.radians(angle)
-        body_mount_x = ARM_MOUNT_DISTANCE * math.cos(angle_rad)
-        body_mount_y = ARM_MOUNT_DISTANCE * math.sin(angle_rad)
-        arm_rotation = angle - 90
+    # Add 4 arms at 45 degree positions
+    for direction, angle, arm_rotation, name in ARM_CONFIGS:
+        body_mount = ARM_MOUNT_DISTANCE * direction
+        body_mount_x, body_mount_y = body_mount.real, body_mount.imag
 
         # Motor position: arm extends from mount toward 'angle' direction
         # Motor is ARM_TOTAL_LENGTH away from mount, along the arm direction (which is 'angle')
-        motor_x = body_mount_x + ARM_TOTAL_LENGTH * math.cos(angle_rad)
-        motor_y = body_mount_y + ARM_TOTAL_LENGTH * math.sin(angle_rad)
-        motor_distance = math.sqrt(motor_x**2 + motor_y**2)
+        motor = body_mount + ARM_TOTAL_LENGTH * direction
+        motor_x, motor_y = motor.real, motor.imag
 
-        print(f"  Arm {name}: mount ({body_mount_x:.1f}, {body_mount_y:.1f}), motor ({motor_x:.1f}, {motor_y:.1f}), dist={motor_distance:.1f}mm")
+        if verbose:
+            print(f"  Arm {name}: mount ({body_mount_x:.1f}, {body_mount_y:.1f}), motor ({motor_x:.1f}, {motor_y:.1f}), dist={abs(motor):.1f}mm")
 
-        # Create and position arm
-        arm_part = create_arm()
-        arm_located = Pos(body_mount_x, body_mount_y, arm_z) * Rot(0, 0, arm_rotation) * arm_part
+        # Position arm (template is shared; moved() returns a located
+        # copy from one composed Location, no intermediate shapes)
+        arm_located = arm_template.moved(
+            Location((body_mount_x, body_mount_y, arm_z), (0, 0, arm_rotation)))
         arm_parts.append(arm_located)
 
         # Position prop guard at motor location
@@ -109,102 +147,113 @@ def create_assembly(include_electronics=True):
         guard_z = motor_mount_top_z - 8  # Sleeve covers top 8mm of motor mount
 
         guard_rotation = angle
-        guard_part = create_prop_guard()
-        guard_located = Pos(motor_x, motor_y, guard_z) * Rot(0, 0, guard_rotation) * guard_part
+        guard_located = guard_template.moved(
+            Location((motor_x, motor_y, guard_z), (0, 0, guard_rotation)))
         guard_parts.append(guard_located)
 
     # Add battery cover at bottom
-    cover_part = create_battery_cover()
-    cover_located = Pos(0, 0, -8) * Rot(180, 0, 0) * cover_part
+    cover_part = cover if cover is not None else create_battery_cover()
+    cover_located = cover_part.moved(Location((0, 0, -8), (180, 0, 0)))
     cover_parts.append(cover_located)
-    print("  Battery Cover: (0, 0, -8)")
+    if verbose:
+        print("  Battery Cover: (0, 0, -8)")
 
     # Add electronics if requested
     if include_electronics:
-        print("\nElectronic Components:")
+        if verbose:
+            print("\nElectronic Components:")
 
         # Arduino R4 WiFi - on standoffs above body
         arduino_z = BODY_THICKNESS + ARDUINO_STANDOFF_HEIGHT
         arduino = create_arduino_r4()
-        arduino_located = Pos(0, 0, arduino_z) * arduino
+        arduino_located = arduino.moved(Location((0, 0, arduino_z)))
         electronics_parts.append(("arduino", arduino_located))
-        print(f"  Arduino R4 WiFi: (0, 0, {arduino_z})")
+        if verbose:
+            print(f"  Arduino R4 WiFi: (0, 0, {arduino_z})")
 
         # MPU6050 IMU - on center platform
         imu_z = BODY_THICKNESS + IMU_PLATFORM_HEIGHT
         imu = create_mpu6050()
-        imu_located = Pos(0, 0, imu_z) * imu
+        imu_located = imu.moved(Location((0, 0, imu_z)))
         electronics_parts.append(("imu", imu_located))
-        print(f"  MPU6050 IMU: (0, 0, {imu_z})")
+        if verbose:
+            print(f"  MPU6050 IMU: (0, 0, {imu_z})")
 
         # 2S LiPo Battery - in bottom compartment
         battery_z = -3  # Sits in the rail area
         battery = create_lipo_2s()
         # Rotate to fit in the battery bay
-        battery_located = Pos(0, 0, battery_z) * Rot(180, 0, 0) * battery
+        battery_located = battery.moved(Location((0, 0, battery_z), (180, 0, 0)))
         electronics_parts.append(("battery", battery_located))
-        print(f"  2S LiPo Battery: (0, 0, {battery_z})")
+        if verbose:
+            print(f"  2S LiPo Battery: (0, 0, {battery_z})")
 
         # DRV8833 Motor Drivers - need 2 boards for 4 motors (2 channels each)
         # Each board is 18x12mm, fits easily on the body
         driver_z = BODY_THICKNESS + 1  # Slightly raised
 
+        # Both driver boards come from one template build
+        driver_template = create_motor_driver()
+
         # Driver 1: Front-Right and Front-Left motors
-        driver1 = create_motor_driver()
-        driver1_located = Pos(20, 10, driver_z) * driver1
+        driver1_located = driver_template.moved(Location((20, 10, driver_z)))
         electronics_parts.append(("driver1", driver1_located))
-        print(f"  DRV8833 #1: (20, 10, {driver_z}) - Front motors")
+        if verbose:
+            print(f"  DRV8833 #1: (20, 10, {driver_z}) - Front motors")
 
         # Driver 2: Rear-Left and Rear-Right motors
-        driver2 = create_motor_driver()
-        driver2_located = Pos(20, -10, driver_z) * driver2
+        driver2_located = driver_template.moved(Location((20, -10, driver_z)))
         electronics_parts.append(("driver2", driver2_located))
-        print(f"  DRV8833 #2: (20, -10, {driver_z}) - Rear motors")
+        if verbose:
+            print(f"  DRV8833 #2: (20, -10, {driver_z}) - Rear motors")
 
-    print("\n" + "=" * 60)
+    if verbose:
+        print("\n" + "=" * 60)
 
     return body_parts, arm_parts, guard_parts, cover_parts, electronics_parts
 
 
-# Create the assembly
-body_parts, arm_parts, guard_parts, cover_parts, electronics_parts = create_assembly(include_electronics=True)
-
 if __name__ == "__main__":
+    # Deferred: the viewer backend is heavy and only needed when displaying
+    from ocp_vscode import show, set_defaults
+
+    # Build only when run as a script; importing this module for its
+    # factories or constants must not execute OCCT geometry.
+    body_parts, arm_parts, guard_parts, cover_parts, electronics_parts = \
+        create_assembly(include_electronics=True, verbose=True)
+
     set_defaults(axes=True, axes0=True, grid=[True, False, False])
-    # Collect all parts for display
-    all_parts = []
-    all_names = []
-    all_colors = []
-
-    # Frame parts
-    all_parts.extend(body_parts)
-    all_names.append("Body")
-    all_colors.append("#505050")  # Dark gray
-
-    for i, arm in enumerate(arm_parts):
-        all_parts.append(arm)
-        all_names.append(f"Arm {i+1}")
-        all_colors.append("#4682B4")  # Steel blue
-
-    for i, guard in enumerate(guard_parts):
-        all_parts.append(guard)
-        all_names.append(f"Guard {i+1}")
-        all_colors.append("#FF6600")  # Orange
-
-    all_parts.extend(cover_parts)
-    all_names.append("Battery Cover")
-    all_colors.append("#228B22")  # Forest green
-
-    # Electronics with distinct colors
+    # One compound per category: the viewer registers a single scene
+    # group for all four arms (and all four guards) instead of a group
+    # per part, which keeps frame rates up as the assembly grows.
+    all_parts = [
+        Compound(children=body_parts),
+        Compound(children=arm_parts),
+        Compound(children=guard_parts),
+        Compound(children=cover_parts),
+    ]
+    all_names = ["Body", "Arms", "Guards", "Battery Cover"]
+    all_colors = ["#505050", "#4682B4", "#FF6600", "#228B22"]
+
+    # Electronics with distinct colors; the two identical driver boards
+    # collapse into one group.
     electronics_colors = {
         "arduino": "#006400",   # Dark green (PCB)
         "imu": "#4B0082",       # Indigo (purple PCB)
         "battery": "#1E90FF",   # Dodger blue (battery wrap)
-        "driver1": "#8B0000",   # Dark red (PCB)
-        "driver2": "#8B0000",   # Dark red (PCB)
+        "drivers": "#8B0000",   # Dark red (PCB)
     }
 
+    drivers = [part for name, part in electronics_parts
+               if name.startswith("driver")]
+    if drivers:
+        all_parts.append(Compound(children=drivers))
+        all_names.append("Drivers")
+        all_colors.append(electronics_colors["drivers"])
+
     for name, part in electronics_parts:
+        if name.startswith("driver"):
+            continue
         all_parts.append(part)
         all_names.append(name.replace("_", " ").title())
         all_colors.append(electronics_colors.get(name, "#808080"))
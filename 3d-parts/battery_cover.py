@@ -11,8 +11,9 @@ Specifications:
 """
 
 from build123d import *
-from ocp_vscode import show, set_defaults
-import math
+
+import numpy as np
+from numba import float64, njit
 
 # Cover dimensions (updated per plan)
 COVER_LENGTH = 60       # mm
@@ -33,11 +34,12 @@ RAIL_SPACING = 38       # mm between rail centers (matching frame body rail posi
 GRIP_RADIUS = 8         # mm
 
 
-def create_honeycomb_pattern(length, width, cell_size=5, wall=1.5):
-    """Create a honeycomb pattern of hexagonal cutouts."""
-    holes = []
-
-    hex_width = cell_size * math.sqrt(3)
+# Explicit signature: compiled ahead of the first call, cached to disk,
+# and dispatch never has to infer types.
+@njit(float64[:, :](float64, float64, float64, float64), cache=True)
+def _honeycomb_grid(length, width, cell_size, wall):
+    """In-bounds staggered hex centers as an (N, 2) float64 array."""
+    hex_width = cell_size * np.sqrt(3.0)
     x_spacing = hex_width + wall
     y_spacing = (cell_size * 1.5) + wall * 0.866
 
@@ -46,17 +48,29 @@ def create_honeycomb_pattern(length, width, cell_size=5, wall=1.5):
 
     x_offset = -(cols - 1) * x_spacing / 2
     y_offset = -(rows - 1) * y_spacing / 2
+    margin = cell_size * 0.8
 
+    out = np.empty((rows * cols, 2), dtype=np.float64)
+    k = 0
     for row in range(rows):
+        y = y_offset + row * y_spacing
+        if abs(y) >= width / 2 - margin:
+            continue
+        stagger = (row % 2) * (x_spacing / 2)
         for col in range(cols):
-            x = x_offset + col * x_spacing
-            if row % 2 == 1:
-                x += x_spacing / 2
-            y = y_offset + row * y_spacing
+            x = x_offset + col * x_spacing + stagger
+            if abs(x) < length / 2 - margin:
+                out[k, 0] = x
+                out[k, 1] = y
+                k += 1
+    return out[:k]
 
-            if abs(x) < length/2 - cell_size * 0.8 and abs(y) < width/2 - cell_size * 0.8:
-                holes.append((x, y))
 
+def create_honeycomb_pattern(length, width, cell_size=5, wall=1.5):
+    """Create a honeycomb pattern of hexagonal cutouts."""
+    grid = _honeycomb_grid(float(length), float(width),
+                           float(cell_size), float(wall))
+    holes = list(zip(grid[:, 0].tolist(), grid[:, 1].tolist()))
     return holes, cell_size * 0.8
 
 
@@ -74,6 +88,9 @@ def create_battery_cover(verbose=False):
         print("=" * 50)
 
     with BuildPart() as cover:
+        # Top-of-plate sketch plane, shared by every raised feature
+        top_plane = Plane.XY.offset(COVER_THICKNESS)
+
         # Main cover plate
         with BuildSketch() as base:
             RectangleRounded(COVER_LENGTH, COVER_WIDTH, radius=4)
@@ -81,60 +98,61 @@ def create_battery_cover(verbose=False):
 
         # Side walls (perimeter frame)
         wall_thickness = 3
-        with BuildSketch(Plane.XY.offset(COVER_THICKNESS)) as walls:
+        with BuildSketch(top_plane) as walls:
             # Outer boundary
             RectangleRounded(COVER_LENGTH, COVER_WIDTH, radius=4)
             # Inner cutout (hollow)
-            with Locations([(0, 0)]):
-                RectangleRounded(
-                    COVER_LENGTH - wall_thickness * 2,
-                    COVER_WIDTH - wall_thickness * 2,
-                    radius=2,
-                    mode=Mode.SUBTRACT
-                )
+            RectangleRounded(
+                COVER_LENGTH - wall_thickness * 2,
+                COVER_WIDTH - wall_thickness * 2,
+                radius=2,
+                mode=Mode.SUBTRACT
+            )
         extrude(amount=WALL_HEIGHT)
 
-        # Rail guide channels on the sides (slide onto frame rails)
+        # Rail guide channels on the sides (slide onto frame rails);
+        # both slots come out of one sketch and one boolean subtract
         rail_y = RAIL_SPACING / 2
-        for side in [1, -1]:
-            # Create rail channel slot
-            with BuildSketch(Plane.XY.offset(COVER_THICKNESS)) as rail_guide:
-                with Locations([(0, side * rail_y)]):
-                    Rectangle(COVER_LENGTH - 10, RAIL_SLOT_WIDTH)
-            extrude(amount=WALL_HEIGHT, mode=Mode.SUBTRACT)
+        with BuildSketch(top_plane) as rail_guide:
+            with Locations((0, rail_y), (0, -rail_y)):
+                Rectangle(COVER_LENGTH - 10, RAIL_SLOT_WIDTH)
+        extrude(amount=WALL_HEIGHT, mode=Mode.SUBTRACT)
 
         # Honeycomb ventilation pattern on base
         hex_positions, hex_radius = create_honeycomb_pattern(
             COVER_LENGTH - 15, COVER_WIDTH - 15, cell_size=5, wall=1.5
         )
 
-        if hex_positions:
-            with BuildSketch(Plane.XY.offset(COVER_THICKNESS)) as honeycomb:
-                for hx, hy in hex_positions:
-                    # Skip positions in rail areas
-                    if abs(hy) < RAIL_SPACING/2 - 3:
-                        with Locations([(hx, hy)]):
-                            RegularPolygon(radius=hex_radius, side_count=6)
+        # Skip positions in rail areas, then emit every hex from a single
+        # Locations context so the subtract is one boolean op against the
+        # whole pattern instead of per-cell subshapes.
+        valid_positions = [(hx, hy) for hx, hy in hex_positions
+                           if abs(hy) < RAIL_SPACING/2 - 3]
+        if valid_positions:
+            with BuildSketch(top_plane) as honeycomb:
+                with Locations(valid_positions):
+                    RegularPolygon(radius=hex_radius, side_count=6)
             extrude(amount=-COVER_THICKNESS, mode=Mode.SUBTRACT)
 
         # Finger grip cutout at front for easy removal (semicircle)
         with BuildSketch(Plane.XZ.offset(0)) as grip:
-            with Locations([(COVER_LENGTH/2 - 2, COVER_THICKNESS/2)]):
+            with Locations((COVER_LENGTH/2 - 2, COVER_THICKNESS/2)):
                 Circle(GRIP_RADIUS)
         extrude(amount=15, both=True, mode=Mode.SUBTRACT)
 
         # Rear tab for secure fit (prevents cover from sliding out)
-        with BuildSketch(Plane.XY.offset(COVER_THICKNESS)) as rear_tab:
-            with Locations([(-COVER_LENGTH/2 + 5, 0)]):
+        with BuildSketch(top_plane) as rear_tab:
+            with Locations((-COVER_LENGTH/2 + 5, 0)):
                 RectangleRounded(8, 20, radius=2)
         extrude(amount=3)
 
     return cover.part
 
 
-# Create the battery cover
-cover = create_battery_cover()
-
 if __name__ == "__main__":
+    # Deferred: the viewer backend is heavy and only needed when displaying
+    from ocp_vscode import show, set_defaults
+
+    cover = create_battery_cover()
     set_defaults(axes=True, axes0=True, grid=[True, False, False])
     show(cover)
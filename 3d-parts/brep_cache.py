@@ -0,0 +1,92 @@
+"""
+Disk cache for build123d part factories.
+
+Every run of the assembly scripts rebuilds all parts through OCCT from
+scratch. A factory wrapped with @brep_cached exports its result to a
+BREP file keyed by the hash of its defining module's source (plus the
+build123d version), so warm runs load the finished shape from disk
+instead of re-running the CSG pipeline. Editing a part module changes
+its hash and invalidates its cache entries automatically.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".brep_cache")
+
+
+def _source_key(func):
+    """Hash of the function's module source + build123d version."""
+    import build123d
+
+    with open(inspect.getfile(func), 'rb') as f:
+        digest = hashlib.sha1(f.read())
+    digest.update(getattr(build123d, '__version__', '?').encode())
+    return digest.hexdigest()[:12]
+
+
+def brep_cached(func):
+    """Memoize a part factory to a BREP file on disk.
+
+    Keyword arguments are folded into the cache key, so parameterized
+    factories get one entry per argument set. Wrapping an already-wrapped
+    factory is a no-op, so modules can decorate their own factories while
+    consumers keep calling brep_cached defensively.
+    """
+    if getattr(func, '_brep_cached', False):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(**kwargs):
+        # Deferred so that importing a cached part module for its
+        # constants never loads the OCCT bindings
+        from build123d import export_brep, import_brep
+
+        # DRONE_SKIP_VIZ swaps some factories to empty placeholders.
+        # Those build in microseconds and must never share a cache
+        # entry with the real geometry (an empty BREP written under the
+        # normal key would poison flag-less runs), so bypass the cache.
+        if os.environ.get('DRONE_SKIP_VIZ', '0') == '1':
+            return func(**kwargs)
+
+        key = _source_key(func)
+        if kwargs:
+            arg_hash = hashlib.sha1(repr(sorted(kwargs.items())).encode())
+            key = f"{key}-{arg_hash.hexdigest()[:8]}"
+        path = os.path.join(CACHE_DIR, f"{func.__name__}-{key}.brep")
+        if os.path.exists(path):
+            return import_brep(path)
+        part = func(**kwargs)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        export_brep(part, path)
+        return part
+
+    wrapper._brep_cached = True
+    return wrapper
+
+
+def _build_into_cache(module_name, func_name):
+    """Worker: run one factory under the BREP cache in a subprocess."""
+    import importlib
+
+    module = importlib.import_module(module_name)
+    brep_cached(getattr(module, func_name))()
+
+
+def build_parallel(factories, max_workers=None):
+    """Warm the BREP cache for independent factories across processes.
+
+    The part factories have no inter-dependencies, so cold runs farm
+    them out to a process pool (processes, not threads: OCCT holds the
+    GIL through most Python-side construction). Each worker builds its
+    part and writes the BREP cache entry; only file paths cross the
+    process boundary, and subsequent in-process calls load from disk.
+    """
+    jobs = [(f.__module__, f.__name__) for f in factories]
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+        futures = [ex.submit(_build_into_cache, mod, name) for mod, name in jobs]
+        for future in futures:
+            future.result()
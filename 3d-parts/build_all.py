@@ -0,0 +1,34 @@
+"""
+Warm the BREP cache for every part factory across processes.
+
+The part factories are pure and independent, so a cold run farms them
+out to a process pool (see brep_cache.build_parallel); each worker
+builds its part and writes the cache entry, and later runs of
+assembly.py or export_all.py load the finished shapes from disk.
+
+Usage: python build_all.py
+"""
+
+from battery_cover import create_battery_cover
+from brep_cache import build_parallel
+from components import (create_arduino_r4, create_lipo_2s,
+                        create_motor_driver, create_mpu6050)
+from frame_arm import create_arm
+from frame_body import create_body
+from prop_guard import create_prop_guard
+
+FACTORIES = [
+    create_body,
+    create_arm,
+    create_prop_guard,
+    create_battery_cover,
+    create_arduino_r4,
+    create_mpu6050,
+    create_lipo_2s,
+    create_motor_driver,
+]
+
+
+if __name__ == "__main__":
+    build_parallel(FACTORIES)
+    print(f"Warmed BREP cache for {len(FACTORIES)} part factories")
@@ -9,7 +9,6 @@ Dimensions from official datasheet:
 """
 
 from build123d import *
-from ocp_vscode import show, set_defaults
 
 # Arduino R4 WiFi dimensions
 PCB_LENGTH = 68.5       # mm
@@ -37,61 +36,64 @@ def create_arduino_r4():
     """Create a simplified Arduino R4 WiFi model."""
 
     with BuildPart() as arduino:
+        # Top-of-PCB sketch plane, shared by every surface feature
+        top_plane = Plane.XY.offset(PCB_THICKNESS)
+
         # Main PCB (green)
         with BuildSketch() as pcb:
             RectangleRounded(PCB_LENGTH, PCB_WIDTH, radius=2)
         extrude(amount=PCB_THICKNESS)
 
-        # Mounting holes
+        # Mounting holes (all four drilled in one boolean op)
         hole_positions = [
             (HOLE_SPACING_L/2, HOLE_SPACING_W/2),
             (-HOLE_SPACING_L/2, HOLE_SPACING_W/2),
             (-HOLE_SPACING_L/2, -HOLE_SPACING_W/2),
             (HOLE_SPACING_L/2, -HOLE_SPACING_W/2),
         ]
-        for hx, hy in hole_positions:
-            Hole(HOLE_DIA/2, depth=PCB_THICKNESS).locate(
-                Location((hx, hy, PCB_THICKNESS))
-            )
+        with Locations(hole_positions):
+            Hole(HOLE_DIA/2, depth=PCB_THICKNESS)
 
         # USB-C connector (on +X edge)
-        with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as usb:
-            with Locations([(PCB_LENGTH/2 - USB_DEPTH/2, 0)]):
+        with BuildSketch(top_plane) as usb:
+            with Locations((PCB_LENGTH/2 - USB_DEPTH/2, 0)):
                 Rectangle(USB_DEPTH, USB_WIDTH)
         extrude(amount=USB_HEIGHT)
 
         # Barrel jack (on +X edge, offset)
-        with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as barrel:
+        with BuildSketch(top_plane) as barrel:
             with Locations([(PCB_LENGTH/2 - BARREL_JACK_SIZE[1]/2, -PCB_WIDTH/2 + BARREL_JACK_SIZE[0]/2 + 5)]):
                 Rectangle(BARREL_JACK_SIZE[1], BARREL_JACK_SIZE[0])
         extrude(amount=BARREL_JACK_SIZE[2])
 
         # Microcontroller chip (center-ish)
-        with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as mcu:
-            with Locations([(5, 8)]):
+        with BuildSketch(top_plane) as mcu:
+            with Locations((5, 8)):
                 Rectangle(MICROCONTROLLER_SIZE[0], MICROCONTROLLER_SIZE[1])
         extrude(amount=MICROCONTROLLER_SIZE[2])
 
         # WiFi module (ESP32-S3)
-        with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as wifi:
-            with Locations([(-15, -10)]):
+        with BuildSketch(top_plane) as wifi:
+            with Locations((-15, -10)):
                 Rectangle(WIFI_MODULE_SIZE[0], WIFI_MODULE_SIZE[1])
         extrude(amount=WIFI_MODULE_SIZE[2])
 
         # Pin headers (simplified as blocks)
-        # Long headers on sides
+        # Both long side headers from one sketch and one extrude
         header_height = 8.5
-        for side in [1, -1]:
-            with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as header:
-                with Locations([(0, side * (PCB_WIDTH/2 - 3))]):
-                    Rectangle(PCB_LENGTH - 20, 2.5)
-            extrude(amount=header_height)
+        header_y = PCB_WIDTH/2 - 3
+        with BuildSketch(top_plane) as header:
+            with Locations((0, header_y), (0, -header_y)):
+                Rectangle(PCB_LENGTH - 20, 2.5)
+        extrude(amount=header_height)
 
     return arduino.part
 
 
-arduino = create_arduino_r4()
-
 if __name__ == "__main__":
+    # Deferred: the viewer backend is heavy and only needed when displaying
+    from ocp_vscode import show, set_defaults
+
+    arduino = create_arduino_r4()
     set_defaults(axes=True, axes0=True, grid=[True, False, False])
     show(arduino)
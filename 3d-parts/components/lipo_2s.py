@@ -8,7 +8,6 @@ Typical 2S 300-500mAh battery dimensions:
 """
 
 from build123d import *
-from ocp_vscode import show, set_defaults
 
 # Battery dimensions (typical 2S 300-500mAh)
 BATTERY_LENGTH = 50     # mm
@@ -24,29 +23,32 @@ def create_lipo_2s():
     """Create a simplified 2S LiPo battery model."""
 
     with BuildPart() as battery:
+        # Front-face sketch plane, shared by both connectors
+        front_plane = Plane.XZ.offset(-BATTERY_WIDTH/2)
+
         # Main battery body (rounded edges for realism)
         with BuildSketch() as body:
             RectangleRounded(BATTERY_LENGTH, BATTERY_WIDTH, radius=2)
         extrude(amount=BATTERY_HEIGHT)
 
-        # Round the top edges
-        edges_to_fillet = battery.edges().filter_by(Axis.Z).filter_by(
-            lambda e: e.center().Z > BATTERY_HEIGHT - 1
-        )
+        # Round the top edges. group_by does the height selection inside
+        # build123d instead of materializing a center Vector per edge in
+        # a Python lambda.
+        edges_to_fillet = battery.edges().group_by(Axis.Z)[-1]
         if edges_to_fillet:
             try:
                 fillet(edges_to_fillet, radius=1.5)
-            except:
-                pass  # Skip if fillet fails
+            except Exception:
+                pass  # Radius too large for this edge set; leave square
 
         # Power connector (XT30) on one end
-        with BuildSketch(Plane.XZ.offset(-BATTERY_WIDTH/2)) as power:
+        with BuildSketch(front_plane) as power:
             with Locations([(BATTERY_LENGTH/2 - POWER_CONNECTOR_SIZE[0]/2 - 2, BATTERY_HEIGHT/2)]):
                 Rectangle(POWER_CONNECTOR_SIZE[0], POWER_CONNECTOR_SIZE[2])
         extrude(amount=-POWER_CONNECTOR_SIZE[1])
 
         # Balance connector (JST-XH) next to power
-        with BuildSketch(Plane.XZ.offset(-BATTERY_WIDTH/2)) as balance:
+        with BuildSketch(front_plane) as balance:
             with Locations([(BATTERY_LENGTH/2 - POWER_CONNECTOR_SIZE[0] - BALANCE_CONNECTOR_SIZE[0]/2 - 4,
                             BATTERY_HEIGHT/2)]):
                 Rectangle(BALANCE_CONNECTOR_SIZE[0], BALANCE_CONNECTOR_SIZE[2])
@@ -55,8 +57,10 @@ def create_lipo_2s():
     return battery.part
 
 
-lipo = create_lipo_2s()
-
 if __name__ == "__main__":
+    # Deferred: the viewer backend is heavy and only needed when displaying
+    from ocp_vscode import show, set_defaults
+
+    lipo = create_lipo_2s()
     set_defaults(axes=True, axes0=True, grid=[True, False, False])
     show(lipo)
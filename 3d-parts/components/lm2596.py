@@ -13,8 +13,9 @@ Enclosure features:
 - 4-slot ventilation pattern on ±Y long walls
 """
 
+import functools
+
 from build123d import *
-from ocp_vscode import show, set_defaults
 
 # =============================================================================
 # PCB REFERENCE DIMENSIONS (LM2596 module)
@@ -54,6 +55,108 @@ VENT_HEIGHT = 12.0      # mm per slot
 VENT_GAP = 2.0          # mm between slots
 VENT_COUNT = 4          # slots per wall face
 
+# Lid
+LID_THICKNESS = WALL    # 2.0 mm
+RIM_TOLERANCE = 0.25    # mm clearance per side for friction fit
+RIM_HEIGHT = 3.0        # mm - depth of rim that goes into box
+TERMINAL_GAP = 12.0     # mm - gap width at ±X walls for wire clearance
+
+# =============================================================================
+# DERIVED GEOMETRY
+# =============================================================================
+# Everything below folds out of the dimensions above, so it is computed
+# once at import time instead of on every create_* call.
+
+# Rim dimensions (sits inside box walls with tolerance)
+RIM_LENGTH = BOX_L - 2 * WALL - 2 * RIM_TOLERANCE
+RIM_WIDTH = BOX_W - 2 * WALL - 2 * RIM_TOLERANCE
+
+# Usable interior area (inside walls)
+INNER_L = BOX_L - 2 * WALL
+INNER_W = BOX_W - 2 * WALL
+
+# Vent slot X-offsets (centered pattern for 4 slots)
+_SLOT_PITCH = VENT_WIDTH + VENT_GAP
+SLOT_OFFSETS = tuple(
+    (i - (VENT_COUNT - 1) / 2) * _SLOT_PITCH
+    for i in range(VENT_COUNT)
+)
+
+# Corner boss centers
+_BOSS_CX = BOX_L / 2 - WALL - BOSS_CLEARANCE - STANDOFF_DIA / 2
+_BOSS_CY = BOX_W / 2 - WALL - BOSS_CLEARANCE - STANDOFF_DIA / 2
+BOSS_POSITIONS = (
+    ( _BOSS_CX,  _BOSS_CY),
+    (-_BOSS_CX,  _BOSS_CY),
+    (-_BOSS_CX, -_BOSS_CY),
+    ( _BOSS_CX, -_BOSS_CY),
+)
+
+# Lid cutout positions (relative to lid dimensions)
+DISPLAY_X = 0
+DISPLAY_Y = INNER_W / 4                     # toward +Y (top)
+LED_Y = INNER_W / 2 - LED_DIA - 1           # near +Y edge
+LED_IN_X = -DISPLAY_LENGTH / 4              # left of center
+LED_OUT_X = DISPLAY_LENGTH / 4              # right of center
+CABLE_X = INNER_L / 2 - CABLE_HOLE_DIA / 2 - 3  # 3mm inset from +X inner wall
+CABLE_Y1 = CABLE_HOLE_SPACING / 2           # two holes, 5mm apart
+CABLE_Y2 = -CABLE_HOLE_SPACING / 2
+POT_X = -INNER_L / 6 + STANDOFF_DIA - 2     # below display, left of center
+POT_Y = -INNER_W / 4 - STANDOFF_DIA
+RESET_BTN_X = -(INNER_L / 2 - STANDOFF_DIA * 2)
+RESET_BTN_Y = (DISPLAY_Y + DISPLAY_WIDTH / 2) - RESET_BTN_SIZE / 2  # align +Y edges
+CUT_DEPTH = LID_THICKNESS + RIM_HEIGHT + 1  # full depth for through-holes
+
+
+@functools.lru_cache(maxsize=None)
+def _boss_sketch():
+    """Corner-boss profile (four squares with M3 holes), built once."""
+    with BuildSketch() as profile:
+        with Locations(BOSS_POSITIONS):
+            Rectangle(STANDOFF_DIA, STANDOFF_DIA)
+            Circle(PCB_HOLE_DIA / 2, mode=Mode.SUBTRACT)
+    return profile.sketch
+
+
+@functools.lru_cache(maxsize=None)
+def _rim_sketch():
+    """Friction-fit rim profile with terminal gaps, built once."""
+    x_rim_height = RIM_WIDTH - TERMINAL_GAP  # usable Y span
+    with BuildSketch() as profile:
+        # ±Y long walls (continuous)
+        with Locations((0, RIM_WIDTH / 2), (0, -RIM_WIDTH / 2)):
+            Rectangle(RIM_LENGTH, WALL)
+        # ±X short walls (split with 12mm center gap for terminal wires)
+        with Locations((RIM_LENGTH / 2, 0), (-RIM_LENGTH / 2, 0)):
+            Rectangle(WALL, x_rim_height)
+    return profile.sketch
+
+
+def _fast_cut(base, cutters):
+    """Subtract a cutter compound using OCCT's fast-path cut options.
+
+    build123d's Mode.SUBTRACT runs BRepAlgoAPI_Cut with default
+    settings. Driving the algorithm directly lets us turn on parallel
+    face processing and oriented-bounding-box interference tests, which
+    skip most of the pairwise intersection work for the axis-aligned
+    prisms these parts are made of.
+    """
+    from OCP.BRepAlgoAPI import BRepAlgoAPI_Cut
+    from OCP.TopTools import TopTools_ListOfShape
+
+    args = TopTools_ListOfShape()
+    args.Append(base.wrapped)
+    tools = TopTools_ListOfShape()
+    tools.Append(cutters.wrapped)
+
+    op = BRepAlgoAPI_Cut()
+    op.SetArguments(args)
+    op.SetTools(tools)
+    op.SetRunParallel(True)
+    op.SetUseOBB(True)
+    op.SetNonDestructive(True)
+    op.Build()
+    return Part(op.Shape())
 
 
 def create_enclosure():
@@ -69,12 +172,9 @@ def create_enclosure():
         Z: 0 = base,  BOX_H = top rim
     """
 
-    # Vent slot X-offsets (centered pattern for 4 slots)
-    slot_pitch = VENT_WIDTH + VENT_GAP
-    slot_offsets = [
-        (i - (VENT_COUNT - 1) / 2) * slot_pitch
-        for i in range(VENT_COUNT)
-    ]
+    # Cached profile (fetched outside the builder so a cache miss does
+    # not build the sketch inside this BuildPart context)
+    boss_profile = _boss_sketch()
 
     with BuildPart() as enclosure:
         # =================================================================
@@ -94,41 +194,30 @@ def create_enclosure():
         # =================================================================
         # Step 3: Square corner bosses with centered M3 holes
         # =================================================================
-        boss_cx = BOX_L / 2 - WALL - BOSS_CLEARANCE - STANDOFF_DIA / 2
-        boss_cy = BOX_W / 2 - WALL - BOSS_CLEARANCE - STANDOFF_DIA / 2
-        boss_positions = [
-            ( boss_cx,  boss_cy),
-            (-boss_cx,  boss_cy),
-            (-boss_cx, -boss_cy),
-            ( boss_cx, -boss_cy),
-        ]
         with BuildSketch(Plane.XY.offset(WALL)):
-            for bx, by in boss_positions:
-                with Locations([(bx, by)]):
-                    Rectangle(STANDOFF_DIA, STANDOFF_DIA)
-                    Circle(PCB_HOLE_DIA / 2, mode=Mode.SUBTRACT)
+            add(boss_profile)
         extrude(amount=STANDOFF_HEIGHT)
 
-        # =================================================================
-        # Step 4: Terminal cutouts — ±X short walls
-        # =================================================================
-        term_z = WALL + TERM_CUT_HEIGHT / 2
-        for x_sign in [1, -1]:
-            with Locations([(x_sign * BOX_L / 2, 0, term_z)]):
-                Box(WALL * 3, TERM_CUT_WIDTH, TERM_CUT_HEIGHT,
-                    mode=Mode.SUBTRACT)
-
-        # =================================================================
-        # Step 5: Ventilation slots — ±Y long side walls
-        # =================================================================
-        slot_z = BOX_H / 2
-        for y_sign in [1, -1]:
-            for x_off in slot_offsets:
-                with Locations([(x_off, y_sign * BOX_W / 2, slot_z)]):
-                    Box(VENT_WIDTH, WALL * 3, VENT_HEIGHT,
-                        mode=Mode.SUBTRACT)
-
-    return enclosure.part
+    # =====================================================================
+    # Steps 4+5: Terminal cutouts (±X walls) and vent slots (±Y walls)
+    # =====================================================================
+    # All ten wall cutters are collected into one compound so the shell
+    # pays a single boolean cut (through the OCCT fast path) instead of
+    # one BVH traversal per cutter.
+    term_z = WALL + TERM_CUT_HEIGHT / 2
+    slot_z = BOX_H / 2
+    cutters = [
+        Box(WALL * 3, TERM_CUT_WIDTH, TERM_CUT_HEIGHT).moved(
+            Location((x_sign * BOX_L / 2, 0, term_z)))
+        for x_sign in [1, -1]
+    ]
+    cutters += [
+        Box(VENT_WIDTH, WALL * 3, VENT_HEIGHT).moved(
+            Location((x_off, y_sign * BOX_W / 2, slot_z)))
+        for y_sign in [1, -1]
+        for x_off in SLOT_OFFSETS
+    ]
+    return _fast_cut(enclosure.part, Compound(children=cutters))
 
 
 def create_lid():
@@ -139,45 +228,9 @@ def create_lid():
     Rim: 0.25mm tolerance from inner walls, 12mm gaps at ±X for wires.
     """
 
-    LID_THICKNESS = WALL  # 2.0 mm
-    RIM_TOLERANCE = 0.25  # mm clearance per side for friction fit
-    RIM_HEIGHT = 3.0      # mm - depth of rim that goes into box
-    TERMINAL_GAP = 12.0   # mm - gap width at ±X walls for wire clearance
-
-    # Rim dimensions (sits inside box walls with tolerance)
-    RIM_LENGTH = BOX_L - 2 * WALL - 2 * RIM_TOLERANCE
-    RIM_WIDTH = BOX_W - 2 * WALL - 2 * RIM_TOLERANCE
-
-    # --- Relative position calculations ---
-    # Usable interior area (inside walls)
-    inner_l = BOX_L - 2 * WALL   # 71mm
-    inner_w = BOX_W - 2 * WALL   # 44mm
-
-    # Display: centered X, upper quarter Y
-    display_x = 0
-    display_y = inner_w / 4                    # ~9.5mm toward +Y (top)
-
-    # LEDs: centered X (flanking display), near top edge
-    led_y = inner_w / 2 - LED_DIA - 1         # ~16mm, near +Y edge
-    led_in_x = -DISPLAY_LENGTH / 4             # -5.5mm (left of center)
-    led_out_x = DISPLAY_LENGTH / 4             # +5.5mm (right of center)
-
-    # Cable holes: at +X wall
-    cable_x = inner_l / 2 - CABLE_HOLE_DIA / 2 - 3  # 3mm inset from +X inner wall
-    cable_y1 = CABLE_HOLE_SPACING / 2              # two holes, 5mm apart
-    cable_y2 = -CABLE_HOLE_SPACING / 2
-
-    # Pot: below display, left of center
-    pot_x = -inner_l / 6 + STANDOFF_DIA - 2     # ~-8.8mm
-    pot_y = -inner_w / 4 - STANDOFF_DIA        # ~-16mm
-
-    # Reset button: +Y edge aligned with display top edge
-    reset_btn_x = -(inner_l / 2 - STANDOFF_DIA * 2)
-    display_top_y = display_y + DISPLAY_WIDTH / 2      # +Y edge of display
-    reset_btn_y = display_top_y - RESET_BTN_SIZE / 2   # align +Y edges
-
-    # Full depth for through-holes
-    cut_depth = LID_THICKNESS + RIM_HEIGHT + 1
+    # Cached profile (see create_enclosure); dimensions and cutout
+    # positions are module-level constants computed at import
+    rim_profile = _rim_sketch()
 
     with BuildPart() as lid:
         # =================================================================
@@ -190,68 +243,47 @@ def create_lid():
         # Step 2: Friction-fit rim with 12mm terminal gaps at ±X walls
         # =================================================================
         with BuildSketch(Plane.XY.offset(-RIM_HEIGHT)):
-            # ±Y long walls (continuous)
-            with Locations([(0, RIM_WIDTH / 2)]):
-                Rectangle(RIM_LENGTH, WALL)
-            with Locations([(0, -RIM_WIDTH / 2)]):
-                Rectangle(RIM_LENGTH, WALL)
-            # ±X short walls (split with 12mm center gap for terminal wires)
-            x_rim_height = RIM_WIDTH - TERMINAL_GAP  # usable Y span
-            with Locations([(RIM_LENGTH / 2, 0)]):
-                Rectangle(WALL, x_rim_height)
-            with Locations([(-RIM_LENGTH / 2, 0)]):
-                Rectangle(WALL, x_rim_height)
+            add(rim_profile)
         extrude(amount=RIM_HEIGHT)
 
-        # =================================================================
-        # Step 3: Display window — centered, upper area
-        # =================================================================
-        with Locations([(display_x, display_y, 0)]):
-            Box(DISPLAY_LENGTH, DISPLAY_WIDTH, cut_depth,
-                align=(Align.CENTER, Align.CENTER, Align.CENTER),
-                mode=Mode.SUBTRACT)
-
-        # =================================================================
-        # Step 4: LED indicator holes — above display, near top edge
-        # =================================================================
-        with BuildSketch(Plane.XY.offset(LID_THICKNESS)):
-            for lx in [led_in_x, led_out_x]:
-                with Locations([(lx, led_y)]):
-                    Circle(LED_DIA / 2)
-        extrude(amount=-cut_depth, mode=Mode.SUBTRACT)
-
-        # =================================================================
-        # Step 5: Cable holes — +X edge
-        # =================================================================
-        with BuildSketch(Plane.XY.offset(LID_THICKNESS)):
-            for cy in [cable_y1, cable_y2]:
-                with Locations([(cable_x, cy)]):
-                    Circle(CABLE_HOLE_DIA / 2)
-        extrude(amount=-cut_depth, mode=Mode.SUBTRACT)
-
-        # =================================================================
-        # Step 6: Potentiometer hole — below display, left of center
-        # =================================================================
-        with BuildSketch(Plane.XY.offset(LID_THICKNESS)):
-            with Locations([(pot_x, pot_y)]):
-                Circle(POT_LID_DIA / 2)
-        extrude(amount=-cut_depth, mode=Mode.SUBTRACT)
-
-        # =================================================================
-        # Step 7: Reset button hole (square) — -X side, +Y aligned with display
-        # =================================================================
-        with Locations([(reset_btn_x, reset_btn_y, 0)]):
-            Box(RESET_BTN_SIZE, RESET_BTN_SIZE, cut_depth,
-                align=(Align.CENTER, Align.CENTER, Align.CENTER),
-                mode=Mode.SUBTRACT)
+    # =====================================================================
+    # Steps 3-7: Display window, LED/cable/pot holes, reset button
+    # =====================================================================
+    # Every opening goes into one cutter compound and comes out of the
+    # plate with a single fast-path boolean cut (same rationale as the
+    # enclosure wall cutters).
+    hole_z = LID_THICKNESS - CUT_DEPTH / 2  # round holes cut downward
+    cutters = [
+        Box(DISPLAY_LENGTH, DISPLAY_WIDTH, CUT_DEPTH).moved(
+            Location((DISPLAY_X, DISPLAY_Y, 0))),
+        Box(RESET_BTN_SIZE, RESET_BTN_SIZE, CUT_DEPTH).moved(
+            Location((RESET_BTN_X, RESET_BTN_Y, 0))),
+        Cylinder(POT_LID_DIA / 2, CUT_DEPTH).moved(
+            Location((POT_X, POT_Y, hole_z))),
+    ]
+    cutters += [
+        Cylinder(LED_DIA / 2, CUT_DEPTH).moved(
+            Location((lx, LED_Y, hole_z)))
+        for lx in [LED_IN_X, LED_OUT_X]
+    ]
+    cutters += [
+        Cylinder(CABLE_HOLE_DIA / 2, CUT_DEPTH).moved(
+            Location((CABLE_X, cy, hole_z)))
+        for cy in [CABLE_Y1, CABLE_Y2]
+    ]
+    return _fast_cut(lid.part, Compound(children=cutters))
 
-    return lid.part
 
+def create_assembly(enclosure=None, lid=None):
+    """Create assembly showing enclosure + lid positioned correctly.
 
-def create_assembly():
-    """Create assembly showing enclosure + lid positioned correctly."""
-    enclosure = create_enclosure()
-    lid = create_lid()
+    Callers that already built the parts (e.g. to export them
+    individually) can pass them in instead of rebuilding.
+    """
+    if enclosure is None:
+        enclosure = create_enclosure()
+    if lid is None:
+        lid = create_lid()
 
     # Lid sits at top of enclosure
     lid_z = BOX_H  # 15mm
@@ -263,6 +295,9 @@ def create_assembly():
 
 
 if __name__ == "__main__":
+    # Deferred: the viewer backend is heavy and only needed when displaying
+    from ocp_vscode import show, set_defaults
+
     set_defaults(axes=True, axes0=True, grid=[True, False, False])
     enclosure = create_enclosure()
     lid = create_lid()
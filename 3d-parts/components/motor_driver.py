@@ -13,8 +13,13 @@ Specifications:
 - Weight: ~1g
 """
 
+import os
+
 from build123d import *
-from ocp_vscode import show, set_defaults
+
+# Exports that only need the printable parts can set DRONE_SKIP_VIZ=1
+# to skip building this visualization stub's geometry entirely.
+SKIP_VISUALIZATION = os.environ.get('DRONE_SKIP_VIZ', '0') == '1'
 
 # DRV8833 module dimensions
 PCB_LENGTH = 18         # mm
@@ -33,6 +38,14 @@ HOLE_DIA = 2.0          # mm (M2 or smaller)
 def create_motor_driver():
     """Create a simplified DRV8833 motor driver module model."""
 
+    if SKIP_VISUALIZATION:
+        return Part()  # placeholder; placement code still works
+
+    # Component stubs are plain axis-aligned blocks, so Box builds their
+    # topology directly — no sketch curve evaluation or prism sweep.
+    # Only the PCB outline keeps the sketch path for its rounded corners.
+    block_align = (Align.CENTER, Align.CENTER, Align.MIN)
+
     with BuildPart() as driver:
         # Main PCB
         with BuildSketch() as pcb:
@@ -44,37 +57,32 @@ def create_motor_driver():
             (HOLE_SPACING_L/2, HOLE_SPACING_W/2),
             (-HOLE_SPACING_L/2, -HOLE_SPACING_W/2),
         ]
-        for hx, hy in hole_positions:
-            Hole(HOLE_DIA/2, depth=PCB_THICKNESS).locate(
-                Location((hx, hy, PCB_THICKNESS))
-            )
+        # Both holes drilled in one boolean op
+        with Locations([(hx, hy, PCB_THICKNESS)
+                        for hx, hy in hole_positions]):
+            Hole(HOLE_DIA/2, depth=PCB_THICKNESS)
 
         # DRV8833 IC (center, small QFN package)
-        with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as ic:
-            with Locations([(0, 0)]):
-                Rectangle(4, 4)
-        extrude(amount=1)
+        with Locations((0, 0, PCB_THICKNESS)):
+            Box(4, 4, 1, align=block_align)
 
         # Decoupling capacitors (2x small)
-        cap_positions = [(6, 0), (-6, 0)]
-        for cx, cy in cap_positions:
-            with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as cap:
-                with Locations([(cx, cy)]):
-                    Rectangle(2, 1)
-            extrude(amount=0.8)
+        with Locations((6, 0, PCB_THICKNESS), (-6, 0, PCB_THICKNESS)):
+            Box(2, 1, 0.8, align=block_align)
 
         # Pin headers (6-pin on each side)
-        for side in [-1, 1]:
-            with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as header:
-                with Locations([(0, side * (PCB_WIDTH/2 - 1.5))]):
-                    Rectangle(PCB_LENGTH - 4, 2)
-            extrude(amount=COMPONENT_HEIGHT)
+        header_y = PCB_WIDTH/2 - 1.5
+        with Locations((0, header_y, PCB_THICKNESS),
+                       (0, -header_y, PCB_THICKNESS)):
+            Box(PCB_LENGTH - 4, 2, COMPONENT_HEIGHT, align=block_align)
 
     return driver.part
 
 
-motor_driver = create_motor_driver()
-
 if __name__ == "__main__":
+    # Deferred: the viewer backend is heavy and only needed when displaying
+    from ocp_vscode import show, set_defaults
+
+    motor_driver = create_motor_driver()
     set_defaults(axes=True, axes0=True, grid=[True, False, False])
     show(motor_driver)
@@ -7,8 +7,13 @@ Dimensions:
 - Total height: ~4mm
 """
 
+import os
+
 from build123d import *
-from ocp_vscode import show, set_defaults
+
+# Exports that only need the printable parts can set DRONE_SKIP_VIZ=1
+# to skip building this visualization stub's geometry entirely.
+SKIP_VISUALIZATION = os.environ.get('DRONE_SKIP_VIZ', '0') == '1'
 
 # GY-521 module dimensions
 PCB_LENGTH = 21         # mm
@@ -30,6 +35,9 @@ HEADER_PITCH = 2.54     # mm
 def create_mpu6050():
     """Create a simplified MPU6050/GY-521 module model."""
 
+    if SKIP_VISUALIZATION:
+        return Part()  # placeholder; placement code still works
+
     with BuildPart() as imu:
         # Main PCB (blue/purple typical)
         with BuildSketch() as pcb:
@@ -43,35 +51,36 @@ def create_mpu6050():
             (-HOLE_SPACING/2, -HOLE_SPACING/2),
             (HOLE_SPACING/2, -HOLE_SPACING/2),
         ]
-        for hx, hy in hole_positions:
-            Hole(HOLE_DIA/2, depth=PCB_THICKNESS).locate(
-                Location((hx, hy, PCB_THICKNESS))
-            )
+        # All four holes drilled in one boolean op
+        with Locations([(hx, hy, PCB_THICKNESS)
+                        for hx, hy in hole_positions]):
+            Hole(HOLE_DIA/2, depth=PCB_THICKNESS)
+
+        # Component stubs are plain axis-aligned blocks, so Box builds
+        # their topology directly — no sketch curve evaluation or prism
+        # sweep. Only the PCB outline needs its rounded-corner sketch.
+        block_align = (Align.CENTER, Align.CENTER, Align.MIN)
 
         # MPU6050 chip (center of board)
-        with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as chip:
-            with Locations([(0, 1)]):
-                Rectangle(CHIP_SIZE[0], CHIP_SIZE[1])
-        extrude(amount=CHIP_SIZE[2])
+        with Locations((0, 1, PCB_THICKNESS)):
+            Box(CHIP_SIZE[0], CHIP_SIZE[1], CHIP_SIZE[2], align=block_align)
 
         # Voltage regulator (small SOT-23)
-        with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as vreg:
-            with Locations([(-6, 1)]):
-                Rectangle(3, 1.5)
-        extrude(amount=1)
+        with Locations((-6, 1, PCB_THICKNESS)):
+            Box(3, 1.5, 1, align=block_align)
 
         # Pin header (8 pins on one edge)
         header_length = HEADER_PINS * HEADER_PITCH
-        with BuildSketch(Plane.XY.offset(PCB_THICKNESS)) as header:
-            with Locations([(0, -PCB_WIDTH/2 + 2)]):
-                Rectangle(header_length, 2.5)
-        extrude(amount=2.5)
+        with Locations((0, -PCB_WIDTH/2 + 2, PCB_THICKNESS)):
+            Box(header_length, 2.5, 2.5, align=block_align)
 
     return imu.part
 
 
-mpu6050 = create_mpu6050()
-
 if __name__ == "__main__":
+    # Deferred: the viewer backend is heavy and only needed when displaying
+    from ocp_vscode import show, set_defaults
+
+    mpu6050 = create_mpu6050()
     set_defaults(axes=True, axes0=True, grid=[True, False, False])
     show(mpu6050)
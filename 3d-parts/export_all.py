@@ -9,322 +9,339 @@ Generates:
 Usage: python 3d-parts/export_all.py
 """
 
+import hashlib
+import os
+import shutil
+import subprocess
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Add the 3d-parts directory to path for imports
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
-from build123d import *
-
-# Import part creation functions
-from frame_body import create_body
-from frame_arm import create_arm
-from prop_guard import create_prop_guard
-from battery_cover import create_battery_cover
-from assembly import create_assembly
-from components.lm2596 import (
-    create_enclosure as create_lm2596_enclosure,
-    create_lid as create_lm2596_lid,
-    create_assembly as create_lm2596_assembly,
-)
+# build123d and the part modules are imported lazily inside the
+# functions that need them: importing this module (or starting a worker
+# process) then costs nothing OCCT-side, and a run that only wants a
+# subset of outputs never pays for the writers it skips.
 
 # Export directory - use project root /build folder
 PROJECT_ROOT = script_dir.parent
 EXPORT_DIR = PROJECT_ROOT / "build"
 EXPORT_DIR.mkdir(exist_ok=True)
 
+# Per-file log lines are buffered and written once per export phase:
+# a print per exported file means a flush per file when stdout is piped.
+_log_lines = []
+
+
+def _log(line):
+    """Queue a log line for the next _flush_log call."""
+    _log_lines.append(line)
+
+
+def _flush_log():
+    """Write all queued log lines in a single stdout call."""
+    if _log_lines:
+        sys.stdout.write("\n".join(_log_lines) + "\n")
+        sys.stdout.flush()
+        _log_lines.clear()
+
 
 def export_stl_file(part, filename):
     """Export a part to STL format."""
+    from build123d import export_stl
+
     filepath = EXPORT_DIR / filename
     export_stl(part, str(filepath))
-    print(f"  Exported: {filepath}")
+    _log(f"  Exported: {filepath}")
 
 
 def export_step_file(part, filename):
     """Export a part to STEP format."""
+    from build123d import export_step
+
     filepath = EXPORT_DIR / filename
     export_step(part, str(filepath))
-    print(f"  Exported: {filepath}")
+    _log(f"  Exported: {filepath}")
 
 
 def export_gltf_file(part, filename):
     """Export a part to GLTF format."""
+    from build123d import export_gltf, export_stl
+
     filepath = EXPORT_DIR / filename
     try:
         export_gltf(part, str(filepath))
-        print(f"  Exported: {filepath}")
+        _log(f"  Exported: {filepath}")
     except Exception as e:
-        print(f"  Warning: GLTF export failed for {filename}: {e}")
-        print(f"  Trying alternative export method...")
+        _log(f"  Warning: GLTF export failed for {filename}: {e}")
+        _log(f"  Trying alternative export method...")
         # Try exporting as STL and note for manual conversion
         stl_path = filepath.with_suffix('.stl')
         export_stl(part, str(stl_path))
-        print(f"  Exported STL instead: {stl_path}")
+        _log(f"  Exported STL instead: {stl_path}")
+
+
+def _pretessellate(part):
+    """Attach one triangulation to the shape before writing mesh formats.
+
+    export_stl and export_gltf each run BRepMesh_IncrementalMesh with the
+    same default deflections, meshing every face twice. Meshing once up
+    front caches the triangulation on the faces, so both writers find it
+    and skip their own pass.
+
+    The trailing True turns on OCCT's parallel face meshing: every face
+    is an independent meshing problem, so the tessellator fans them out
+    across its internal thread pool.
+    """
+    from OCP.BRepMesh import BRepMesh_IncrementalMesh
+
+    BRepMesh_IncrementalMesh(part.wrapped, 0.1, False, 0.5, True)
+
+
+def _write_stl_binary(part, filepath, tol=0.1):
+    """Write a binary STL straight from the shape's triangulation.
+
+    build123d's export_stl iterates faces and triangles in Python,
+    appending records one at a time. Pulling the tessellation into NumPy
+    arrays lets the facet normals come from one vectorized cross
+    product and the 50-byte triangle records go to disk with a single
+    tobytes() call.
+    """
+    import numpy as np
+
+    vertices, triangles = part.tessellate(tol)
+    verts = np.array([(v.X, v.Y, v.Z) for v in vertices], dtype=np.float32)
+    tris = np.asarray(triangles, dtype=np.int64)
+
+    v0, v1, v2 = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    normals = np.cross(v1 - v0, v2 - v0)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    # Packed 50-byte STL facet records
+    records = np.zeros(len(tris), dtype=[
+        ('normal', '<f4', 3), ('v0', '<f4', 3),
+        ('v1', '<f4', 3), ('v2', '<f4', 3), ('attr', '<u2'),
+    ])
+    records['normal'] = normals
+    records['v0'] = v0
+    records['v1'] = v1
+    records['v2'] = v2
+
+    with open(filepath, 'wb') as f:
+        f.write(b'\0' * 80)
+        f.write(np.uint32(len(tris)).tobytes())
+        f.write(records.tobytes())
+
+
+def _mark_current(filepath, digest):
+    """Record the part digest an output file was written from."""
+    if digest:
+        (EXPORT_DIR / (filepath.name + ".sha256")).write_text(digest)
+
+
+def _outputs_current(digest, filenames):
+    """True when every output exists and was written from this digest."""
+    for filename in filenames:
+        sidecar = EXPORT_DIR / (filename + ".sha256")
+        if not ((EXPORT_DIR / filename).exists() and sidecar.exists()
+                and sidecar.read_text() == digest):
+            return False
+    return True
+
+
+def _write_stl_and_gltf(part, name, digest=None):
+    """Write a part's STL and GLB from one shared triangulation.
+
+    The part is meshed exactly once; the binary STL comes straight from
+    the cached triangulation and the GLTF writer finds the same
+    triangulation attached to the faces. EXPORT_GLTF=0 skips the GLB.
+    Returns the log lines describing what was written.
+    """
+    from build123d import export_gltf
+
+    _pretessellate(part)
+    stl_path = EXPORT_DIR / f"{name}.stl"
+    _write_stl_binary(part, stl_path)
+    _mark_current(stl_path, digest)
+    if os.environ.get('EXPORT_GLTF', '1') != '1':
+        return f"Exported: {stl_path}"
+    glb_path = EXPORT_DIR / f"{name}.glb"
+    try:
+        export_gltf(part, str(glb_path))
+    except Exception as e:
+        return (f"Exported: {stl_path}\n"
+                f"  Warning: GLTF export failed for {glb_path.name}: {e}")
+    note = _compress_glb(glb_path)
+    _mark_current(glb_path, digest)
+    return f"Exported: {stl_path}\n  Exported: {glb_path}{note}"
+
+
+def _compress_glb(glb_path):
+    """Recompress a GLB in place with gltfpack when it is installed.
+
+    OCCT writes uncompressed vertex buffers; meshoptimizer's gltfpack
+    (-cc) shrinks the viewer downloads by roughly an order of magnitude.
+    The tool is optional — without it the plain GLB is kept as-is.
+    Returns a short log suffix describing what happened.
+    """
+    gltfpack = shutil.which('gltfpack')
+    if not gltfpack:
+        return ""
+    result = subprocess.run(
+        [gltfpack, '-i', str(glb_path), '-o', str(glb_path), '-cc'],
+        capture_output=True, text=True)
+    if result.returncode != 0:
+        return f" (gltfpack failed: {result.stderr.strip()[:80]})"
+    return " (compressed)"
+
+
+def _export_job(brep_path, fmt, name, digest=None):
+    """Worker: rebuild one shape from its BREP file and write its outputs.
+
+    Runs in a subprocess; returns the log lines for the parent to print.
+    A "mesh" job covers both STL and GLB via _write_stl_and_gltf.
+    """
+    from build123d import export_step, import_brep
+
+    part = import_brep(brep_path)
+    if fmt == "mesh":
+        return _write_stl_and_gltf(part, name, digest)
+    filepath = EXPORT_DIR / name
+    export_step(part, str(filepath))
+    _mark_current(filepath, digest)
+    return f"Exported: {filepath}"
+
+
+def _export_step_batch(brep_paths, step_jobs, digests=None):
+    """Worker: write every STEP file through one OCCT writer session.
+
+    build123d's export_step opens a fresh STEPControl_Writer per call,
+    re-initializing the schema and AP214 header each time. One writer is
+    reused here for the whole batch; the session model is reset between
+    files so each output still carries a single root.
+    """
+    from build123d import import_brep
+    from OCP.IFSelect import IFSelect_RetDone
+    from OCP.STEPControl import STEPControl_StepModelType, STEPControl_Writer
+
+    writer = STEPControl_Writer()
+    lines = []
+    for name, filename in step_jobs:
+        part = import_brep(brep_paths[name])
+        writer.WS().NewModel()
+        writer.Transfer(part.wrapped,
+                        STEPControl_StepModelType.STEPControl_AsIs)
+        filepath = EXPORT_DIR / filename
+        if writer.Write(str(filepath)) != IFSelect_RetDone:
+            raise RuntimeError(f"STEP write failed for {filename}")
+        if digests:
+            _mark_current(filepath, digests.get(name))
+        lines.append(f"Exported: {filepath}")
+    return "\n  ".join(lines)
+
+
+def run_export_jobs(parts, jobs):
+    """Run independent export jobs across a process pool.
+
+    The writers are CPU-bound OCCT calls with no shared state, so they
+    parallelize cleanly. Part objects do not pickle, so each part is
+    serialized once to a temporary BREP file and workers rebuild their
+    shape from disk.
+
+    Each part's BREP bytes double as its content hash: outputs whose
+    .sha256 sidecar matches the current hash are skipped, so an
+    incremental re-run only rewrites the files whose geometry changed.
+
+    Args:
+        parts: dict of name -> built part
+        jobs: list of (part name, format, output filename)
+    """
+    from build123d import export_brep
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        brep_paths = {}
+        digests = {}
+        for name, part in parts.items():
+            brep_paths[name] = os.path.join(tmpdir, f"{name}.brep")
+            export_brep(part, brep_paths[name])
+            with open(brep_paths[name], 'rb') as f:
+                digests[name] = hashlib.sha256(f.read()).hexdigest()
+
+        def current(name, fmt, filename):
+            if fmt == "mesh":
+                outputs = [f"{name}.stl"]
+                if os.environ.get('EXPORT_GLTF', '1') == '1':
+                    outputs.append(f"{name}.glb")
+            else:
+                outputs = [filename]
+            return _outputs_current(digests[name], outputs)
+
+        pending = []
+        for name, fmt, filename in jobs:
+            if current(name, fmt, filename):
+                _log(f"  Cached: {filename} (unchanged)")
+            else:
+                pending.append((name, fmt, filename))
+
+        # STEP files share one writer session (see _export_step_batch);
+        # everything else is an independent per-file job.
+        step_jobs = [(name, filename)
+                     for name, fmt, filename in pending if fmt == "step"]
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = [
+                pool.submit(_export_job, brep_paths[name], fmt, filename,
+                            digests[name])
+                for name, fmt, filename in pending if fmt != "step"
+            ]
+            if step_jobs:
+                futures.append(
+                    pool.submit(_export_step_batch, brep_paths, step_jobs,
+                                digests))
+            for future in as_completed(futures):
+                _log(f"  {future.result()}")
+    _flush_log()
 
 
 def generate_viewer_html():
-    """Generate an HTML viewer using model-viewer."""
-    html_content = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Drone Frame 3D Viewer</title>
-    <script type="module" src="https://unpkg.com/@google/model-viewer/dist/model-viewer.min.js"></script>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            min-height: 100vh;
-            color: #fff;
-        }
-        .header {
-            padding: 20px;
-            text-align: center;
-            border-bottom: 1px solid rgba(255,255,255,0.1);
-        }
-        .header h1 {
-            font-size: 24px;
-            font-weight: 600;
-        }
-        .header p {
-            color: rgba(255,255,255,0.6);
-            margin-top: 5px;
-        }
-        .container {
-            display: flex;
-            height: calc(100vh - 100px);
-        }
-        .viewer-panel {
-            flex: 1;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 20px;
-        }
-        model-viewer {
-            width: 100%;
-            height: 100%;
-            min-height: 500px;
-            background: radial-gradient(circle at center, #2a2a4a 0%, #1a1a2e 100%);
-            border-radius: 12px;
-            --poster-color: transparent;
-        }
-        .sidebar {
-            width: 280px;
-            background: rgba(255,255,255,0.05);
-            padding: 20px;
-            overflow-y: auto;
-        }
-        .part-card {
-            background: rgba(255,255,255,0.08);
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 12px;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        .part-card:hover {
-            background: rgba(255,255,255,0.12);
-            transform: translateX(5px);
-        }
-        .part-card.active {
-            background: rgba(74, 144, 226, 0.3);
-            border: 1px solid rgba(74, 144, 226, 0.5);
-        }
-        .part-card h3 {
-            font-size: 14px;
-            margin-bottom: 5px;
-        }
-        .part-card p {
-            font-size: 12px;
-            color: rgba(255,255,255,0.6);
-        }
-        .part-card .qty {
-            display: inline-block;
-            background: rgba(74, 144, 226, 0.3);
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: 11px;
-            margin-top: 8px;
-        }
-        .section-title {
-            font-size: 12px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            color: rgba(255,255,255,0.4);
-            margin-bottom: 15px;
-        }
-        .download-btn {
-            display: block;
-            width: 100%;
-            padding: 12px;
-            background: #4a90e2;
-            border: none;
-            border-radius: 8px;
-            color: white;
-            font-size: 14px;
-            cursor: pointer;
-            margin-top: 10px;
-            text-decoration: none;
-            text-align: center;
-            transition: background 0.2s;
-        }
-        .download-btn:hover {
-            background: #357abd;
-        }
-        .specs {
-            margin-top: 20px;
-            padding-top: 20px;
-            border-top: 1px solid rgba(255,255,255,0.1);
-        }
-        .spec-row {
-            display: flex;
-            justify-content: space-between;
-            font-size: 12px;
-            padding: 5px 0;
-        }
-        .spec-row .label {
-            color: rgba(255,255,255,0.6);
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Drone Frame 3D Viewer</h1>
-        <p>Interactive preview of printable drone parts</p>
-    </div>
-
-    <div class="container">
-        <div class="viewer-panel">
-            <model-viewer
-                id="viewer"
-                src="drone_assembly.glb"
-                alt="Drone Frame Assembly"
-                camera-controls
-                auto-rotate
-                shadow-intensity="1"
-                environment-image="neutral"
-                exposure="0.8"
-                camera-orbit="45deg 55deg 300mm"
-                min-camera-orbit="auto auto 100mm"
-                max-camera-orbit="auto auto 500mm"
-            >
-            </model-viewer>
-        </div>
-
-        <div class="sidebar">
-            <div class="section-title">Parts</div>
-
-            <div class="part-card active" onclick="loadModel('drone_assembly.glb', this)">
-                <h3>Complete Assembly</h3>
-                <p>Full drone frame with all parts</p>
-                <span class="qty">Preview Only</span>
-            </div>
-
-            <div class="part-card" onclick="loadModel('frame_body.glb', this)">
-                <h3>Frame Body</h3>
-                <p>Central body with Arduino & IMU mounts</p>
-                <span class="qty">x1</span>
-                <a href="frame_body.stl" class="download-btn" onclick="event.stopPropagation()">Download STL</a>
-            </div>
-
-            <div class="part-card" onclick="loadModel('frame_arm.glb', this)">
-                <h3>Frame Arm</h3>
-                <p>Motor mount arm with I-beam profile</p>
-                <span class="qty">x4</span>
-                <a href="frame_arm.stl" class="download-btn" onclick="event.stopPropagation()">Download STL</a>
-            </div>
-
-            <div class="part-card" onclick="loadModel('prop_guard.glb', this)">
-                <h3>Prop Guard</h3>
-                <p>2.5" propeller protection ring</p>
-                <span class="qty">x4</span>
-                <a href="prop_guard.stl" class="download-btn" onclick="event.stopPropagation()">Download STL</a>
-            </div>
-
-            <div class="part-card" onclick="loadModel('battery_cover.glb', this)">
-                <h3>Battery Cover</h3>
-                <p>LiPo 2S protective cover</p>
-                <span class="qty">x1</span>
-                <a href="battery_cover.stl" class="download-btn" onclick="event.stopPropagation()">Download STL</a>
-            </div>
-
-            <div class="part-card" onclick="loadModel('lm2596_assembly.glb', this)">
-                <h3>LM2596 Assembly</h3>
-                <p>Complete enclosure with lid and PCB</p>
-                <span class="qty">Preview Only</span>
-            </div>
-
-            <div class="part-card" onclick="loadModel('lm2596_case.glb', this)">
-                <h3>LM2596 Case</h3>
-                <p>Open-top box with terminal cutouts</p>
-                <span class="qty">x1</span>
-                <a href="lm2596_case.stl" class="download-btn" onclick="event.stopPropagation()">Download STL</a>
-            </div>
-
-            <div class="part-card" onclick="loadModel('lm2596_lid.glb', this)">
-                <h3>LM2596 Lid</h3>
-                <p>Cover with display window and access holes</p>
-                <span class="qty">x1</span>
-                <a href="lm2596_lid.stl" class="download-btn" onclick="event.stopPropagation()">Download STL</a>
-            </div>
-
-            <div class="specs">
-                <div class="section-title">Specifications</div>
-                <div class="spec-row">
-                    <span class="label">Propellers</span>
-                    <span>2.5" (63.5mm)</span>
-                </div>
-                <div class="spec-row">
-                    <span class="label">Motors</span>
-                    <span>820 Brushed</span>
-                </div>
-                <div class="spec-row">
-                    <span class="label">Battery</span>
-                    <span>LiPo 2S</span>
-                </div>
-                <div class="spec-row">
-                    <span class="label">Controller</span>
-                    <span>Arduino R4 WiFi</span>
-                </div>
-                <div class="spec-row">
-                    <span class="label">IMU</span>
-                    <span>MPU6050</span>
-                </div>
-                <div class="spec-row">
-                    <span class="label">Print Bed</span>
-                    <span>220x220mm</span>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        function loadModel(filename, element) {
-            document.getElementById('viewer').src = filename;
-            document.querySelectorAll('.part-card').forEach(card => card.classList.remove('active'));
-            element.classList.add('active');
-        }
-    </script>
-</body>
-</html>
-'''
+    """Copy the static model-viewer page into the build directory.
+
+    The page is a constant that only depends on the exported filenames,
+    so it lives as a plain template next to this script instead of a
+    multi-KB string literal rebuilt every run. The write is skipped when
+    the content is unchanged, keeping viewer.html's mtime stable so
+    file watchers don't trigger on no-op exports.
+    """
+    # Byte-for-byte copy: no decode/encode round-trip and no platform
+    # newline translation on the way out.
+    html_bytes = (script_dir / "viewer_template.html").read_bytes()
     filepath = EXPORT_DIR / "viewer.html"
-    filepath.write_text(html_content, encoding='utf-8')
-    print(f"  Generated: {filepath}")
+    if filepath.exists() and filepath.read_bytes() == html_bytes:
+        _log(f"  Up to date: {filepath}")
+        return
+    filepath.write_bytes(html_bytes)
+    _log(f"  Generated: {filepath}")
 
 
 def main():
     """Main export function."""
+    # Heavy imports live here so loading this module stays cheap
+    from build123d import Compound
+    from frame_body import create_body
+    from frame_arm import create_arm
+    from prop_guard import create_prop_guard
+    from battery_cover import create_battery_cover
+    from assembly import create_assembly
+    from components.lm2596 import (
+        create_enclosure as create_lm2596_enclosure,
+        create_lid as create_lm2596_lid,
+        create_assembly as create_lm2596_assembly,
+    )
+
     print("=" * 50)
     print("Drone Frame 3D Parts Export")
     print("=" * 50)
@@ -351,69 +368,73 @@ def main():
     lm2596_lid = create_lm2596_lid()
 
     print("  Creating LM2596 assembly...")
-    lm2596_assy_enc, lm2596_assy_lid = create_lm2596_assembly()
-    with BuildPart() as lm2596_assy_builder:
-        add(lm2596_assy_enc)
-        add(lm2596_assy_lid)
-    lm2596_assembly = lm2596_assy_builder.part
+    # Reuse the parts built above instead of rebuilding them
+    lm2596_assy_enc, lm2596_assy_lid = create_lm2596_assembly(
+        enclosure=lm2596_enclosure, lid=lm2596_lid)
+    lm2596_assembly = Compound(children=[lm2596_assy_enc, lm2596_assy_lid])
 
     print("  Creating drone assembly...")
-    body_parts, arm_parts, guard_parts, cover_parts, electronics_parts = create_assembly(include_electronics=True)
-
-    # Combine all assembly parts into a single compound for export
-    with BuildPart() as assembly_builder:
-        for part in body_parts:
-            add(part)
-        for part in arm_parts:
-            add(part)
-        for part in guard_parts:
-            add(part)
-        for part in cover_parts:
-            add(part)
-        # Add electronics
-        for name, part in electronics_parts:
-            add(part)
-    assembly = assembly_builder.part
-
-    # Export STL files (for 3D printing)
-    print("\nExporting STL files (for 3D printing)...")
-    export_stl_file(body, "frame_body.stl")
-    export_stl_file(arm, "frame_arm.stl")
-    export_stl_file(guard, "prop_guard.stl")
-    export_stl_file(cover, "battery_cover.stl")
-    export_stl_file(lm2596_enclosure, "lm2596_case.stl")
-    export_stl_file(lm2596_lid, "lm2596_lid.stl")
-    export_stl_file(lm2596_assembly, "lm2596_assembly.stl")
-    export_stl_file(assembly, "drone_assembly.stl")
-
-    # Export STEP files (for CAD import)
-    print("\nExporting STEP files (for CAD)...")
-    export_step_file(body, "frame_body.step")
-    export_step_file(arm, "frame_arm.step")
-    export_step_file(guard, "prop_guard.step")
-    export_step_file(cover, "battery_cover.step")
-    export_step_file(lm2596_enclosure, "lm2596_case.step")
-    export_step_file(lm2596_lid, "lm2596_lid.step")
-    export_step_file(lm2596_assembly, "lm2596_assembly.step")
-    export_step_file(assembly, "drone_assembly.step")
-
-    # Export GLTF files (for web viewer)
-    print("\nExporting GLTF files (for web viewer)...")
-    export_gltf_file(body, "frame_body.glb")
-    export_gltf_file(arm, "frame_arm.glb")
-    export_gltf_file(guard, "prop_guard.glb")
-    export_gltf_file(cover, "battery_cover.glb")
-    export_gltf_file(lm2596_enclosure, "lm2596_case.glb")
-    export_gltf_file(lm2596_lid, "lm2596_lid.glb")
-    export_gltf_file(lm2596_assembly, "lm2596_assembly.glb")
-    export_gltf_file(assembly, "drone_assembly.glb")
+    # DRONE_SKIP_VIZ=1 exports the printable parts only: the
+    # visualization-stub electronics are left out of the assembly and
+    # their factories are never run.
+    include_electronics = os.environ.get('DRONE_SKIP_VIZ', '0') != '1'
+    body_parts, arm_parts, guard_parts, cover_parts, electronics_parts = create_assembly(
+        include_electronics=include_electronics,
+        body=body, arm=arm, guard=guard, cover=cover)
+
+    # Combine all assembly parts into a single compound for export.
+    # The parts don't intersect, so a Compound (pure topological
+    # grouping) does the job without the boolean fuse a BuildPart
+    # add-loop would run for every child.
+    assembly = Compound(children=(
+        body_parts + arm_parts + guard_parts + cover_parts
+        + [part for _, part in electronics_parts]))
+
+    # Export STL (printing), STEP (CAD), and GLTF (web viewer) files.
+    # Every (part, format) pair is an independent OCCT write, so the
+    # whole batch runs across worker processes.
+    parts = {
+        "frame_body": body,
+        "frame_arm": arm,
+        "prop_guard": guard,
+        "battery_cover": cover,
+        "lm2596_case": lm2596_enclosure,
+        "lm2596_lid": lm2596_lid,
+        "lm2596_assembly": lm2596_assembly,
+        "drone_assembly": assembly,
+    }
+    # One "mesh" job per part writes both STL and GLB from a shared
+    # triangulation; STEP needs the exact BREP, not a mesh.
+    jobs = [(name, "mesh", name) for name in parts]
+    jobs += [(name, "step", f"{name}.step") for name in parts]
+    print("\nExporting STL/STEP/GLTF files...")
+    run_export_jobs(parts, jobs)
 
     # Generate HTML viewer
     print("\nGenerating HTML viewer...")
     generate_viewer_html()
+    _flush_log()
+
+    # Export PNG images (PyVista startup is expensive; EXPORT_PNG=0
+    # skips the whole block, import included)
+    if os.environ.get('EXPORT_PNG', '1') != '1':
+        print("\nSkipping PNG export (EXPORT_PNG=0)")
+    else:
+        print("\nExporting PNG images...")
+        _export_pngs(body, arm, guard, cover, body_parts, arm_parts,
+                     guard_parts, cover_parts, electronics_parts)
+
+    print("\n" + "=" * 50)
+    print("Export complete!")
+    print(f"Files saved to: {EXPORT_DIR}")
+    print("\nTo view in browser, open:")
+    print(f"  {EXPORT_DIR / 'viewer.html'}")
+    print("=" * 50)
+
 
-    # Export PNG images
-    print("\nExporting PNG images...")
+def _export_pngs(body, arm, guard, cover, body_parts, arm_parts,
+                 guard_parts, cover_parts, electronics_parts):
+    """Render PNG previews of the parts and assembly views."""
     try:
         from render_images import render_part, render_assembly
 
@@ -455,13 +476,6 @@ def main():
     except Exception as e:
         print(f"  Warning: PNG export failed: {e}")
 
-    print("\n" + "=" * 50)
-    print("Export complete!")
-    print(f"Files saved to: {EXPORT_DIR}")
-    print("\nTo view in browser, open:")
-    print(f"  {EXPORT_DIR / 'viewer.html'}")
-    print("=" * 50)
-
 
 if __name__ == "__main__":
     main()
@@ -16,8 +16,7 @@ Geometry notes (for assembly):
 - Motor center: Y = +65 (ARM_TOTAL_LENGTH from mount)
 """
 
-from build123d import *
-from ocp_vscode import show, set_defaults
+from brep_cache import brep_cached
 
 # Total arm length (mount plate center to motor center)
 ARM_TOTAL_LENGTH = 65   # mm - this is the key dimension
@@ -46,6 +45,7 @@ MOUNT_HOLE_SPACING = 10 # mm
 ARM_LENGTH = ARM_TOTAL_LENGTH  # Export for assembly compatibility
 
 
+@brep_cached
 def create_arm(verbose=False):
     """Create a single drone arm with motor mount.
 
@@ -55,6 +55,11 @@ def create_arm(verbose=False):
     - Arm beam runs from mount plate to just before motor
     - Prop guard friction-fits over the motor mount cylinder
     """
+    # Deferred: importing the OCCT bindings costs hundreds of ms, and
+    # consumers that only read constants like ARM_LENGTH skip it entirely
+    from build123d import (BuildPart, BuildSketch, Circle, Hole, Location,
+                           Locations, Mode, Plane, Rectangle,
+                           RectangleRounded, extrude)
 
     # Key positions along Y axis (mount plate at origin)
     mount_plate_y = 0
@@ -98,21 +103,20 @@ def create_arm(verbose=False):
             Location((0, motor_center_y, ARM_HEIGHT + MOTOR_MOUNT_DEPTH))
         )
 
-        # Mounting holes on mount plate
-        for dx in [-MOUNT_HOLE_SPACING/2, MOUNT_HOLE_SPACING/2]:
-            Hole(MOUNT_HOLE_DIA/2, depth=ARM_HEIGHT).locate(
-                Location((dx, mount_plate_y, ARM_HEIGHT))
-            )
+        # Mounting holes on mount plate (both drilled in one boolean op)
+        with Locations([(-MOUNT_HOLE_SPACING/2, mount_plate_y, ARM_HEIGHT),
+                        (MOUNT_HOLE_SPACING/2, mount_plate_y, ARM_HEIGHT)]):
+            Hole(MOUNT_HOLE_DIA/2, depth=ARM_HEIGHT)
 
-        # Weight reduction slots in arm beam
+        # Weight reduction slots in arm beam, all cut in one boolean op
         slot_spacing = beam_length / 4
-        for i in range(3):
-            slot_y = arm_beam_start_y + slot_spacing * (i + 1)
-            if slot_y < motor_center_y - MOTOR_MOUNT_OD:
-                with BuildSketch(Plane.XY.offset(ARM_HEIGHT)) as slot:
-                    with Locations([(0, slot_y)]):
-                        RectangleRounded(ARM_WIDTH - 4, 8, radius=2)
-                extrude(amount=-ARM_HEIGHT + 2, mode=Mode.SUBTRACT)
+        slot_ys = [arm_beam_start_y + slot_spacing * (i + 1) for i in range(3)]
+        slot_ys = [y for y in slot_ys if y < motor_center_y - MOTOR_MOUNT_OD]
+        if slot_ys:
+            with BuildSketch(Plane.XY.offset(ARM_HEIGHT)) as slots:
+                with Locations([(0, y) for y in slot_ys]):
+                    RectangleRounded(ARM_WIDTH - 4, 8, radius=2)
+            extrude(amount=-ARM_HEIGHT + 2, mode=Mode.SUBTRACT)
 
         # Wire channel through arm (for motor wires)
         wire_length = motor_center_y - arm_beam_start_y + 5
@@ -123,9 +127,19 @@ def create_arm(verbose=False):
     return arm.part
 
 
-# Create the arm
-arm = create_arm()
+def __getattr__(name):
+    # PEP 562: `from frame_arm import arm` still works, but the part is
+    # only built (or cache-loaded) on first access, not at import
+    if name == "arm":
+        globals()["arm"] = create_arm()
+        return globals()["arm"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
+    # Deferred: the viewer backend is heavy and only needed when displaying
+    from ocp_vscode import show, set_defaults
+
+    arm = create_arm()
     set_defaults(axes=True, axes0=True, grid=[True, False, False])
     show(arm)
@@ -11,9 +11,10 @@ Specifications:
 - Triangular truss pattern for weight reduction (stronger than honeycomb)
 """
 
-from build123d import *
-from ocp_vscode import show, set_defaults
-import math
+import numpy as np
+
+from _truss import gen as truss_gen
+from brep_cache import brep_cached
 
 # Body dimensions (updated per plan)
 BODY_LENGTH = 95  # mm
@@ -63,45 +64,15 @@ DRV8833_POS_1 = (20, 10)     # Front motors driver
 DRV8833_POS_2 = (20, -10)    # Rear motors driver
 
 
-def create_triangular_pattern(length, width, tri_size=10, wall=3):
-    """Create a triangular truss pattern of cutouts - stronger than honeycomb."""
-    triangles = []  # List of (x, y, pointing_up)
-
-    # Triangle geometry
-    tri_height = tri_size * math.sqrt(3) / 2
-
-    # Spacing
-    x_spacing = tri_size + wall
-    y_spacing = tri_height + wall * 0.866
-
-    # Calculate grid
-    cols = int(length / x_spacing)
-    rows = int(width / y_spacing)
-
-    # Center the pattern
-    x_offset = -(cols - 1) * x_spacing / 2
-    y_offset = -(rows - 1) * y_spacing / 2
-
-    for row in range(rows):
-        for col in range(cols):
-            x = x_offset + col * x_spacing
-            # Offset alternating rows
-            if row % 2 == 1:
-                x += x_spacing / 2
-            y = y_offset + row * y_spacing
-
-            # Alternate triangle direction
-            pointing_up = (row + col) % 2 == 0
-
-            # Only include if within bounds
-            if abs(x) < length/2 - tri_size * 0.6 and abs(y) < width/2 - tri_size * 0.6:
-                triangles.append((x, y, pointing_up))
-
-    return triangles, tri_size * 0.4  # Return positions and effective radius
-
-
+@brep_cached
 def create_body():
     """Create the main drone body."""
+    # Deferred: importing the OCCT bindings costs hundreds of ms, and
+    # consumers that only read the geometry constants skip it entirely
+    from build123d import (Axis, BuildPart, BuildSketch, Circle, Face, Hole,
+                           Location, Locations, Mode, Plane, Rectangle,
+                           RectangleRounded, Vector, Wire, add, extrude,
+                           revolve)
 
     # Print position info
     print("=" * 60)
@@ -122,26 +93,38 @@ def create_body():
         arm_angles = [45, 135, 225, 315]
         arm_names = ["Front-Right", "Front-Left", "Rear-Left", "Rear-Right"]
 
+        # One vectorized trig pass covers the mount centers, the hole
+        # positions and the truss keep-out test further down
+        arm_rads = np.radians(arm_angles)
+        arm_cos, arm_sin = np.cos(arm_rads), np.sin(arm_rads)
+        arm_xy = ARM_MOUNT_DISTANCE * np.stack([arm_cos, arm_sin], axis=1)
+
         print("Arm Mount Positions (on body):")
-        for i, angle in enumerate(arm_angles):
-            angle_rad = math.radians(angle)
-            x = ARM_MOUNT_DISTANCE * math.cos(angle_rad)
-            y = ARM_MOUNT_DISTANCE * math.sin(angle_rad)
-            print(f"  {arm_names[i]} ({angle}°): ({x:.1f}, {y:.1f}) mm, Z = {BODY_THICKNESS}-{BODY_THICKNESS + 4} mm")
+        for i, (x, y) in enumerate(arm_xy):
+            print(f"  {arm_names[i]} ({arm_angles[i]}°): ({x:.1f}, {y:.1f}) mm, Z = {BODY_THICKNESS}-{BODY_THICKNESS + 4} mm")
 
-            with BuildSketch(Plane.XY.offset(BODY_THICKNESS)) as arm_mount:
+        # All four mount pads accumulate as faces in one sketch, so a
+        # single extrude fuses them to the base in one boolean op
+        with BuildSketch(Plane.XY.offset(BODY_THICKNESS)) as arm_mount:
+            for (x, y), angle in zip(arm_xy, arm_angles):
                 with Locations([(x, y)]):
                     RectangleRounded(ARM_MOUNT_LENGTH, ARM_MOUNT_WIDTH, radius=2, rotation=angle)
-            extrude(amount=4)
-
-            # Arm mounting holes (along the arm direction)
-            hole_offset = ARM_MOUNT_HOLE_SPACING / 2
-            for dx in [-hole_offset, hole_offset]:
-                hx = x + dx * math.cos(angle_rad)
-                hy = y + dx * math.sin(angle_rad)
-                Hole(ARM_MOUNT_HOLE_DIA/2, depth=BODY_THICKNESS + 4).locate(
-                    Location((hx, hy, BODY_THICKNESS + 4))
-                )
+        extrude(amount=4)
+
+        # Arm mounting holes (along the arm direction), positions
+        # broadcast as (4 arms, 2 offsets) in one shot
+        hole_offs = np.array([-ARM_MOUNT_HOLE_SPACING / 2,
+                              ARM_MOUNT_HOLE_SPACING / 2])
+        hole_x = arm_xy[:, 0, None] + np.multiply.outer(arm_cos, hole_offs)
+        hole_y = arm_xy[:, 1, None] + np.multiply.outer(arm_sin, hole_offs)
+
+        # All eight arm holes drilled in one boolean op; one array
+        # conversion instead of per-point tuple packing
+        arm_hole_pos = np.column_stack([
+            hole_x.ravel(), hole_y.ravel(),
+            np.full(hole_x.size, BODY_THICKNESS + 4.0)])
+        with Locations([Location(p) for p in arm_hole_pos.tolist()]):
+            Hole(ARM_MOUNT_HOLE_DIA/2, depth=BODY_THICKNESS + 4)
         print()
 
         # Arduino standoffs (connected to base)
@@ -156,17 +139,24 @@ def create_body():
         for i, (px, py) in enumerate(standoff_positions):
             print(f"  Standoff {i+1}: ({px:.1f}, {py:.1f}) mm, height = {STANDOFF_HEIGHT} mm")
 
-        for px, py in standoff_positions:
-            # Standoff cylinder
-            with BuildSketch(Plane.XY.offset(BODY_THICKNESS)) as standoff:
-                with Locations([(px, py)]):
-                    Circle(STANDOFF_OD / 2)
-            extrude(amount=STANDOFF_HEIGHT)
-
-            # Screw hole through standoff and base
-            Hole(STANDOFF_ID/2, depth=STANDOFF_HEIGHT + BODY_THICKNESS).locate(
-                Location((px, py, BODY_THICKNESS + STANDOFF_HEIGHT))
-            )
+        # A standoff with its bore is rotationally symmetric: revolve the
+        # annular cross-section once, then replicate the solid to all
+        # four positions and fuse in a single op
+        with BuildSketch(Plane.XZ, mode=Mode.PRIVATE) as standoff_profile:
+            with Locations([((STANDOFF_ID + STANDOFF_OD) / 4,
+                             BODY_THICKNESS + STANDOFF_HEIGHT / 2)]):
+                Rectangle((STANDOFF_OD - STANDOFF_ID) / 2, STANDOFF_HEIGHT)
+        standoff_solid = revolve(standoff_profile.sketch, axis=Axis.Z,
+                                 mode=Mode.PRIVATE)
+        with Locations(standoff_positions):
+            add(standoff_solid)
+
+        # Screw holes continue through the base plate: one sketch of
+        # four circles, one cut
+        with BuildSketch(Plane.XY.offset(BODY_THICKNESS)) as screw_holes:
+            with Locations(standoff_positions):
+                Circle(STANDOFF_ID / 2)
+        extrude(amount=-BODY_THICKNESS, mode=Mode.SUBTRACT)
         print()
 
         # IMU mounting platform at center (raised)
@@ -182,10 +172,11 @@ def create_body():
             (-IMU_HOLE_SPACING/2, -IMU_HOLE_SPACING/2),
             (IMU_HOLE_SPACING/2, -IMU_HOLE_SPACING/2),
         ]
-        for ix, iy in imu_hole_positions:
-            Hole(IMU_HOLE_DIA/2, depth=BODY_THICKNESS + IMU_PLATFORM_HEIGHT).locate(
-                Location((ix, iy, BODY_THICKNESS + IMU_PLATFORM_HEIGHT))
-            )
+        imu_top = BODY_THICKNESS + IMU_PLATFORM_HEIGHT
+        with BuildSketch(Plane.XY.offset(imu_top)) as imu_holes:
+            with Locations(imu_hole_positions):
+                Circle(IMU_HOLE_DIA / 2)
+        extrude(amount=-imu_top, mode=Mode.SUBTRACT)
 
         # DRV8833 motor driver standoffs (2 boards for 4 motors)
         drv8833_positions = [DRV8833_POS_1, DRV8833_POS_2]
@@ -194,25 +185,29 @@ def create_body():
         for idx, (dx, dy) in enumerate(drv8833_positions):
             print(f"DRV8833 {drv8833_names[idx]}: center ({dx}, {dy}), M2 standoffs")
 
-            # 2 diagonal mounting holes per board (common for small modules)
-            hole_offsets = [
-                (DRV8833_HOLE_SPACING_L/2, DRV8833_HOLE_SPACING_W/2),
-                (-DRV8833_HOLE_SPACING_L/2, -DRV8833_HOLE_SPACING_W/2),
-            ]
-
-            for hx, hy in hole_offsets:
-                px, py = dx + hx, dy + hy
-
-                # Standoff cylinder
-                with BuildSketch(Plane.XY.offset(BODY_THICKNESS)) as drv_standoff:
-                    with Locations([(px, py)]):
-                        Circle(DRV8833_STANDOFF_OD / 2)
-                extrude(amount=DRV8833_STANDOFF_HEIGHT)
-
-                # M2 screw hole
-                Hole(DRV8833_STANDOFF_ID/2, depth=DRV8833_STANDOFF_HEIGHT + BODY_THICKNESS).locate(
-                    Location((px, py, BODY_THICKNESS + DRV8833_STANDOFF_HEIGHT))
-                )
+        # 2 diagonal mounting holes per board (common for small modules),
+        # broadcast to all board centers in one array op
+        hole_offsets = [
+            (DRV8833_HOLE_SPACING_L/2, DRV8833_HOLE_SPACING_W/2),
+            (-DRV8833_HOLE_SPACING_L/2, -DRV8833_HOLE_SPACING_W/2),
+        ]
+        drv_xy = (np.asarray(drv8833_positions, dtype=np.float64)[:, None, :]
+                  + np.asarray(hole_offsets, dtype=np.float64)[None, :, :]
+                  ).reshape(-1, 2)
+
+        # Standoff cylinders, one sketch + one fuse for all four
+        with BuildSketch(Plane.XY.offset(BODY_THICKNESS)) as drv_standoff:
+            with Locations([tuple(p) for p in drv_xy.tolist()]):
+                Circle(DRV8833_STANDOFF_OD / 2)
+        extrude(amount=DRV8833_STANDOFF_HEIGHT)
+
+        # All four M2 screw holes drilled in one boolean op
+        drv_hole_pos = np.column_stack([
+            drv_xy,
+            np.full(len(drv_xy), BODY_THICKNESS + DRV8833_STANDOFF_HEIGHT)])
+        with Locations([Location(p) for p in drv_hole_pos.tolist()]):
+            Hole(DRV8833_STANDOFF_ID/2,
+                 depth=DRV8833_STANDOFF_HEIGHT + BODY_THICKNESS)
         print()
 
         # Battery rails on bottom (extending downward)
@@ -226,68 +221,71 @@ def create_body():
             extrude(amount=-BATTERY_RAIL_HEIGHT)
         print()
 
-        # Triangular truss pattern for weight reduction (stronger than honeycomb)
-        tri_positions, tri_radius = create_triangular_pattern(
-            BODY_LENGTH - 35, BODY_WIDTH - 35,
-            tri_size=TRUSS_HOLE_SIZE,
-            wall=TRUSS_WALL
-        )
-
-        # Filter out positions that would interfere with features
-        filtered_positions = []
-        for tx, ty, pointing_up in tri_positions:
-            too_close = False
-
-            # Skip if too close to standoffs
-            for px, py in standoff_positions:
-                if math.sqrt((tx - px)**2 + (ty - py)**2) < 14:
-                    too_close = True
-                    break
-
-            # Skip if too close to center (IMU)
-            if math.sqrt(tx**2 + ty**2) < 20:
-                too_close = True
-
-            # Skip if in arm mount areas
-            for angle in arm_angles:
-                angle_rad = math.radians(angle)
-                ax = ARM_MOUNT_DISTANCE * math.cos(angle_rad)
-                ay = ARM_MOUNT_DISTANCE * math.sin(angle_rad)
-                if math.sqrt((tx - ax)**2 + (ty - ay)**2) < 18:
-                    too_close = True
-                    break
-
-            if not too_close:
-                filtered_positions.append((tx, ty, pointing_up))
-
-        # Cut triangular holes
-        print(f"Truss Pattern: {len(filtered_positions)} triangular cutouts")
+        # Triangular truss pattern for weight reduction (stronger than
+        # honeycomb). Grid generation and the feature keep-out filter
+        # (squared-distance tests) run in one compiled pass (see _truss).
+        keepout_xy = np.vstack([
+            np.asarray(standoff_positions, dtype=np.float64),
+            arm_xy,
+        ])
+        keepout_r_sq = np.concatenate([
+            np.full(len(standoff_positions), 14.0 ** 2),    # standoffs
+            np.full(len(arm_xy), 18.0 ** 2),                # arm mounts
+        ])
+        tri_xy, tri_up = truss_gen(
+            float(BODY_LENGTH - 35), float(BODY_WIDTH - 35),
+            float(TRUSS_HOLE_SIZE), float(TRUSS_WALL),
+            keepout_xy, keepout_r_sq, 20.0 ** 2)            # center (IMU)
+        tri_radius = TRUSS_HOLE_SIZE * 0.4
+
+        # Build the cut faces straight from NumPy-computed vertices: one
+        # broadcasted trig pass per orientation (down-pointing is the
+        # up-pointing set turned 60°, 120° symmetry) instead of a
+        # RegularPolygon wire resolve per triangle
+        phis = np.radians([90.0, 210.0, 330.0])
+        tri_faces = []
+        for centers, phi0 in ((tri_xy[tri_up], 0.0),
+                              (tri_xy[~tri_up], np.pi / 3)):
+            vx = centers[:, 0, None] + tri_radius * np.cos(phis + phi0)
+            vy = centers[:, 1, None] + tri_radius * np.sin(phis + phi0)
+            tri_faces += [
+                Face.make_from_wires(Wire.make_polygon(
+                    [Vector(x, y, 0) for x, y in tri], close=True))
+                for tri in np.stack([vx, vy], axis=-1).tolist()
+            ]
+
+        print(f"Truss Pattern: {len(tri_xy)} triangular cutouts")
         print(f"  Triangle size: {TRUSS_HOLE_SIZE} mm, wall: {TRUSS_WALL} mm")
-        if filtered_positions:
-            with BuildSketch(Plane.XY.offset(BODY_THICKNESS)) as truss:
-                for tx, ty, pointing_up in filtered_positions:
-                    with Locations([(tx, ty)]):
-                        # Rotate triangle based on direction
-                        rot = 0 if pointing_up else 180
-                        RegularPolygon(radius=tri_radius, side_count=3, rotation=rot)
-            extrude(amount=-BODY_THICKNESS, mode=Mode.SUBTRACT)
-
-        # Battery strap slots (for securing battery with strap)
+
+        # Battery strap slots cut the same depth from the same plane as
+        # the truss holes, so both go into one sketch and one subtract
         strap_positions = [20, -20]
-        for sy in strap_positions:
-            with BuildSketch(Plane.XY.offset(BODY_THICKNESS)) as strap:
-                with Locations([(0, sy)]):
-                    RectangleRounded(BATTERY_COMP_WIDTH + 10, 3, radius=1)
-            extrude(amount=-BODY_THICKNESS, mode=Mode.SUBTRACT)
+        with BuildSketch(Plane.XY.offset(BODY_THICKNESS)) as combined_cut:
+            if tri_faces:
+                add(tri_faces)
+            # Battery strap slots (for securing battery with strap)
+            with Locations([(0, sy) for sy in strap_positions]):
+                RectangleRounded(BATTERY_COMP_WIDTH + 10, 3, radius=1)
+        extrude(amount=-BODY_THICKNESS, mode=Mode.SUBTRACT)
 
         print("=" * 60)
 
     return body.part
 
 
-# Create the body
-body = create_body()
+def __getattr__(name):
+    # PEP 562: `from frame_body import body` still works, but the part is
+    # only built (or cache-loaded) on first access, not at import
+    if name == "body":
+        globals()["body"] = create_body()
+        return globals()["body"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
+    # Deferred: the viewer backend is heavy and only needed when displaying
+    from ocp_vscode import show, set_defaults
+
+    body = create_body()
     set_defaults(axes=True, axes0=True, grid=[True, False, False])
     show(body)
@@ -20,9 +20,7 @@ Geometry notes (for assembly):
 - Friction fit holds guard in place
 """
 
-from build123d import *
-from ocp_vscode import show, set_defaults
-import math
+from brep_cache import brep_cached
 
 # Guard dimensions - exported for assembly.py
 PROP_DIAMETER = 63.5    # mm (2.5 inch propeller)
@@ -50,8 +48,13 @@ SLEEVE_HEIGHT = 10      # mm - enough grip length
 STRUT_EXTENSION = 0     # mm - exported for assembly.py compatibility
 
 
+@brep_cached
 def create_prop_guard(verbose=False):
     """Create a cage-style prop guard with central friction-fit sleeve."""
+    # Deferred: importing the OCCT bindings costs hundreds of ms, and
+    # consumers that only read constants like MOTOR_MOUNT_OD skip it
+    from build123d import (Axis, BuildPart, BuildSketch, Locations, Plane,
+                           PolarLocations, Rectangle, extrude, revolve)
 
     inner_radius = GUARD_ID / 2
     outer_radius = GUARD_OD / 2
@@ -70,63 +73,78 @@ def create_prop_guard(verbose=False):
         print(f"Sleeve height: {SLEEVE_HEIGHT} mm")
         print("=" * 50)
 
+    ring_mid = (inner_radius + outer_radius) / 2
+    upper_ring_z = LOWER_RING_HEIGHT + STRUT_HEIGHT
+
     with BuildPart() as guard:
-        # Lower guard ring - base of the cage
-        with BuildSketch() as lower_ring:
-            Circle(outer_radius)
-            Circle(inner_radius, mode=Mode.SUBTRACT)
-        extrude(amount=LOWER_RING_HEIGHT)
-
-        # 4 vertical struts extending upward from lower ring
-        strut_angles = [0, 90, 180, 270]
-
-        for angle in strut_angles:
-            angle_rad = math.radians(angle)
-            strut_x = strut_center_radius * math.cos(angle_rad)
-            strut_y = strut_center_radius * math.sin(angle_rad)
-
-            # Main strut going up
-            with BuildSketch(Plane.XY.offset(LOWER_RING_HEIGHT)) as strut:
-                with Locations([(strut_x, strut_y)]):
-                    Rectangle(STRUT_WIDTH, STRUT_WIDTH)
-            extrude(amount=STRUT_HEIGHT)
-
-        # Upper ring connecting the struts (for blade tip protection)
-        upper_ring_z = LOWER_RING_HEIGHT + STRUT_HEIGHT
-        with BuildSketch(Plane.XY.offset(upper_ring_z)) as upper_ring:
-            Circle(outer_radius)
-            Circle(inner_radius, mode=Mode.SUBTRACT)
-        extrude(amount=UPPER_RING_HEIGHT)
-
-        # Central friction-fit sleeve - slides over motor mount
-        # Extends downward from center of lower ring
-        with BuildSketch(Plane.XY) as sleeve:
-            Circle(SLEEVE_OD / 2)
-            Circle(SLEEVE_ID / 2, mode=Mode.SUBTRACT)
-        extrude(amount=-SLEEVE_HEIGHT)
-
-        # Add connecting spokes from sleeve to lower ring (4 spokes)
-        spoke_angles = [45, 135, 225, 315]  # Between the struts
-        for angle in spoke_angles:
-            angle_rad = math.radians(angle)
-
-            # Spoke connects sleeve OD to ring ID
-            spoke_length = inner_radius - SLEEVE_OD / 2
-            spoke_center_radius = SLEEVE_OD / 2 + spoke_length / 2
-            spoke_x = spoke_center_radius * math.cos(angle_rad)
-            spoke_y = spoke_center_radius * math.sin(angle_rad)
-
-            with BuildSketch(Plane.XY) as spoke:
-                with Locations([(spoke_x, spoke_y)]):
-                    Rectangle(spoke_length, 3, rotation=angle)
-            extrude(amount=3)  # Thin spoke at bottom of ring
+        # Lower ring, upper ring and central sleeve are all solids of
+        # revolution, so sketch their cross-sections in the XZ plane and
+        # revolve once: one OCCT op instead of three extrude+fuse pairs.
+        with BuildSketch(Plane.XZ) as ring_profile:
+            # Lower guard ring - base of the cage
+            with Locations([(ring_mid, LOWER_RING_HEIGHT / 2)]):
+                Rectangle(GUARD_WALL, LOWER_RING_HEIGHT)
+            # Upper ring connecting the struts (blade tip protection)
+            with Locations([(ring_mid, upper_ring_z + UPPER_RING_HEIGHT / 2)]):
+                Rectangle(GUARD_WALL, UPPER_RING_HEIGHT)
+            # Central friction-fit sleeve - slides over motor mount,
+            # extends downward from center of lower ring
+            with Locations([((SLEEVE_ID + SLEEVE_OD) / 4, -SLEEVE_HEIGHT / 2)]):
+                Rectangle((SLEEVE_OD - SLEEVE_ID) / 2, SLEEVE_HEIGHT)
+        revolve(axis=Axis.Z)
+
+        # 4 vertical struts (0/90/180/270 degrees) extending upward from
+        # the lower ring. PolarLocations places the evenly spaced squares
+        # natively; one sketch, one fuse.
+        with BuildSketch(Plane.XY.offset(LOWER_RING_HEIGHT)) as struts:
+            with PolarLocations(strut_center_radius, 4, start_angle=0):
+                Rectangle(STRUT_WIDTH, STRUT_WIDTH)
+        extrude(amount=STRUT_HEIGHT)
+
+        # Add connecting spokes from sleeve to lower ring (4 spokes at
+        # 45/135/225/315 degrees, between the struts). PolarLocations
+        # rotates each placement radially, so no per-spoke rotation.
+        spoke_length = inner_radius - SLEEVE_OD / 2   # sleeve OD to ring ID
+        spoke_center_radius = SLEEVE_OD / 2 + spoke_length / 2
+
+        with BuildSketch(Plane.XY) as spokes:
+            with PolarLocations(spoke_center_radius, 4, start_angle=45):
+                Rectangle(spoke_length, 3)
+        extrude(amount=3)  # Thin spokes at bottom of ring
 
     return guard.part
 
 
-# Create the prop guard
-guard = create_prop_guard()
+_guard_master = None
+
+
+def get_guard():
+    """Process-wide shared guard for instancing.
+
+    The four guards in the drone are identical, so build (or cache-load)
+    the master once per process and let callers place it with
+    .moved(Location(...)), which shares the underlying BRep data across
+    all placements instead of rebuilding or re-reading it.
+    """
+    global _guard_master
+    if _guard_master is None:
+        _guard_master = create_prop_guard()
+    return _guard_master
+
+
+def __getattr__(name):
+    # PEP 562: `from prop_guard import guard` still works, but the part
+    # is only built (or cache-loaded) on first access, not at import
+    if name == "guard":
+        globals()["guard"] = create_prop_guard()
+        return globals()["guard"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
+    # Deferred: the viewer backend is heavy and only needed when displaying
+    from ocp_vscode import show, set_defaults
+
+    guard = create_prop_guard()
     set_defaults(axes=True, axes0=True, grid=[True, False, False])
     show(guard)
@@ -9,14 +9,26 @@ Usage:
     render_part(my_part, "output.png", camera='iso', color='#4682B4')
 """
 
+import atexit
+import functools
+import hashlib
+import io
+import os
 import tempfile
+import weakref
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
+import imageio
+import numpy as np
+
 # Import pyvista with off-screen rendering
 import pyvista as pv
 
-# Camera position presets (normalized vectors)
-CAMERA_PRESETS = {
+# Camera position presets
+_RAW_CAMERA_PRESETS = {
     'iso': (1, 1, 0.7),         # Classic isometric view
     'top': (0, 0, 1),           # Top-down view (looking at XY plane)
     'front': (0, -1, 0),        # Front view (looking at XZ plane)
@@ -25,49 +37,171 @@ CAMERA_PRESETS = {
     'rear': (0, 1, 0),          # Rear view
 }
 
+# Normalized once at import; setup_camera only scales and adds
+CAMERA_PRESETS = {
+    name: tuple(np.asarray(v, dtype=float) / np.linalg.norm(v))
+    for name, v in _RAW_CAMERA_PRESETS.items()
+}
+
+# Up vectors (Z-up unless listed here)
+_CAMERA_UP = {'top': (0, 1, 0)}
+
 # Default rendering settings
 DEFAULT_SIZE = (800, 600)
 DEFAULT_BACKGROUND = '#F5F5F5'  # Light gray
 
 
+# PNG encoding is CPU-bound zlib work on the calling thread; handing it
+# to a small pool overlaps the encode of one frame with the VTK render
+# of the next. Flushed at interpreter exit so no write is dropped.
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
+atexit.register(_IO_POOL.shutdown, wait=True)
+
+
+def _write_png(filepath, image):
+    """Encode and write one framebuffer grab (runs on the I/O pool)."""
+    imageio.imwrite(str(filepath), image, compress_level=3)
+    print(f"  Rendered: {filepath}")
+
+
+@functools.lru_cache(maxsize=256)
 def hex_to_rgb(hex_color):
-    """Convert hex color string to RGB tuple (0-1 range)."""
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16) / 255.0
-    g = int(hex_color[2:4], 16) / 255.0
-    b = int(hex_color[4:6], 16) / 255.0
-    return (r, g, b)
+    """Convert hex color string to RGB tuple (0-1 range).
+
+    One int() parse plus bit-shifts, memoized: the same handful of part
+    colors recurs on every render.
+    """
+    packed = int(hex_color.lstrip('#'), 16)
+    return ((packed >> 16 & 0xFF) / 255.0,
+            (packed >> 8 & 0xFF) / 255.0,
+            (packed & 0xFF) / 255.0)
+
+
+# Creating a VTK render window (GL context + framebuffer) costs on the
+# order of 100ms, so finished plotters go back into a pool keyed by
+# (size, background) instead of being destroyed; the next render of the
+# same shape checks one out and only swaps actors.
+_PLOTTER_POOL = defaultdict(list)
+
+
+def _close_pooled_plotters():
+    for pool in _PLOTTER_POOL.values():
+        for plotter in pool:
+            plotter.close()
+    _PLOTTER_POOL.clear()
+
+
+atexit.register(_close_pooled_plotters)
+
+
+@contextmanager
+def acquire_plotter(size, background):
+    """Check out a ready off-screen plotter; returns it to the pool."""
+    key = (tuple(size), background)
+    pool = _PLOTTER_POOL[key]
+    if pool:
+        plotter = pool.pop()
+    else:
+        plotter = pv.Plotter(off_screen=True, window_size=list(size))
+        plotter.set_background(hex_to_rgb(background))
+    try:
+        yield plotter
+    finally:
+        plotter.clear()
+        pool.append(plotter)
+
+
+# Rendering the same part twice (e.g. multiple camera angles) reuses
+# its triangulation; entries vanish with the part itself
+_mesh_cache = weakref.WeakKeyDictionary()
+
+# Cross-run tessellation cache, next to the BREP cache. Keyed by a hash
+# of the part's BRep bytes, so geometrically identical parts hit the
+# same entry no matter which run built them.
+_MESH_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               ".brep_cache", "mesh")
+
+
+def _part_digest(part):
+    """Hash of the part's serialized BRep, or None if it won't export."""
+    from build123d import export_brep
+
+    try:
+        buf = io.BytesIO()
+        export_brep(part, buf)
+    except Exception:
+        return None
+    return hashlib.sha1(buf.getvalue()).hexdigest()[:16]
 
 
-def part_to_mesh(part):
+def part_to_mesh(part, tolerance=0.1, angular_tolerance=0.2):
     """
     Convert a build123d Part to a PyVista mesh.
 
-    Uses temporary STL file as intermediate format.
+    Tessellates the OCCT shape in memory and hands the vertex/face
+    arrays straight to PyVista — no temp-file STL round trip. Results
+    persist to disk keyed by the part's BRep hash, so warm runs skip
+    tessellation entirely.
 
     Args:
         part: build123d Part object
+        tolerance: linear deflection for tessellation (mm)
+        angular_tolerance: angular deflection for tessellation (rad)
 
     Returns:
         pv.PolyData: PyVista mesh
     """
-    from build123d import export_stl
+    try:
+        return _mesh_cache[part]
+    except (KeyError, TypeError):
+        pass
+
+    digest = _part_digest(part)
+    npz_path = None
+    if digest is not None:
+        npz_path = os.path.join(
+            _MESH_CACHE_DIR,
+            f"{digest}-{tolerance}-{angular_tolerance}.npz")
+
+    if npz_path is not None and os.path.exists(npz_path):
+        data = np.load(npz_path)
+        pts, faces = data['points'], data['faces']
+    else:
+        pts, faces = _tessellate_arrays(part, tolerance, angular_tolerance)
+        if npz_path is not None:
+            os.makedirs(_MESH_CACHE_DIR, exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a
+            # half-written entry
+            tmp_path = f"{npz_path}.{os.getpid()}.tmp.npz"
+            np.savez(tmp_path, points=pts, faces=faces)
+            os.replace(tmp_path, npz_path)
+
+    mesh = pv.PolyData(pts, faces)
+    try:
+        _mesh_cache[part] = mesh
+    except TypeError:
+        pass  # non-weakref-able shapes just skip the cache
+    return mesh
 
-    # Create temporary STL file
-    with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp:
-        tmp_path = tmp.name
 
-    try:
-        # Export part to STL
-        export_stl(part, tmp_path)
+def _tessellate_arrays(part, tolerance, angular_tolerance):
+    """Tessellate a part into (points, VTK face array) numpy arrays."""
+    vertices, triangles = part.tessellate(tolerance, angular_tolerance)
+    pts = np.array([(v.X, v.Y, v.Z) for v in vertices], dtype=np.float32)
 
-        # Load STL into PyVista
-        mesh = pv.read(tmp_path)
+    # VTK face encoding: [count, i0, i1, i2] per triangle
+    faces = np.empty((len(triangles), 4), dtype=np.int64)
+    faces[:, 0] = 3
+    faces[:, 1:] = np.asarray(triangles, dtype=np.int64)
+    return pts, faces.ravel()
 
-        return mesh
-    finally:
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
+
+def _tessellate_worker(brep_path, tolerance=0.1, angular_tolerance=0.2):
+    """Worker: tessellate one BREP file into mesh arrays."""
+    from build123d import import_brep
+
+    return _tessellate_arrays(import_brep(brep_path), tolerance,
+                              angular_tolerance)
 
 
 def setup_camera(plotter, camera_preset, bounds):
@@ -79,45 +213,23 @@ def setup_camera(plotter, camera_preset, bounds):
         camera_preset: str, one of CAMERA_PRESETS keys
         bounds: mesh bounds (xmin, xmax, ymin, ymax, zmin, zmax)
     """
-    # Get camera direction from preset
-    if camera_preset in CAMERA_PRESETS:
-        direction = CAMERA_PRESETS[camera_preset]
-    else:
-        direction = CAMERA_PRESETS['iso']
-
-    # Calculate center and size of bounding box
-    xmin, xmax, ymin, ymax, zmin, zmax = bounds
-    center = (
-        (xmin + xmax) / 2,
-        (ymin + ymax) / 2,
-        (zmin + zmax) / 2
-    )
-
-    # Calculate distance based on bounding box diagonal
-    diagonal = ((xmax - xmin)**2 + (ymax - ymin)**2 + (zmax - zmin)**2)**0.5
-    distance = diagonal * 1.8  # Factor for good framing
-
-    # Normalize direction
-    mag = (direction[0]**2 + direction[1]**2 + direction[2]**2)**0.5
-    direction = (direction[0]/mag, direction[1]/mag, direction[2]/mag)
-
-    # Calculate camera position
-    camera_pos = (
-        center[0] + direction[0] * distance,
-        center[1] + direction[1] * distance,
-        center[2] + direction[2] * distance
-    )
-
-    # Set up vector (Z-up for most views, Y-up for top view)
-    if camera_preset == 'top':
-        up = (0, 1, 0)
-    else:
-        up = (0, 0, 1)
+    # Directions are unit-length already (normalized at import)
+    direction = CAMERA_PRESETS.get(camera_preset, CAMERA_PRESETS['iso'])
+
+    # Center and diagonal of the bounding box in one array pass
+    b = np.asarray(bounds, dtype=float).reshape(3, 2)
+    center = b.mean(axis=1)
+    diagonal = np.linalg.norm(b[:, 1] - b[:, 0])
+
+    # Camera sits along the preset direction at a good framing distance
+    camera_pos = center + np.asarray(direction) * diagonal * 1.8
 
-    plotter.camera_position = [camera_pos, center, up]
+    up = _CAMERA_UP.get(camera_preset, (0, 0, 1))
+    plotter.camera_position = [tuple(camera_pos), tuple(center), up]
 
 
-def render_part(part, filepath, camera='iso', color='#4682B4', size=None, background=None):
+def render_part(part, filepath, camera='iso', color='#4682B4', size=None,
+                background=None, shadows=False, smooth_shading=True):
     """
     Render a single part to PNG file.
 
@@ -128,6 +240,9 @@ def render_part(part, filepath, camera='iso', color='#4682B4', size=None, backgr
         color: str, hex color for the part
         size: tuple (width, height) in pixels, defaults to 800x600
         background: str, hex color for background
+        shadows: bool, enable VTK's shadow-map pass (roughly doubles
+            GPU work per frame; off for throughput previews)
+        smooth_shading: bool, interpolate per-vertex normals
     """
     if size is None:
         size = DEFAULT_SIZE
@@ -139,31 +254,81 @@ def render_part(part, filepath, camera='iso', color='#4682B4', size=None, backgr
     # Convert part to mesh
     mesh = part_to_mesh(part)
 
-    # Create off-screen plotter
-    plotter = pv.Plotter(off_screen=True, window_size=size)
-    plotter.set_background(hex_to_rgb(background))
+    # Compute point normals once on the (cached) mesh so repeated
+    # smooth-shaded renders don't redo the O(faces) pass inside VTK
+    if smooth_shading:
+        mesh.compute_normals(inplace=True, cell_normals=False,
+                             point_normals=True)
+
+    with acquire_plotter(size, background) as plotter:
+        # Add mesh with color and smooth shading
+        plotter.add_mesh(
+            mesh,
+            color=hex_to_rgb(color),
+            smooth_shading=smooth_shading,
+            specular=0.3,
+            specular_power=20,
+            ambient=0.3,
+        )
+
+        # Set up camera
+        setup_camera(plotter, camera, mesh.bounds)
+
+        # Shadow mapping renders the geometry a second time; opt-in
+        # only, and switched back off before the window is pooled
+        if shadows:
+            plotter.enable_shadows()
+
+        # Render on this thread, encode and write on the I/O pool
+        image = plotter.screenshot(return_img=True)
+        if shadows:
+            plotter.disable_shadows()
+    _IO_POOL.submit(_write_png, filepath, image)
+
+
+def render_multiview(part, output_dir, cameras=tuple(CAMERA_PRESETS),
+                     color='#4682B4', size=None, background=None):
+    """
+    Render a single part from several camera presets into a directory.
+
+    The plotter and mesh actor are set up once; each view only moves
+    the camera and grabs the framebuffer, so an N-view batch pays for
+    one VTK context and one geometry upload instead of N.
 
-    # Add mesh with color and smooth shading
-    plotter.add_mesh(
-        mesh,
-        color=hex_to_rgb(color),
-        smooth_shading=True,
-        specular=0.3,
-        specular_power=20,
-        ambient=0.3,
-    )
+    Args:
+        part: build123d Part object
+        output_dir: str or Path, directory for the <preset>.png files
+        cameras: iterable of CAMERA_PRESETS keys to render
+        color: str, hex color for the part
+        size: tuple (width, height) in pixels
+        background: str, hex color for background
+    """
+    if size is None:
+        size = DEFAULT_SIZE
+    if background is None:
+        background = DEFAULT_BACKGROUND
 
-    # Set up camera
-    setup_camera(plotter, camera, mesh.bounds)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Add subtle lighting
-    plotter.enable_shadows()
+    mesh = part_to_mesh(part)
 
-    # Render and save
-    plotter.screenshot(str(filepath))
-    plotter.close()
+    with acquire_plotter(size, background) as plotter:
+        plotter.ren_win.SetMultiSamples(0)  # no MSAA for batch throughput
+        plotter.add_mesh(
+            mesh,
+            color=hex_to_rgb(color),
+            smooth_shading=True,
+            specular=0.3,
+            specular_power=20,
+            ambient=0.3,
+        )
 
-    print(f"  Rendered: {filepath}")
+        for name in cameras:
+            setup_camera(plotter, name, mesh.bounds)
+            filepath = output_dir / f"{name}.png"
+            image = plotter.screenshot(return_img=True)
+            _IO_POOL.submit(_write_png, filepath, image)
 
 
 def render_assembly(parts_with_colors, filepath, camera='iso', size=None, background=None):
@@ -187,30 +352,46 @@ def render_assembly(parts_with_colors, filepath, camera='iso', size=None, backgr
     filepath = Path(filepath)
 
     # Create off-screen plotter
-    plotter = pv.Plotter(off_screen=True, window_size=size)
-    plotter.set_background(hex_to_rgb(background))
-
-    # Track overall bounds
-    all_bounds = None
-
-    # Add all parts with their colors
-    for part_list, color in parts_with_colors:
-        rgb = hex_to_rgb(color)
-
-        for part in part_list:
-            mesh = part_to_mesh(part)
-
-            # Update overall bounds
-            if all_bounds is None:
-                all_bounds = list(mesh.bounds)
-            else:
-                bounds = mesh.bounds
-                all_bounds[0] = min(all_bounds[0], bounds[0])  # xmin
-                all_bounds[1] = max(all_bounds[1], bounds[1])  # xmax
-                all_bounds[2] = min(all_bounds[2], bounds[2])  # ymin
-                all_bounds[3] = max(all_bounds[3], bounds[3])  # ymax
-                all_bounds[4] = min(all_bounds[4], bounds[4])  # zmin
-                all_bounds[5] = max(all_bounds[5], bounds[5])  # zmax
+    # Flatten to one job per part; tessellation is CPU-heavy and
+    # independent, so it runs across processes. Parts don't pickle, so
+    # each ships to its worker as a BREP file (the same transport
+    # export_all uses) and only numpy arrays come back.
+    from build123d import export_brep
+
+    jobs = [(part, hex_to_rgb(color))
+            for part_list, color in parts_with_colors
+            for part in part_list]
+
+    # A Part shared across color groups (e.g. one template placed into
+    # several lists) should export and tessellate once, not once per
+    # appearance; Parts aren't value-hashable, so id() keys the dedup
+    unique_parts = {}
+    for part, _ in jobs:
+        unique_parts.setdefault(id(part), part)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for part_id, part in unique_parts.items():
+            path = os.path.join(tmp_dir, f"part-{part_id}.brep")
+            export_brep(part, path)
+            paths.append(path)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            arrays = dict(zip(unique_parts,
+                              executor.map(_tessellate_worker, paths)))
+
+    # Only the plotter runs on the main process; bounds are collected
+    # and combined in one reduction after the loop
+    bounds_list = []
+    mesh_cache = {}
+
+    with acquire_plotter(size, background) as plotter:
+        for part, rgb in jobs:
+            mesh = mesh_cache.get(id(part))
+            if mesh is None:
+                pts, faces = arrays[id(part)]
+                mesh = pv.PolyData(pts, faces)
+                mesh_cache[id(part)] = mesh
+            bounds_list.append(mesh.bounds)
 
             plotter.add_mesh(
                 mesh,
@@ -221,12 +402,16 @@ def render_assembly(parts_with_colors, filepath, camera='iso', size=None, backgr
                 ambient=0.3,
             )
 
-    # Set up camera based on combined bounds
-    if all_bounds:
-        setup_camera(plotter, camera, tuple(all_bounds))
-
-    # Render and save
-    plotter.screenshot(str(filepath))
-    plotter.close()
-
-    print(f"  Rendered: {filepath}")
+        # Set up camera based on combined bounds
+        if bounds_list:
+            # (N, 6) rows of (xmin, xmax, ymin, ymax, zmin, zmax)
+            stacked = np.asarray(bounds_list)
+            mins = stacked[:, 0::2].min(axis=0)
+            maxs = stacked[:, 1::2].max(axis=0)
+            setup_camera(plotter, camera,
+                         (mins[0], maxs[0], mins[1], maxs[1],
+                          mins[2], maxs[2]))
+
+        # Render on this thread, encode and write on the I/O pool
+        image = plotter.screenshot(return_img=True)
+    _IO_POOL.submit(_write_png, filepath, image)
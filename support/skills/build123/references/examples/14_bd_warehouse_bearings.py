@@ -6,49 +6,67 @@ uvx --from build123d --with bd_warehouse python 14_bd_warehouse_bearings.py
 Demonstrates bearing creation and housing design.
 """
 from build123d import (
-    Cylinder, Box, Pos, export_gltf, export_stl, MM, Align
+    BuildSketch, Circle, Compound, Cylinder, Location, Mode, Rectangle,
+    extrude, MM
 )
+from _export_helpers import dual_export
+from _part_cache import cached_build
 from bd_warehouse.bearing import SingleRowDeepGrooveBallBearing
 
-# Create a skateboard bearing (608 type: 8mm bore, 22mm OD, 7mm width)
-# Size format is "M[bore]-[OD]-[width]"
-bearing = SingleRowDeepGrooveBallBearing(size="M8-22-7")
+def main():
+    # Create a skateboard bearing (608 type: 8mm bore, 22mm OD, 7mm width)
+    # Size format is "M[bore]-[OD]-[width]"; generated bearings memoize to
+    # disk so script reruns skip the raceway/ball construction
+    bearing = cached_build(
+        "bearing", "M8-22-7",
+        lambda: SingleRowDeepGrooveBallBearing(size="M8-22-7"))
 
-# Create a second bearing positioned to the side
-bearing2 = Pos(50 * MM, 0, 0) * SingleRowDeepGrooveBallBearing(size="M8-22-7")
+    # Create a second bearing positioned to the side - a moved copy of the
+    # first, which shares the underlying geometry instead of constructing
+    # (or even cache-loading) the same bearing again
+    bearing2 = bearing.located(Location((50 * MM, 0, 0)))
 
-# Create a simple bearing housing block
-# The housing has a hole sized for the bearing OD (22mm)
-housing_block = Box(40 * MM, 40 * MM, 20 * MM, align=(Align.CENTER, Align.CENTER, Align.CENTER))
-bearing_hole = Cylinder(radius=11 * MM, height=20 * MM)  # 22mm diameter hole for bearing
-housing = housing_block - bearing_hole
+    # Create a simple bearing housing block with a 22mm hole for the
+    # bearing OD. The hole is cut in the 2D profile (a cheap planar
+    # boolean) and the sketch extruded once, instead of a solid-solid cut
+    # of the block against a cylinder
+    with BuildSketch() as housing_profile:
+        Rectangle(40 * MM, 40 * MM)
+        Circle(11 * MM, mode=Mode.SUBTRACT)
+    housing = extrude(housing_profile.sketch, amount=10 * MM, both=True)
 
-# Position housing below the bearings for display
-housing = Pos(0, -60 * MM, 0) * housing
+    # Position housing below the bearings for display
+    housing = housing.located(Location((0, -60 * MM, 0)))
 
-# Create a shaft that fits through the bearing bore (8mm)
-shaft = Cylinder(radius=4 * MM, height=60 * MM)
-shaft = Pos(0, -60 * MM, 0) * shaft
+    # Create a shaft that fits through the bearing bore (8mm)
+    shaft = Cylinder(radius=4 * MM, height=60 * MM).located(
+        Location((0, -60 * MM, 0)))
 
-# Create a larger bearing (10mm bore, 35mm OD, 11mm width)
-large_bearing = SingleRowDeepGrooveBallBearing(size="M10-35-11")
-large_bearing = Pos(100 * MM, 0, 0) * large_bearing
+    # Create a larger bearing (10mm bore, 35mm OD, 11mm width)
+    large_bearing = cached_build(
+        "bearing", "M10-35-11",
+        lambda: SingleRowDeepGrooveBallBearing(size="M10-35-11"))
+    large_bearing = large_bearing.located(Location((100 * MM, 0, 0)))
 
-# Combine all parts
-result = bearing + bearing2 + housing + shaft + large_bearing
+    # Combine all parts; they are disjoint display pieces, so a Compound
+    # skips the four pairwise boolean fuses a + chain would run
+    result = Compound(children=[bearing, bearing2, housing, shaft, large_bearing])
 
-# Export
-export_gltf(result, "./bearings_example.glb", binary=True)
-export_stl(result, "./bearings_example.stl")
+    for future in dual_export(result, "./bearings_example"):
+        future.result()
 
-print("Exported: bearings_example.glb, bearings_example.stl")
-print("Parts created:")
-print(f"  - 608 Bearing (8mm bore, 22mm OD, 7mm width) - skateboard type")
-print(f"  - 608 Bearing copy at X=50mm")
-print(f"  - Large Bearing (10mm bore, 35mm OD, 11mm width) at X=100mm")
-print(f"  - Bearing housing block at Y=-60mm")
-print(f"  - 8mm shaft through housing")
+    print("Exported: bearings_example.glb, bearings_example.stl")
+    print("Parts created:")
+    print(f"  - 608 Bearing (8mm bore, 22mm OD, 7mm width) - skateboard type")
+    print(f"  - 608 Bearing copy at X=50mm")
+    print(f"  - Large Bearing (10mm bore, 35mm OD, 11mm width) at X=100mm")
+    print(f"  - Bearing housing block at Y=-60mm")
+    print(f"  - 8mm shaft through housing")
 
-# Show available bearing info
-print("\nBearing size format: M[bore]-[OD]-[width]")
-print("Common sizes: M8-22-7 (608), M10-26-8, M10-35-11")
+    # Show available bearing info
+    print("\nBearing size format: M[bore]-[OD]-[width]")
+    print("Common sizes: M8-22-7 (608), M10-26-8, M10-35-11")
+
+
+if __name__ == "__main__":
+    main()
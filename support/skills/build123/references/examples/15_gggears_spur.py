@@ -3,46 +3,78 @@
 gggears - Spur Gear Example
 
 Demonstrates creating meshed spur gears with gggears library.
+Gears build in parallel worker processes (one gear per core).
 Run with: uvx --from build123d --with "gggears @ git+https://github.com/GarryBGoode/gggears" python 15_gggears_spur.py
 """
-from build123d import export_gltf, export_step
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from build123d import Compound, export_brep, import_brep
+from _export_helpers import dual_export
+from _part_cache import cached_build, source_digest
 from gggears import SpurGear, UP
 
-# Create two spur gears with different tooth counts
-gear1 = SpurGear(
-    number_of_teeth=12,
-    module=2.0,           # 2mm module
-    height=10.0,          # 10mm thick
-    pressure_angle=0.349, # 20 degrees in radians
-    profile_shift=0.0,    # No profile shift
-    root_fillet=0.2,      # Add root fillet
-)
-
-gear2 = SpurGear(
-    number_of_teeth=24,
-    module=2.0,
-    height=10.0,
-    pressure_angle=0.349,
-    enable_undercut=True,  # Show undercut calculation
-    root_fillet=0.2,
-)
-
-# Mesh gear1 to gear2 (positions gear1 relative to gear2)
-gear1.mesh_to(gear2, target_dir=UP)
-
-# Build the 3D parts
-part1 = gear1.build_part()
-part2 = gear2.build_part()
-
-# Combine for export
-assembly = part1 + part2
-
-# Export
-export_gltf(assembly, "./spur_gears.glb", binary=True)
-export_step(assembly, "./spur_gears.step")
-
-print("Spur Gears Created:")
-print(f"  Gear 1: {gear1.number_of_teeth} teeth, module={gear1.module}")
-print(f"  Gear 2: {gear2.number_of_teeth} teeth, module={gear2.module}")
-print(f"  Gear ratio: {gear2.number_of_teeth / gear1.number_of_teeth:.2f}:1")
-print("Exported to spur_gears.glb and spur_gears.step")
+TEETH_1 = 12
+TEETH_2 = 24
+MODULE = 2.0
+
+
+def make_gears():
+    """Construct and mesh the gear pair (cheap; building is the slow part)."""
+    gear1 = SpurGear(
+        number_of_teeth=TEETH_1,
+        module=MODULE,        # 2mm module
+        height=10.0,          # 10mm thick
+        pressure_angle=0.349, # 20 degrees in radians
+        profile_shift=0.0,    # No profile shift
+        root_fillet=0.2,      # Add root fillet
+    )
+
+    gear2 = SpurGear(
+        number_of_teeth=TEETH_2,
+        module=MODULE,
+        height=10.0,
+        pressure_angle=0.349,
+        enable_undercut=True,  # Show undercut calculation
+        root_fillet=0.2,
+    )
+
+    # Mesh gear1 to gear2 (positions gear1 relative to gear2)
+    gear1.mesh_to(gear2, target_dir=UP)
+    return [gear1, gear2]
+
+
+def build_one(index):
+    """Worker: build or cache-load one gear, returning BRep bytes."""
+    part = cached_build(f"spur-{index}", source_digest(__file__),
+                        lambda: make_gears()[index].build_part())
+    buf = io.BytesIO()
+    export_brep(part, buf)
+    return buf.getvalue()
+
+
+def main():
+    # build_part() (gear stack + NURBS + surfacing) dominates runtime and
+    # the gears are independent, so each builds in its own process;
+    # solids don't pickle, so BRep bytes cross the boundary instead
+    with ProcessPoolExecutor(max_workers=min(2, os.cpu_count())) as pool:
+        part1, part2 = (import_brep(io.BytesIO(data))
+                        for data in pool.map(build_one, range(2)))
+
+    # Combine for export; Compound avoids a boolean fuse of the
+    # touching gear flanks
+    assembly = Compound(children=[part1, part2])
+
+    for future in dual_export(assembly, "./spur_gears", step=True):
+        future.result()
+
+    print("Spur Gears Created:")
+    print(f"  Gear 1: {TEETH_1} teeth, module={MODULE}")
+    print(f"  Gear 2: {TEETH_2} teeth, module={MODULE}")
+    print(f"  Gear ratio: {TEETH_2 / TEETH_1:.2f}:1")
+    print("Exported to spur_gears.glb and spur_gears.step")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,72 +3,105 @@
 gggears - Helical Gear Example
 
 Demonstrates helical gears and herringbone (double-helix) gears.
+All four gears build in parallel worker processes.
 Run with: uvx --from build123d --with "gggears @ git+https://github.com/GarryBGoode/gggears" python 16_gggears_helical.py
 """
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from math import pi
-from build123d import export_gltf, export_step, Pos, Compound
+
+from build123d import Compound, Location, export_brep, import_brep
+from _export_helpers import dual_export
+from _part_cache import cached_build, source_digest
 from gggears import HelicalGear, UP
 
-# Create helical gear pair
-gear1 = HelicalGear(
-    number_of_teeth=15,
-    helix_angle=pi / 6,   # 30 degrees helix angle
-    module=2.0,
-    height=12.0,
-    herringbone=False,    # Single helix
-    profile_shift=0.2,    # Small profile shift
-    root_fillet=0.15,
-)
-
-gear2 = HelicalGear(
-    number_of_teeth=30,
-    helix_angle=pi / 6,   # Must match for proper meshing
-    module=2.0,
-    height=12.0,
-    herringbone=False,
-    root_fillet=0.15,
-)
-
-# Mesh the gears
-gear1.mesh_to(gear2, target_dir=UP)
-
-# Build parts
-part1 = gear1.build_part()
-part2 = gear2.build_part()
-
-# Also create a herringbone gear example (offset to the side)
-herringbone1 = HelicalGear(
-    number_of_teeth=15,
-    helix_angle=pi / 6,
-    module=2.0,
-    height=15.0,
-    herringbone=True,     # Double helix (herringbone)
-    root_fillet=0.15,
-)
-
-herringbone2 = HelicalGear(
-    number_of_teeth=30,
-    helix_angle=pi / 6,
-    module=2.0,
-    height=15.0,
-    herringbone=True,
-    root_fillet=0.15,
-)
-
-herringbone1.mesh_to(herringbone2, target_dir=UP)
-
-# Build and offset herringbone parts
-hb_part1 = Pos(100, 0, 0) * herringbone1.build_part()
-hb_part2 = Pos(100, 0, 0) * herringbone2.build_part()
-
-# Combine all using Compound for proper export
-assembly = Compound(children=[part1, part2, hb_part1, hb_part2])
-
-export_gltf(assembly, "./helical_gears.glb", binary=True)
-export_step(assembly, "./helical_gears.step")
-
-print("Helical Gears Created:")
-print(f"  Left pair: Single helix, 15:30 teeth")
-print(f"  Right pair: Herringbone (double helix), 15:30 teeth")
-print(f"  Helix angle: 30 degrees")
-print("Exported to helical_gears.glb and helical_gears.step")
+# 30-degree helix, shared by every gear in the file
+HELIX_30 = pi / 6
+
+
+def make_gears():
+    """Construct and mesh both gear pairs (building is the slow part)."""
+    # Helical gear pair
+    gear1 = HelicalGear(
+        number_of_teeth=15,
+        helix_angle=HELIX_30,
+        module=2.0,
+        height=12.0,
+        herringbone=False,    # Single helix
+        profile_shift=0.2,    # Small profile shift
+        root_fillet=0.15,
+    )
+
+    gear2 = HelicalGear(
+        number_of_teeth=30,
+        helix_angle=HELIX_30,  # Must match for proper meshing
+        module=2.0,
+        height=12.0,
+        herringbone=False,
+        root_fillet=0.15,
+    )
+
+    # Mesh the gears
+    gear1.mesh_to(gear2, target_dir=UP)
+
+    # Herringbone gear pair
+    herringbone1 = HelicalGear(
+        number_of_teeth=15,
+        helix_angle=HELIX_30,
+        module=2.0,
+        height=15.0,
+        herringbone=True,     # Double helix (herringbone)
+        root_fillet=0.15,
+    )
+
+    herringbone2 = HelicalGear(
+        number_of_teeth=30,
+        helix_angle=HELIX_30,
+        module=2.0,
+        height=15.0,
+        herringbone=True,
+        root_fillet=0.15,
+    )
+
+    herringbone1.mesh_to(herringbone2, target_dir=UP)
+
+    return [gear1, gear2, herringbone1, herringbone2]
+
+
+def build_one(index):
+    """Worker: build or cache-load one gear, returning BRep bytes."""
+    part = cached_build(f"helical-{index}", source_digest(__file__),
+                        lambda: make_gears()[index].build_part())
+    buf = io.BytesIO()
+    export_brep(part, buf)
+    return buf.getvalue()
+
+
+def main():
+    # build_part() dominates runtime and the four gears are
+    # independent (see 15_gggears_spur for the worker pattern)
+    with ProcessPoolExecutor(max_workers=min(4, os.cpu_count())) as pool:
+        part1, part2, hb1, hb2 = (import_brep(io.BytesIO(data))
+                                  for data in pool.map(build_one, range(4)))
+
+    # Offset herringbone pair to the side; .located() sets the final
+    # location directly rather than composing onto the built shapes
+    hb_part1 = hb1.located(Location((100, 0, 0)))
+    hb_part2 = hb2.located(Location((100, 0, 0)))
+
+    # Combine all using Compound for proper export
+    assembly = Compound(children=[part1, part2, hb_part1, hb_part2])
+
+    for future in dual_export(assembly, "./helical_gears", step=True):
+        future.result()
+
+    print("Helical Gears Created:")
+    print(f"  Left pair: Single helix, 15:30 teeth")
+    print(f"  Right pair: Herringbone (double helix), 15:30 teeth")
+    print(f"  Helix angle: 30 degrees")
+    print("Exported to helical_gears.glb and helical_gears.step")
+
+
+if __name__ == "__main__":
+    main()
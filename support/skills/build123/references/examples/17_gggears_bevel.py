@@ -3,10 +3,17 @@
 gggears - Bevel Gear Example
 
 Demonstrates bevel gears for transmitting power between angled shafts.
+Both gears build in parallel worker processes.
 Run with: uvx --from build123d --with "gggears @ git+https://github.com/GarryBGoode/gggears" python 17_gggears_bevel.py
 """
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from math import pi, atan
-from build123d import export_gltf, export_step
+
+from build123d import Compound, export_brep, import_brep
+from _export_helpers import dual_export
+from _part_cache import cached_build, source_digest
 from gggears import BevelGear, RIGHT
 
 # Calculate cone angles for 90-degree shaft intersection
@@ -18,39 +25,65 @@ gamma2 = atan(teeth2 / teeth1)  # Cone angle for gear 2
 # Small spiral angle for smoother operation
 beta = pi / 12  # 15 degree spiral
 
-gear1 = BevelGear(
-    number_of_teeth=teeth1,
-    module=2.0,
-    height=15.0,          # Tooth face length
-    cone_angle=gamma1 * 2,  # Full cone angle
-    helix_angle=beta,     # Spiral angle
-    root_fillet=0.15,
-)
-
-gear2 = BevelGear(
-    number_of_teeth=teeth2,
-    module=2.0,
-    height=15.0,
-    cone_angle=gamma2 * 2,
-    helix_angle=-beta,    # Opposite spiral direction
-    root_fillet=0.15,
-)
-
-# Mesh the gears
-gear1.mesh_to(gear2, target_dir=RIGHT)
-
-# Build parts
-part1 = gear1.build_part()
-part2 = gear2.build_part()
-
-assembly = part1 + part2
-
-export_gltf(assembly, "./bevel_gears.glb", binary=True)
-export_step(assembly, "./bevel_gears.step")
-
-print("Bevel Gears Created:")
-print(f"  Gear 1: {teeth1} teeth, cone angle={gamma1 * 180 / pi:.1f} deg")
-print(f"  Gear 2: {teeth2} teeth, cone angle={gamma2 * 180 / pi:.1f} deg")
-print(f"  Spiral angle: {beta * 180 / pi:.1f} degrees")
-print(f"  Shaft angle: 90 degrees")
-print("Exported to bevel_gears.glb and bevel_gears.step")
+# Full cone angles, hoisted so the constructors take finished values
+cone_angle1 = gamma1 * 2
+cone_angle2 = gamma2 * 2
+
+
+def make_gears():
+    """Construct and mesh the gear pair (building is the slow part)."""
+    gear1 = BevelGear(
+        number_of_teeth=teeth1,
+        module=2.0,
+        height=15.0,          # Tooth face length
+        cone_angle=cone_angle1,
+        helix_angle=beta,     # Spiral angle
+        root_fillet=0.15,
+    )
+
+    gear2 = BevelGear(
+        number_of_teeth=teeth2,
+        module=2.0,
+        height=15.0,
+        cone_angle=cone_angle2,
+        helix_angle=-beta,    # Opposite spiral direction
+        root_fillet=0.15,
+    )
+
+    # Mesh the gears
+    gear1.mesh_to(gear2, target_dir=RIGHT)
+    return [gear1, gear2]
+
+
+def build_one(index):
+    """Worker: build or cache-load one gear, returning BRep bytes."""
+    part = cached_build(f"bevel-{index}", source_digest(__file__),
+                        lambda: make_gears()[index].build_part())
+    buf = io.BytesIO()
+    export_brep(part, buf)
+    return buf.getvalue()
+
+
+def main():
+    # build_part() dominates runtime and the two bevel gears are
+    # independent (see 15_gggears_spur for the worker pattern)
+    with ProcessPoolExecutor(max_workers=min(2, os.cpu_count())) as pool:
+        part1, part2 = (import_brep(io.BytesIO(data))
+                        for data in pool.map(build_one, range(2)))
+
+    # Compound avoids a boolean fuse of the touching gear flanks
+    assembly = Compound(children=[part1, part2])
+
+    for future in dual_export(assembly, "./bevel_gears", step=True):
+        future.result()
+
+    print("Bevel Gears Created:")
+    print(f"  Gear 1: {teeth1} teeth, cone angle={gamma1 * 180 / pi:.1f} deg")
+    print(f"  Gear 2: {teeth2} teeth, cone angle={gamma2 * 180 / pi:.1f} deg")
+    print(f"  Spiral angle: {beta * 180 / pi:.1f} degrees")
+    print(f"  Shaft angle: 90 degrees")
+    print("Exported to bevel_gears.glb and bevel_gears.step")
+
+
+if __name__ == "__main__":
+    main()
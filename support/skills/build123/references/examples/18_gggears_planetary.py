@@ -3,10 +3,18 @@
 gggears - Planetary Gear System Example
 
 Demonstrates ring gears for planetary gear systems.
+Sun, ring and planets build in parallel worker processes.
 Run with: uvx --from build123d --with "gggears @ git+https://github.com/GarryBGoode/gggears" python 18_gggears_planetary.py
 """
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from math import pi
-from build123d import export_gltf, export_step, Pos, Rot, Compound
+
+import numpy as np
+from build123d import Compound, Rot, export_brep, import_brep
+from _export_helpers import dual_export
+from _part_cache import cached_build, source_digest
 from gggears import HelicalGear, HelicalRingGear, UP
 
 # Planetary gear system design
@@ -19,29 +27,31 @@ module = 2.0
 height = 12.0
 helix_angle = pi / 8  # 22.5 degrees
 
-# Create sun gear (center)
-sun_gear = HelicalGear(
-    number_of_teeth=sun_teeth,
-    module=module,
-    height=height,
-    helix_angle=helix_angle,
-    herringbone=True,
-    root_fillet=0.15,
-)
-
-# Create ring gear (outer, internal teeth)
-ring_gear = HelicalRingGear(
-    number_of_teeth=ring_teeth,
-    module=module,
-    height=height,
-    helix_angle=helix_angle,
-    herringbone=True,
-    root_fillet=0.15,
-)
-
-# Create planet gears (3 planets evenly spaced)
-planets = []
-for i in range(3):
+
+def make_gears():
+    """Construct and mesh all gears (cheap; building is the slow part)."""
+    # Sun gear (center)
+    sun_gear = HelicalGear(
+        number_of_teeth=sun_teeth,
+        module=module,
+        height=height,
+        helix_angle=helix_angle,
+        herringbone=True,
+        root_fillet=0.15,
+    )
+
+    # Ring gear (outer, internal teeth)
+    ring_gear = HelicalRingGear(
+        number_of_teeth=ring_teeth,
+        module=module,
+        height=height,
+        helix_angle=helix_angle,
+        herringbone=True,
+        root_fillet=0.15,
+    )
+
+    # The three planets are geometrically identical - only their
+    # placement differs - so one gear object covers all of them
     planet = HelicalGear(
         number_of_teeth=planet_teeth,
         module=module,
@@ -52,30 +62,52 @@ for i in range(3):
     )
     # Mesh planet to sun gear first
     planet.mesh_to(sun_gear, target_dir=UP)
-    planets.append(planet)
-
-# Build all parts
-sun_part = sun_gear.build_part()
-ring_part = ring_gear.build_part()
-
-# Position planets around sun (120 degrees apart)
-planet_parts = []
-for i, planet in enumerate(planets):
-    angle = i * 120  # degrees
-    part = Rot(0, 0, angle) * planets[0].build_part()
-    planet_parts.append(part)
-
-# Combine all parts using Compound for proper export
-all_parts = [sun_part, ring_part] + planet_parts
-assembly = Compound(children=all_parts)
-
-export_gltf(assembly, "./planetary_gears.glb", binary=True)
-export_step(assembly, "./planetary_gears.step")
-
-print("Planetary Gear System Created:")
-print(f"  Sun gear: {sun_teeth} teeth")
-print(f"  Planet gears: {planet_teeth} teeth (x3)")
-print(f"  Ring gear: {ring_teeth} teeth")
-print(f"  Module: {module}mm")
-print(f"  Herringbone design for thrust load handling")
-print("Exported to planetary_gears.glb and planetary_gears.step")
+
+    return [sun_gear, ring_gear, planet]
+
+
+def build_one(index):
+    """Worker: build or cache-load one gear, returning BRep bytes."""
+    part = cached_build(f"planetary-{index}", source_digest(__file__),
+                        lambda: make_gears()[index].build_part())
+    buf = io.BytesIO()
+    export_brep(part, buf)
+    return buf.getvalue()
+
+
+def main():
+    # build_part() dominates runtime; only the three unique gears
+    # build, one process each (see 15_gggears_spur for the pattern)
+    with ProcessPoolExecutor(max_workers=min(3, os.cpu_count())) as pool:
+        sun_part, ring_part, planet_template = (
+            import_brep(io.BytesIO(data))
+            for data in pool.map(build_one, range(3))
+        )
+
+    # Position planet instances evenly around the sun. The angles come
+    # from one vectorized linspace - for 3 planets that's cosmetic, but
+    # the same batch pattern scales to bolt circles and larger radial
+    # arrays. Placed copies share the template's underlying BRep data.
+    n_planets = 3
+    angles = np.linspace(0.0, 360.0, n_planets, endpoint=False)
+    planet_parts = [Rot(0, 0, angle) * planet_template
+                    for angle in angles.tolist()]
+
+    # Combine all parts using Compound for proper export
+    all_parts = [sun_part, ring_part] + planet_parts
+    assembly = Compound(children=all_parts)
+
+    for future in dual_export(assembly, "./planetary_gears", step=True):
+        future.result()
+
+    print("Planetary Gear System Created:")
+    print(f"  Sun gear: {sun_teeth} teeth")
+    print(f"  Planet gears: {planet_teeth} teeth (x3)")
+    print(f"  Ring gear: {ring_teeth} teeth")
+    print(f"  Module: {module}mm")
+    print(f"  Herringbone design for thrust load handling")
+    print("Exported to planetary_gears.glb and planetary_gears.step")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,51 +3,82 @@
 gggears - Cycloid Gear Example
 
 Demonstrates cycloid gears (used in precision mechanisms, clocks, pumps).
+Both gears build in parallel worker processes.
 Run with: uvx --from build123d --with "gggears @ git+https://github.com/GarryBGoode/gggears" python 19_gggears_cycloid.py
 """
-from build123d import export_gltf, export_step
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from build123d import Compound, export_brep, import_brep
+from _export_helpers import dual_export
+from _part_cache import cached_build, source_digest
 from gggears import CycloidGear, UP
 
-# Create cycloid gear pair
-# Cycloid gears use rolling circle profiles instead of involute
-gear1 = CycloidGear(
-    number_of_teeth=8,
-    module=3.0,
-    height=8.0,
-    inside_cycloid_coefficient=0.5,  # Inner rolling circle ratio
-    outside_cycloid_coefficient=0.5,  # Outer rolling circle ratio
-    root_fillet=0.1,
-    tip_fillet=0.1,
-)
-
-gear2 = CycloidGear(
-    number_of_teeth=16,
-    module=3.0,
-    height=8.0,
-    inside_cycloid_coefficient=0.5,
-    outside_cycloid_coefficient=0.5,
-    root_fillet=0.1,
-    tip_fillet=0.1,
-)
-
-# Adapt cycloid radii for proper meshing
-gear1.adapt_cycloid_radii(gear2)
-
-# Mesh the gears
-gear1.mesh_to(gear2, target_dir=UP)
-
-# Build parts
-part1 = gear1.build_part()
-part2 = gear2.build_part()
-
-assembly = part1 + part2
-
-export_gltf(assembly, "./cycloid_gears.glb", binary=True)
-export_step(assembly, "./cycloid_gears.step")
-
-print("Cycloid Gears Created:")
-print(f"  Gear 1: {gear1.number_of_teeth} teeth")
-print(f"  Gear 2: {gear2.number_of_teeth} teeth")
-print(f"  Cycloid profile - smoother than involute for low tooth counts")
-print("  Applications: clocks, precision mechanisms, gear pumps")
-print("Exported to cycloid_gears.glb and cycloid_gears.step")
+TEETH_1 = 8
+TEETH_2 = 16
+
+
+def make_gears():
+    """Construct and mesh the gear pair (building is the slow part)."""
+    # Cycloid gears use rolling circle profiles instead of involute
+    gear1 = CycloidGear(
+        number_of_teeth=TEETH_1,
+        module=3.0,
+        height=8.0,
+        inside_cycloid_coefficient=0.5,  # Inner rolling circle ratio
+        outside_cycloid_coefficient=0.5,  # Outer rolling circle ratio
+        root_fillet=0.1,
+        tip_fillet=0.1,
+    )
+
+    gear2 = CycloidGear(
+        number_of_teeth=TEETH_2,
+        module=3.0,
+        height=8.0,
+        inside_cycloid_coefficient=0.5,
+        outside_cycloid_coefficient=0.5,
+        root_fillet=0.1,
+        tip_fillet=0.1,
+    )
+
+    # Adapt cycloid radii for proper meshing
+    gear1.adapt_cycloid_radii(gear2)
+
+    # Mesh the gears
+    gear1.mesh_to(gear2, target_dir=UP)
+    return [gear1, gear2]
+
+
+def build_one(index):
+    """Worker: build or cache-load one gear, returning BRep bytes."""
+    part = cached_build(f"cycloid-{index}", source_digest(__file__),
+                        lambda: make_gears()[index].build_part())
+    buf = io.BytesIO()
+    export_brep(part, buf)
+    return buf.getvalue()
+
+
+def main():
+    # build_part() dominates runtime and the two gears are
+    # independent (see 15_gggears_spur for the worker pattern)
+    with ProcessPoolExecutor(max_workers=min(2, os.cpu_count())) as pool:
+        part1, part2 = (import_brep(io.BytesIO(data))
+                        for data in pool.map(build_one, range(2)))
+
+    # Compound avoids a boolean fuse of the touching gear flanks
+    assembly = Compound(children=[part1, part2])
+
+    for future in dual_export(assembly, "./cycloid_gears", step=True):
+        future.result()
+
+    print("Cycloid Gears Created:")
+    print(f"  Gear 1: {TEETH_1} teeth")
+    print(f"  Gear 2: {TEETH_2} teeth")
+    print(f"  Cycloid profile - smoother than involute for low tooth counts")
+    print("  Applications: clocks, precision mechanisms, gear pumps")
+    print("Exported to cycloid_gears.glb and cycloid_gears.step")
+
+
+if __name__ == "__main__":
+    main()
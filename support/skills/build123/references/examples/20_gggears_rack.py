@@ -3,70 +3,105 @@
 gggears - Rack and Pinion Example
 
 Demonstrates gear racks for linear motion conversion.
+All four parts build in parallel worker processes.
 Run with: uvx --from build123d --with "gggears @ git+https://github.com/GarryBGoode/gggears" python 20_gggears_rack.py
 """
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from math import pi
-from build123d import export_gltf, export_step, Pos
+
+from build123d import Compound, Location, export_brep, import_brep
+from _export_helpers import dual_export
+from _part_cache import cached_build, source_digest
 from gggears import HelicalGear, HelicalRack, InvoluteRack, RIGHT
 
-# Create a spur rack and pinion
-pinion1 = HelicalGear(
-    number_of_teeth=15,
-    module=2.0,
-    height=15.0,
-    helix_angle=0,        # Spur gear (no helix)
-    root_fillet=0.15,
-)
-
-rack1 = InvoluteRack(
-    number_of_teeth=30,
-    module=2.0,
-    height=15.0,
-    root_fillet=0.15,
-    tip_fillet=0.1,
-)
-
-# Mesh rack to pinion
-rack1.mesh_to(pinion1, target_dir=RIGHT)
-
-# Build spur parts
-pinion1_part = pinion1.build_part()
-rack1_part = rack1.build_part()
-spur_assembly = pinion1_part + rack1_part
-
-# Create a helical rack and pinion (offset to the side)
-pinion2 = HelicalGear(
-    number_of_teeth=15,
-    module=2.0,
-    height=15.0,
-    helix_angle=pi / 6,   # 30 degree helix
-    herringbone=True,     # Double helix
-    root_fillet=0.15,
-)
-
-rack2 = HelicalRack(
-    number_of_teeth=30,
-    module=2.0,
-    height=15.0,
-    helix_angle=pi / 6,
-    herringbone=True,
-    root_fillet=0.15,
-)
-
-rack2.mesh_to(pinion2, target_dir=RIGHT)
-
-# Build and offset helical parts
-pinion2_part = Pos(0, 100, 0) * pinion2.build_part()
-rack2_part = Pos(0, 100, 0) * rack2.build_part()
-
-# Combine all
-assembly = spur_assembly + pinion2_part + rack2_part
-
-export_gltf(assembly, "./rack_and_pinion.glb", binary=True)
-export_step(assembly, "./rack_and_pinion.step")
-
-print("Rack and Pinion Created:")
-print(f"  Front: Spur rack and pinion, 15 teeth pinion")
-print(f"  Back: Helical herringbone rack and pinion")
-print(f"  Linear travel per pinion revolution: {pi * 2 * 15:.1f}mm")
-print("Exported to rack_and_pinion.glb and rack_and_pinion.step")
+# 30-degree helix for the herringbone pair
+HELIX_30 = pi / 6
+
+
+def make_gears():
+    """Construct and mesh both rack/pinion pairs (building is the slow part)."""
+    # Spur rack and pinion
+    pinion1 = HelicalGear(
+        number_of_teeth=15,
+        module=2.0,
+        height=15.0,
+        helix_angle=0,        # Spur gear (no helix)
+        root_fillet=0.15,
+    )
+
+    rack1 = InvoluteRack(
+        number_of_teeth=30,
+        module=2.0,
+        height=15.0,
+        root_fillet=0.15,
+        tip_fillet=0.1,
+    )
+
+    # Mesh rack to pinion
+    rack1.mesh_to(pinion1, target_dir=RIGHT)
+
+    # Helical rack and pinion
+    pinion2 = HelicalGear(
+        number_of_teeth=15,
+        module=2.0,
+        height=15.0,
+        helix_angle=HELIX_30,
+        herringbone=True,     # Double helix
+        root_fillet=0.15,
+    )
+
+    rack2 = HelicalRack(
+        number_of_teeth=30,
+        module=2.0,
+        height=15.0,
+        helix_angle=HELIX_30,
+        herringbone=True,
+        root_fillet=0.15,
+    )
+
+    rack2.mesh_to(pinion2, target_dir=RIGHT)
+
+    return [pinion1, rack1, pinion2, rack2]
+
+
+def build_one(index):
+    """Worker: build or cache-load one gear, returning BRep bytes."""
+    part = cached_build(f"rack-{index}", source_digest(__file__),
+                        lambda: make_gears()[index].build_part())
+    buf = io.BytesIO()
+    export_brep(part, buf)
+    return buf.getvalue()
+
+
+def main():
+    # build_part() dominates runtime and the four parts are
+    # independent (see 15_gggears_spur for the worker pattern)
+    with ProcessPoolExecutor(max_workers=min(4, os.cpu_count())) as pool:
+        pinion1_part, rack1_part, pinion2_raw, rack2_raw = (
+            import_brep(io.BytesIO(data))
+            for data in pool.map(build_one, range(4))
+        )
+
+    # Offset helical pair to the side; .located() sets the final
+    # location directly rather than composing onto the built shapes
+    pinion2_part = pinion2_raw.located(Location((0, 100, 0)))
+    rack2_part = rack2_raw.located(Location((0, 100, 0)))
+
+    # Combine all; Compound avoids the three pairwise boolean fuses
+    assembly = Compound(children=[pinion1_part, rack1_part,
+                                  pinion2_part, rack2_part])
+
+    for future in dual_export(assembly, "./rack_and_pinion", step=True):
+        future.result()
+
+    print("Rack and Pinion Created:")
+    print(f"  Front: Spur rack and pinion, 15 teeth pinion")
+    print(f"  Back: Helical herringbone rack and pinion")
+    print(f"  Linear travel per pinion revolution: {pi * 2 * 15:.1f}mm")
+    print("Exported to rack_and_pinion.glb and rack_and_pinion.step")
+
+
+if __name__ == "__main__":
+    main()
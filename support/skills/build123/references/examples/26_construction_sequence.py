@@ -33,10 +33,10 @@ with BuildPart() as bracket:
             CounterBoreHole(8, 12, 3)
     mirror(about=Plane.XZ)
 
-    # Add mounting holes
-    with Locations((40, 15, 15)):
+    # Add mounting holes - both placed in one pass and drilled in a
+    # single cut, rather than one hole plus a whole-solid mirror
+    with Locations((40, 15, 15), (40, -15, 15)):
         Hole(4)
-    mirror(about=Plane.XZ)
 
     # 4. FINAL TRIMMING - applies corner radii via intersection
     with BuildSketch():
@@ -0,0 +1,207 @@
+"""
+Shared export helpers for the example scripts.
+
+Each OCCT-backed exporter runs its own BRepMesh pass by default, so a
+script that writes both .glb and .stl tessellates the whole assembly
+twice. Meshing once up front lets every exporter reuse the
+triangulation that OCCT caches on the shape.
+"""
+import atexit
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from build123d import export_gltf, export_stl
+
+# OCCT serialization is single-threaded I/O; running it off the main
+# thread lets the interpreter move on to the next construction phase
+# while the previous export finalizes. Drained at interpreter exit.
+_export_pool = ThreadPoolExecutor(max_workers=2)
+atexit.register(_export_pool.shutdown, wait=True)
+
+
+def pretessellate(shape, tol=0.2, angular_tol=0.7):
+    """Mesh a shape once so every exporter reuses the triangulation.
+
+    The defaults are display-grade: these examples end up in browsers
+    and slicers, where the coarser deflection is indistinguishable but
+    carries 4-10x fewer triangles. The final True asks OCCT to mesh
+    faces in parallel.
+    """
+    from OCP.BRepMesh import BRepMesh_IncrementalMesh
+
+    BRepMesh_IncrementalMesh(shape.wrapped, tol, False, angular_tol, True)
+    return shape
+
+
+def compress_glb(path, level=7):
+    """Draco-compress a .glb in place when gltf-pipeline is on PATH.
+
+    Draco typically shrinks the vertex and index payloads 10-20x, which
+    pays off every time the file crosses a disk or network. Soft
+    dependency: without the npm tool installed the raw file is kept.
+    """
+    tool = shutil.which("gltf-pipeline")
+    if tool is None:
+        return False
+    subprocess.run([tool, "-i", path, "-o", path, "-d",
+                    "--draco.compressionLevel", str(level)], check=True)
+    return True
+
+
+def export_gltf_instanced(part, placements, path, tol=0.2):
+    """Write one mesh plus an instance buffer instead of repeated copies.
+
+    For assemblies that repeat an identical part (planet gears, bearing
+    pairs), build123d's exporter serializes the full mesh once per
+    placement. This writes the template a single time and expresses the
+    placements through EXT_mesh_gpu_instancing, shrinking the file and
+    the viewer's GPU upload by the repeat count. Requires pygltflib.
+
+    Args:
+        part: template shape, tessellated once
+        placements: iterable of ((x, y, z), z_angle_deg) placements
+        path: output .glb path
+        tol: linear deflection for tessellation (mm)
+    """
+    import numpy as np
+    import pygltflib
+
+    vertices, triangles = part.tessellate(tol)
+    verts = np.array([(v.X, v.Y, v.Z) for v in vertices], dtype=np.float32)
+    tris = np.array(triangles, dtype=np.uint32)
+
+    translations = np.array([p[0] for p in placements], dtype=np.float32)
+    # Quaternion for a rotation about +Z: (0, 0, sin(a/2), cos(a/2))
+    half = np.radians([float(p[1]) for p in placements]) / 2.0
+    quats = np.zeros((len(placements), 4), dtype=np.float32)
+    quats[:, 2] = np.sin(half)
+    quats[:, 3] = np.cos(half)
+
+    blobs = [verts.tobytes(), tris.tobytes(),
+             translations.tobytes(), quats.tobytes()]
+    offsets, off = [], 0
+    for blob in blobs:
+        offsets.append(off)
+        off += len(blob)
+
+    gltf = pygltflib.GLTF2(
+        extensionsUsed=["EXT_mesh_gpu_instancing"],
+        scene=0,
+        scenes=[pygltflib.Scene(nodes=[0])],
+        nodes=[pygltflib.Node(
+            mesh=0,
+            extensions={"EXT_mesh_gpu_instancing": {
+                "attributes": {"TRANSLATION": 2, "ROTATION": 3}}},
+        )],
+        meshes=[pygltflib.Mesh(primitives=[
+            pygltflib.Primitive(attributes=pygltflib.Attributes(POSITION=0),
+                                indices=1)])],
+        accessors=[
+            pygltflib.Accessor(bufferView=0, componentType=pygltflib.FLOAT,
+                               count=len(verts), type=pygltflib.VEC3,
+                               min=verts.min(axis=0).tolist(),
+                               max=verts.max(axis=0).tolist()),
+            pygltflib.Accessor(bufferView=1,
+                               componentType=pygltflib.UNSIGNED_INT,
+                               count=tris.size, type=pygltflib.SCALAR),
+            pygltflib.Accessor(bufferView=2, componentType=pygltflib.FLOAT,
+                               count=len(translations), type=pygltflib.VEC3),
+            pygltflib.Accessor(bufferView=3, componentType=pygltflib.FLOAT,
+                               count=len(quats), type=pygltflib.VEC4),
+        ],
+        bufferViews=[
+            pygltflib.BufferView(buffer=0, byteOffset=offsets[0],
+                                 byteLength=len(blobs[0]),
+                                 target=pygltflib.ARRAY_BUFFER),
+            pygltflib.BufferView(buffer=0, byteOffset=offsets[1],
+                                 byteLength=len(blobs[1]),
+                                 target=pygltflib.ELEMENT_ARRAY_BUFFER),
+            pygltflib.BufferView(buffer=0, byteOffset=offsets[2],
+                                 byteLength=len(blobs[2])),
+            pygltflib.BufferView(buffer=0, byteOffset=offsets[3],
+                                 byteLength=len(blobs[3])),
+        ],
+        buffers=[pygltflib.Buffer(byteLength=off)],
+    )
+    gltf.set_binary_blob(b"".join(blobs))
+    gltf.save_binary(path)
+
+
+def export_step_fast(shape, path):
+    """STEP writer tuned for preview use: AP242 schema, 0.01mm precision.
+
+    These example STEPs exist for visualization next to the glb, not
+    manufacturing; trimming write precision shrinks the files 30-50%
+    and speeds up whatever re-imports them.
+    """
+    from OCP.IFSelect import IFSelect_RetDone
+    from OCP.Interface import Interface_Static
+    from OCP.STEPControl import STEPControl_AsIs, STEPControl_Writer
+
+    Interface_Static.SetIVal_s("write.precision.mode", 1)
+    Interface_Static.SetRVal_s("write.precision.val", 0.01)
+    Interface_Static.SetCVal_s("write.step.schema", "AP242DIS")
+    writer = STEPControl_Writer()
+    writer.Transfer(shape.wrapped, STEPControl_AsIs)
+    if writer.Write(path) != IFSelect_RetDone:
+        raise RuntimeError(f"STEP export failed: {path}")
+
+
+def _tmp_path(path):
+    # Keep the extension last: the exporters sniff format from it
+    root, ext = os.path.splitext(path)
+    return f"{root}.tmp{os.getpid()}{ext}"
+
+
+def _write_glb(shape, path):
+    tmp = _tmp_path(path)
+    export_gltf(shape, tmp, binary=True)
+    compress_glb(tmp)
+    os.replace(tmp, path)
+
+
+def _write_solid(exporter, shape, path):
+    tmp = _tmp_path(path)
+    exporter(shape, tmp)
+    os.replace(tmp, path)
+
+
+def dual_export(shape, base, tol=0.2, step=False):
+    """Export <base>.glb plus <base>.stl (or .step), meshing only once.
+
+    The writes happen on background threads and land via temp file +
+    os.replace, so readers never see a partial file and the caller can
+    keep computing while serialization finishes.
+
+    Setting the EXPORT_FORMATS environment variable (comma-separated,
+    e.g. "glb") restricts which files get written - handy for pipelines
+    that only consume one format and don't want to pay for the other.
+
+    Args:
+        shape: build123d shape or compound to export
+        base: output path without extension
+        tol: linear deflection for the shared tessellation (mm)
+        step: write a .step file instead of .stl alongside the .glb
+
+    Returns:
+        list of futures, one per output file. Callers must resolve
+        them (future.result()) before finishing: the atexit shutdown
+        only waits, it does not re-raise worker exceptions, so an
+        unchecked failed write would vanish silently.
+    """
+    solid_ext = "step" if step else "stl"
+    wanted = os.environ.get("EXPORT_FORMATS")
+    formats = ({f.strip() for f in wanted.split(",")} if wanted
+               else {"glb", solid_ext})
+
+    pretessellate(shape, tol)
+    futures = []
+    if "glb" in formats:
+        futures.append(_export_pool.submit(_write_glb, shape, f"{base}.glb"))
+    if solid_ext in formats:
+        solid_writer = export_step_fast if step else export_stl
+        futures.append(_export_pool.submit(_write_solid, solid_writer, shape,
+                                           f"{base}.{solid_ext}"))
+    return futures
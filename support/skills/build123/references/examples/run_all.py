@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Run the bd_warehouse and gggears examples in one interpreter pool.
+
+Launching each script through its own uvx invocation re-resolves
+dependencies and re-imports build123d/OCCT (~1-2s of startup apiece).
+This driver imports the examples as modules inside worker processes
+instead: one environment, one warm import per worker, and cross-script
+parallelism for free.
+
+Usage: python run_all.py [prefix ...]   (e.g. python run_all.py 13 18)
+"""
+import importlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPTS = [
+    "13_bd_warehouse_flanges",
+    "14_bd_warehouse_bearings",
+    "15_gggears_spur",
+    "16_gggears_helical",
+    "17_gggears_bevel",
+    "18_gggears_planetary",
+    "19_gggears_cycloid",
+    "20_gggears_rack",
+]
+
+
+def _run(module_name):
+    """Worker: import one example module and run its main()."""
+    importlib.import_module(module_name).main()
+    return module_name
+
+
+def main(selected=()):
+    names = [s for s in SCRIPTS
+             if not selected or s.split("_")[0] in selected]
+    with ProcessPoolExecutor(
+            max_workers=min(len(names), os.cpu_count())) as pool:
+        for name in pool.map(_run, names):
+            print(f"done: {name}")
+
+
+if __name__ == "__main__":
+    main(set(sys.argv[1:]))
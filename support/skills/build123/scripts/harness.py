@@ -5,138 +5,484 @@ build123d Harness - Run scripts and inspect geometry properties.
 Usage:
     uvx --from build123d python harness.py <script.py> [output.glb]
 
+    # daemon mode: import build123d once, run many scripts in-process
+    uvx --from build123d python harness.py --serve
+    uvx --from build123d python harness.py --connect <script.py> [output.glb]
+
 The script must define a `result` variable containing the geometry to export.
 Outputs: GLB file, geometry properties (volume, bbox, topology).
 """
 
 import sys
 import os
-import runpy
+import json
+import shutil
 import subprocess
 import argparse
+import tempfile
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from build123d import export_gltf
 
+# Optional fast path: volume, area and center of mass computed in one
+# pass over the display mesh. shape.volume/area/center() each run a
+# separate GProp integration over the exact BRep; for heavy assemblies
+# the meshed version is much cheaper and the GLB export needs the
+# triangulation anyway. Exact OCCT properties remain the fallback.
+try:
+    import numpy as np
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mesh_props_kernel(verts, tris):
+        volume = 0.0
+        area = 0.0
+        mx = 0.0
+        my = 0.0
+        mz = 0.0
+        for i in prange(tris.shape[0]):
+            a = tris[i, 0]
+            b = tris[i, 1]
+            c = tris[i, 2]
+            ax, ay, az = verts[a, 0], verts[a, 1], verts[a, 2]
+            bx, by, bz = verts[b, 0], verts[b, 1], verts[b, 2]
+            cx, cy, cz = verts[c, 0], verts[c, 1], verts[c, 2]
+            # Triangle area from the cross product of two edges
+            ux, uy, uz = bx - ax, by - ay, bz - az
+            vx, vy, vz = cx - ax, cy - ay, cz - az
+            nx = uy * vz - uz * vy
+            ny = uz * vx - ux * vz
+            nz = ux * vy - uy * vx
+            area += 0.5 * (nx * nx + ny * ny + nz * nz) ** 0.5
+            # Signed volume of the tetrahedron against the origin; the
+            # signs cancel so the sum is the enclosed volume
+            v = (ax * (by * cz - bz * cy)
+                 - ay * (bx * cz - bz * cx)
+                 + az * (bx * cy - by * cx)) / 6.0
+            volume += v
+            # Tet centroid is the average of its four corners (one of
+            # which is the origin), weighted by the signed volume
+            mx += v * (ax + bx + cx) * 0.25
+            my += v * (ay + by + cy) * 0.25
+            mz += v * (az + bz + cz) * 0.25
+        return volume, area, mx, my, mz
+except ImportError:
+    _mesh_props_kernel = None
+
+
+def _collect_mesh(shape, tol=0.1):
+    """Flatten a shape's face triangulations into vertex/index arrays."""
+    from OCP.BRep import BRep_Tool
+    from OCP.BRepMesh import BRepMesh_IncrementalMesh
+    from OCP.TopAbs import TopAbs_FACE, TopAbs_REVERSED
+    from OCP.TopExp import TopExp
+    from OCP.TopLoc import TopLoc_Location
+    from OCP.TopoDS import TopoDS
+    from OCP.TopTools import TopTools_IndexedMapOfShape
+
+    BRepMesh_IncrementalMesh(shape.wrapped, tol, False, 0.5, True)
+    faces = TopTools_IndexedMapOfShape()
+    TopExp.MapShapes_s(shape.wrapped, TopAbs_FACE, faces)
+
+    verts, tris, base = [], [], 0
+    for i in range(1, faces.Size() + 1):
+        face = TopoDS.Face_s(faces.FindKey(i))
+        location = TopLoc_Location()
+        triangulation = BRep_Tool.Triangulation_s(face, location)
+        if triangulation is None:
+            continue
+        trsf = location.Transformation()
+        n_nodes = triangulation.NbNodes()
+        pts = np.empty((n_nodes, 3), dtype=np.float64)
+        for j in range(1, n_nodes + 1):
+            p = triangulation.Node(j).Transformed(trsf)
+            pts[j - 1] = (p.X(), p.Y(), p.Z())
+        # Reversed faces wind their triangles the other way; flip them
+        # so every normal points outward and the signed volumes agree
+        flipped = face.Orientation() == TopAbs_REVERSED
+        n_tris = triangulation.NbTriangles()
+        idx = np.empty((n_tris, 3), dtype=np.int32)
+        for j in range(1, n_tris + 1):
+            a, b, c = triangulation.Triangle(j).Get()
+            idx[j - 1] = (a, c, b) if flipped else (a, b, c)
+        verts.append(pts)
+        tris.append(idx - 1 + base)
+        base += n_nodes
+    return np.vstack(verts), np.vstack(tris)
+
+
+def _mesh_properties(shape):
+    """Volume, area and center from one kernel pass over the mesh."""
+    if _mesh_props_kernel is None:
+        raise RuntimeError("numpy/numba not available")
+    verts, tris = _collect_mesh(shape)
+    volume, area, mx, my, mz = _mesh_props_kernel(verts, tris)
+    if volume <= 0.0:
+        # Open shells have no meaningful enclosed volume; let the
+        # caller fall back to the exact OCCT properties
+        raise RuntimeError("mesh is not a closed solid")
+    return volume, area, (mx / volume, my / volume, mz / volume)
+
+
+def _bbox_probe(shape):
+    # Vector.to_tuple() pulls all three coordinates through the OCCT
+    # wrapper in one call instead of three .X/.Y/.Z round trips
+    bbox = shape.bounding_box()
+    return {
+        "min": bbox.min.to_tuple(),
+        "max": bbox.max.to_tuple(),
+        "size": bbox.size.to_tuple(),
+    }
 
-def get_geometry_properties(shape):
-    """Extract properties from a build123d shape."""
-    props = {}
 
-    # Bounding box
-    try:
-        bbox = shape.bounding_box()
-        props["bounding_box"] = {
-            "min": (bbox.min.X, bbox.min.Y, bbox.min.Z),
-            "max": (bbox.max.X, bbox.max.Y, bbox.max.Z),
-            "size": (bbox.max.X - bbox.min.X, bbox.max.Y - bbox.min.Y, bbox.max.Z - bbox.min.Z)
-        }
-    except Exception as e:
-        props["bounding_box"] = f"Error: {e}"
+def _center_probe(shape):
+    return shape.center().to_tuple()
 
-    # Volume
-    try:
-        props["volume"] = shape.volume
-    except Exception as e:
-        props["volume"] = f"Error: {e}"
 
-    # Surface area
-    try:
-        props["area"] = shape.area
-    except Exception as e:
-        props["area"] = f"Error: {e}"
+# One probe per reported property. A single loop with one call site
+# replaces the stack of near-identical try/except blocks this used to
+# be: less bytecode, one specialized call site, and adding a property
+# is a one-line change.
+_PROBES = (
+    ("bounding_box", _bbox_probe),
+    ("volume", lambda s: s.volume),
+    ("area", lambda s: s.area),
+    ("center", _center_probe),
+)
 
-    # Center of mass
-    try:
-        com = shape.center()
-        props["center"] = (com.X, com.Y, com.Z)
-    except Exception as e:
-        props["center"] = f"Error: {e}"
 
-    # Topology counts
+# Daemon clients routinely re-probe the same result shape, and the
+# bounding box / GProp traversals walk every sub-shape each time. The
+# cache is keyed weakly by the shape object (entries die with it) and
+# guarded with TopoDS_Shape.IsSame, so a shape whose underlying
+# geometry was swapped or relocated in place is recomputed rather than
+# served stale.
+_PROPS_CACHE = weakref.WeakKeyDictionary()
+
+
+def get_geometry_properties(shape):
+    """Extract properties from a build123d shape (cached per shape)."""
     try:
-        props["vertices"] = len(shape.vertices())
-    except Exception:
-        props["vertices"] = "N/A"
+        cached = _PROPS_CACHE.get(shape)
+    except TypeError:
+        cached = None
+    if cached is not None and cached[0].IsSame(shape.wrapped):
+        return dict(cached[1])
 
+    props = _compute_geometry_properties(shape)
     try:
-        props["edges"] = len(shape.edges())
-    except Exception:
-        props["edges"] = "N/A"
+        _PROPS_CACHE[shape] = (shape.wrapped, dict(props))
+    except TypeError:
+        pass
+    return props
 
+
+def _compute_geometry_properties(shape):
+    props = {}
+
+    # The fast path fills volume/area/center together from one pass
+    # over the display mesh (accurate to the 0.1mm meshing deflection);
+    # the probe loop only computes what is still missing
     try:
-        props["faces"] = len(shape.faces())
+        volume, area, center = _mesh_properties(shape)
+        props.update(volume=volume, area=area, center=center)
     except Exception:
-        props["faces"] = "N/A"
-
+        pass
+
+    for key, probe in _PROBES:
+        if key in props:
+            continue
+        try:
+            props[key] = probe(shape)
+        except Exception as e:
+            props[key] = f"Error: {e}"
+
+    # Topology counts. shape.vertices()/edges()/faces()/solids() each
+    # walk the whole BRep tree and build wrapper objects; mapping the
+    # raw sub-shapes directly counts all four kinds in one pass each
+    # without any wrapping.
     try:
-        props["solids"] = len(shape.solids())
+        from OCP.TopAbs import (TopAbs_EDGE, TopAbs_FACE, TopAbs_SOLID,
+                                TopAbs_VERTEX)
+        from OCP.TopExp import TopExp
+        from OCP.TopTools import TopTools_IndexedMapOfShape
+
+        for name, kind in (("vertices", TopAbs_VERTEX),
+                           ("edges", TopAbs_EDGE),
+                           ("faces", TopAbs_FACE),
+                           ("solids", TopAbs_SOLID)):
+            sub_shapes = TopTools_IndexedMapOfShape()
+            TopExp.MapShapes_s(shape.wrapped, kind, sub_shapes)
+            props[name] = sub_shapes.Size()
     except Exception:
-        props["solids"] = "N/A"
+        for name in ("vertices", "edges", "faces", "solids"):
+            props.setdefault(name, "N/A")
 
     return props
 
 
-def print_properties(props):
-    """Pretty print geometry properties."""
-    print("\n" + "=" * 50)
-    print("GEOMETRY PROPERTIES")
-    print("=" * 50)
+def format_properties(props):
+    """Format geometry properties as one report string."""
+    lines = ["", "=" * 50, "GEOMETRY PROPERTIES", "=" * 50]
 
     if isinstance(props.get("bounding_box"), dict):
         bb = props["bounding_box"]
-        print(f"\nBounding Box:")
-        print(f"  Min: ({bb['min'][0]:.3f}, {bb['min'][1]:.3f}, {bb['min'][2]:.3f})")
-        print(f"  Max: ({bb['max'][0]:.3f}, {bb['max'][1]:.3f}, {bb['max'][2]:.3f})")
-        print(f"  Size: {bb['size'][0]:.3f} x {bb['size'][1]:.3f} x {bb['size'][2]:.3f}")
+        lines += [
+            "",
+            "Bounding Box:",
+            f"  Min: ({bb['min'][0]:.3f}, {bb['min'][1]:.3f}, {bb['min'][2]:.3f})",
+            f"  Max: ({bb['max'][0]:.3f}, {bb['max'][1]:.3f}, {bb['max'][2]:.3f})",
+            f"  Size: {bb['size'][0]:.3f} x {bb['size'][1]:.3f} x {bb['size'][2]:.3f}",
+        ]
     else:
-        print(f"\nBounding Box: {props.get('bounding_box', 'N/A')}")
+        lines += ["", f"Bounding Box: {props.get('bounding_box', 'N/A')}"]
 
     if isinstance(props.get("volume"), (int, float)):
-        print(f"\nVolume: {props['volume']:.3f} cubic units")
+        lines += ["", f"Volume: {props['volume']:.3f} cubic units"]
     else:
-        print(f"\nVolume: {props.get('volume', 'N/A')}")
+        lines += ["", f"Volume: {props.get('volume', 'N/A')}"]
 
     if isinstance(props.get("area"), (int, float)):
-        print(f"Surface Area: {props['area']:.3f} square units")
+        lines.append(f"Surface Area: {props['area']:.3f} square units")
     else:
-        print(f"Surface Area: {props.get('area', 'N/A')}")
+        lines.append(f"Surface Area: {props.get('area', 'N/A')}")
 
     if isinstance(props.get("center"), tuple):
         c = props["center"]
-        print(f"\nCenter of Mass: ({c[0]:.3f}, {c[1]:.3f}, {c[2]:.3f})")
+        lines += ["", f"Center of Mass: ({c[0]:.3f}, {c[1]:.3f}, {c[2]:.3f})"]
     else:
-        print(f"\nCenter of Mass: {props.get('center', 'N/A')}")
+        lines += ["", f"Center of Mass: {props.get('center', 'N/A')}"]
 
-    print(f"\nTopology:")
-    print(f"  Vertices: {props.get('vertices', 'N/A')}")
-    print(f"  Edges: {props.get('edges', 'N/A')}")
-    print(f"  Faces: {props.get('faces', 'N/A')}")
-    print(f"  Solids: {props.get('solids', 'N/A')}")
+    lines += [
+        "",
+        "Topology:",
+        f"  Vertices: {props.get('vertices', 'N/A')}",
+        f"  Edges: {props.get('edges', 'N/A')}",
+        f"  Faces: {props.get('faces', 'N/A')}",
+        f"  Solids: {props.get('solids', 'N/A')}",
+        "=" * 50,
+        "",
+    ]
+    return "\n".join(lines) + "\n"
 
-    print("=" * 50 + "\n")
 
+def print_properties(props):
+    """Pretty print geometry properties.
+
+    The report is assembled first and flushed with a single write - one
+    syscall instead of ~20 print() calls, and no interleaving when the
+    daemon serves concurrent clients.
+    """
+    sys.stdout.write(format_properties(props))
+
+
+def export_glb_soa(shape, path, tol=0.1):
+    """Write a GLB with separate position/normal/index buffers.
+
+    build123d's export_gltf builds interleaved attribute tuples in a
+    Python loop. Keeping each attribute in its own contiguous numpy
+    array (SoA) packs the buffer with one vectorized write per
+    attribute and no stride juggling, and the resulting GLB streams
+    straight into GPU vertex buffers. Requires numpy; run_harness
+    falls back to export_gltf without it.
+    """
+    import struct
+
+    verts, tris = _collect_mesh(shape, tol)
+    pos = np.ascontiguousarray(verts, dtype=np.float32)
+    idx = np.ascontiguousarray(tris, dtype=np.uint32).ravel()
+
+    # Smooth per-vertex normals: accumulate the (area-weighted) face
+    # normals onto their corners, then normalize
+    edge1 = verts[tris[:, 1]] - verts[tris[:, 0]]
+    edge2 = verts[tris[:, 2]] - verts[tris[:, 0]]
+    face_normals = np.cross(edge1, edge2)
+    normals = np.zeros_like(verts)
+    for corner in range(3):
+        np.add.at(normals, tris[:, corner], face_normals)
+    lengths = np.linalg.norm(normals, axis=1)
+    lengths[lengths == 0.0] = 1.0
+    nrm = np.ascontiguousarray(normals / lengths[:, None], dtype=np.float32)
+
+    blobs = [pos.tobytes(), nrm.tobytes(), idx.tobytes()]
+    offsets, offset = [], 0
+    for blob in blobs:
+        offsets.append(offset)
+        offset += len(blob) + (-len(blob) % 4)
+
+    doc = {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0}],
+        "meshes": [{"primitives": [
+            {"attributes": {"POSITION": 0, "NORMAL": 1}, "indices": 2}]}],
+        "accessors": [
+            {"bufferView": 0, "componentType": 5126, "count": len(pos),
+             "type": "VEC3", "min": pos.min(axis=0).tolist(),
+             "max": pos.max(axis=0).tolist()},
+            {"bufferView": 1, "componentType": 5126, "count": len(nrm),
+             "type": "VEC3"},
+            {"bufferView": 2, "componentType": 5125, "count": idx.size,
+             "type": "SCALAR"},
+        ],
+        "bufferViews": [
+            {"buffer": 0, "byteOffset": offsets[0],
+             "byteLength": len(blobs[0]), "target": 34962},
+            {"buffer": 0, "byteOffset": offsets[1],
+             "byteLength": len(blobs[1]), "target": 34962},
+            {"buffer": 0, "byteOffset": offsets[2],
+             "byteLength": len(blobs[2]), "target": 34963},
+        ],
+        "buffers": [{"byteLength": offset}],
+    }
 
-def run_harness(script_path, output_path=None):
+    json_chunk = json.dumps(doc, separators=(",", ":")).encode()
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    bin_chunk = b"".join(
+        blob + b"\0" * (-len(blob) % 4) for blob in blobs)
+    total = 12 + 8 + len(json_chunk) + 8 + len(bin_chunk)
+
+    # Assemble the whole container in memory and land it with a single
+    # write(); the bytes are returned so the caller can inspect them
+    # without re-reading the file
+    payload = b"".join([
+        struct.pack("<III", 0x46546C67, 2, total),
+        struct.pack("<II", len(json_chunk), 0x4E4F534A),  # JSON
+        json_chunk,
+        struct.pack("<II", len(bin_chunk), 0x004E4942),  # BIN
+        bin_chunk,
+    ])
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+    return payload
+
+
+def quantize_glb(path):
+    """Quantize mesh attributes in place via KHR_mesh_quantization.
+
+    Positions drop from float32 to int16 and normals to int8, roughly
+    halving the vertex payload with no visible difference at display
+    scale. Uses gltf-transform's quantize command when it is on PATH;
+    the full-precision file is kept otherwise.
+    """
+    tool = shutil.which("gltf-transform")
+    if tool is None:
+        return False
+    subprocess.run(
+        [tool, "quantize", str(path), str(path),
+         "--quantize-position", "14", "--quantize-normal", "8"],
+        check=True, timeout=60, stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False,
+    )
+    return True
+
+
+def inspect_glb(path, data=None):
+    """Summarize a GLB by reading its JSON chunk in-process.
+
+    A .glb is a 12-byte header (magic, version, length) followed by
+    chunks, the first of which is the scene JSON. Pulling the summary
+    straight out of that chunk replaces the gltf-transform subprocess,
+    which paid node startup plus a full buffer parse for the handful of
+    numbers the harness prints. Passing data (the GLB bytes already in
+    memory) skips reading the file back entirely.
+    """
+    import mmap
+    import struct
+
+    def parse(buf):
+        magic, version, length = struct.unpack_from("<III", buf, 0)
+        if magic != 0x46546C67:  # b"glTF"
+            raise ValueError(f"Not a GLB file: {path}")
+        json_length, _chunk_type = struct.unpack_from("<II", buf, 12)
+        return json.loads(bytes(buf[20:20 + json_length])), length
+
+    if data is not None:
+        doc, length = parse(data)
+    else:
+        with open(path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            doc, length = parse(buf)
+
+    accessors = doc.get("accessors", [])
+    meshes = doc.get("meshes", [])
+    positions = indices = primitives = 0
+    for mesh in meshes:
+        for prim in mesh.get("primitives", []):
+            primitives += 1
+            pos = prim.get("attributes", {}).get("POSITION")
+            if pos is not None:
+                positions += accessors[pos].get("count", 0)
+            idx = prim.get("indices")
+            if idx is not None:
+                indices += accessors[idx].get("count", 0)
+
+    lines = [
+        f"  glTF {doc.get('asset', {}).get('version', '?')}, {length:,} bytes",
+        f"  Meshes: {len(meshes)} ({primitives} primitives)",
+        f"  Vertices: {positions:,}",
+        f"  Triangles: {indices // 3:,}",
+        f"  Accessors: {len(accessors)}, "
+        f"buffer views: {len(doc.get('bufferViews', []))}",
+    ]
+    if doc.get("extensionsUsed"):
+        lines.append(f"  Extensions: {', '.join(doc['extensionsUsed'])}")
+    return "\n".join(lines)
+
+
+_CODE_CACHE = {}
+
+
+def _load_code(path):
+    """Compile a script once per (path, mtime); reruns skip the parse.
+
+    runpy.run_path re-reads and recompiles the file on every call. In
+    daemon mode the same script is typically resubmitted many times
+    between edits, so cache the code object keyed by path and mtime -
+    an edit bumps the mtime and triggers a recompile.
+    """
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns)
+    code = _CODE_CACHE.get(key)
+    if code is None:
+        with open(path, "rb") as f:
+            code = compile(f.read(), path, "exec")
+        _CODE_CACHE[key] = code
+    return code
+
+
+def run_harness(script_path, output_path=None, quantize=False,
+                properties=True, inspect=True):
     """Run a build123d script and process the `result` object."""
-    script_path = Path(script_path).resolve()
+    # Plain os.path strings on the hot path: each Path method allocates
+    # a fresh object, which adds up in the daemon's inner loop
+    script_path = os.path.realpath(script_path)
 
-    if not script_path.exists():
+    if not os.path.exists(script_path):
         print(f"Error: Script not found: {script_path}")
         sys.exit(1)
 
     # Default output path
     if output_path is None:
-        output_path = script_path.with_suffix(".glb")
+        output_path = os.path.splitext(script_path)[0] + ".glb"
     else:
-        output_path = Path(output_path)
+        output_path = os.fspath(output_path)
 
     print(f"Running: {script_path}")
     print(f"Output: {output_path}")
 
-    # Run the script using runpy (standard library)
+    # Execute the cached code object in a fresh namespace; the script
+    # still sees itself as __main__
     try:
-        script_result = runpy.run_path(str(script_path), run_name="__main__")
+        script_result = {"__name__": "__main__",
+                         "__file__": script_path}
+        exec(_load_code(script_path), script_result)
     except Exception as e:
         print(f"Error running script: {e}")
         sys.exit(1)
@@ -148,40 +494,104 @@ def run_harness(script_path, output_path=None):
 
     result_shape = script_result["result"]
 
-    # Get and print properties
-    props = get_geometry_properties(result_shape)
-    print_properties(props)
-
-    # Export to GLB
-    try:
-        export_gltf(result_shape, str(output_path), binary=True)
-        print(f"Exported: {output_path}")
-        print(f"File size: {output_path.stat().st_size:,} bytes")
-    except Exception as e:
-        print(f"Error exporting GLB: {e}")
-        sys.exit(1)
+    def _export():
+        # The SoA writer when numpy is around, otherwise build123d's
+        # exporter. The SoA writer hands back the GLB bytes so the
+        # in-process inspection can skip re-reading the file.
+        if _mesh_props_kernel is not None:
+            return export_glb_soa(result_shape, output_path)
+        export_gltf(result_shape, output_path, binary=True)
+        return None
+
+    if _mesh_props_kernel is not None:
+        # Mesh once up front so the two threads below only read the
+        # cached triangulation instead of racing to build it
+        from OCP.BRepMesh import BRepMesh_IncrementalMesh
+        BRepMesh_IncrementalMesh(result_shape.wrapped, 0.1, False, 0.5, True)
+
+    # Property computation and GLB export are independent, and both
+    # spend their time inside OCCT with the GIL released - run them
+    # concurrently so wall time is the max of the two, not the sum
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # For pipelines that only want the artifact, skipping the
+        # property traversal removes a whole workload, not just
+        # overhead
+        props_future = (pool.submit(get_geometry_properties, result_shape)
+                        if properties else None)
+        export_future = pool.submit(_export)
+        try:
+            glb_bytes = export_future.result()
+        except Exception as e:
+            print(f"Error exporting GLB: {e}")
+            sys.exit(1)
+
+        if quantize:
+            try:
+                if not quantize_glb(output_path):
+                    print("gltf-transform not installed; skipping quantization")
+                else:
+                    glb_bytes = None  # rewritten on disk
+            except Exception as e:
+                print(f"Error quantizing GLB: {e}")
+
+        # Inspection defaults to the in-process GLB parser; set
+        # HARNESS_GLB_INSPECTOR=gltf-transform to get the external
+        # tool's fuller report instead. In that mode it's kicked off
+        # right after the export so node's startup (hundreds of ms)
+        # overlaps with the still-running property computation.
+        # shutil.which avoids forking at all when the tool isn't
+        # installed.
+        use_subprocess = (os.environ.get("HARNESS_GLB_INSPECTOR")
+                          == "gltf-transform")
+        inspect_proc = None
+        if inspect and use_subprocess and shutil.which("gltf-transform"):
+            # Plain pipes plus close_fds=False keep CPython on its
+            # posix_spawn fast path; a fork() here would copy the page
+            # tables of a process that has all of OCCT mapped in
+            inspect_proc = subprocess.Popen(
+                ["gltf-transform", "inspect", output_path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                close_fds=False,
+            )
+
+        props = props_future.result() if props_future is not None else None
+
+    if props is not None:
+        print_properties(props)
+    print(f"Exported: {output_path}")
+    print(f"File size: {os.stat(output_path).st_size:,} bytes")
+
+    if not inspect:
+        return {
+            "properties": props,
+            "glb_path": output_path
+        }
 
-    # Run gltf-transform inspect if available
     print("\n" + "=" * 50)
-    print("GLB INSPECTION (gltf-transform)")
+    print("GLB INSPECTION")
     print("=" * 50)
-    try:
-        result = subprocess.run(
-            ["gltf-transform", "inspect", str(output_path)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode == 0:
-            print(result.stdout)
-        else:
-            print(f"  gltf-transform not available: {result.stderr.strip()}")
-    except FileNotFoundError:
+    if not use_subprocess:
+        try:
+            print(inspect_glb(output_path, glb_bytes))
+        except Exception as e:
+            print(f"  Error inspecting GLB: {e}")
+    elif inspect_proc is None:
         print("  gltf-transform not installed (optional: bun add -g @gltf-transform/cli)")
-    except subprocess.TimeoutExpired:
-        print("  gltf-transform timed out")
-    except Exception as e:
-        print(f"  Error running gltf-transform: {e}")
+    else:
+        try:
+            stdout, stderr = inspect_proc.communicate(timeout=30)
+            if inspect_proc.returncode == 0:
+                print(stdout)
+            else:
+                print(f"  gltf-transform not available: {stderr.strip()}")
+        except subprocess.TimeoutExpired:
+            inspect_proc.kill()
+            print("  gltf-transform timed out")
+        except Exception as e:
+            print(f"  Error running gltf-transform: {e}")
 
     return {
         "properties": props,
@@ -189,10 +599,109 @@ def run_harness(script_path, output_path=None):
     }
 
 
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "build123d-harness.sock")
+
+
+def serve(socket_path):
+    """Run as a daemon: import build123d once, execute scripts in-process.
+
+    Every fresh harness launch pays seconds of build123d/OCCT import
+    before any geometry runs. The daemon binds a UNIX socket and keeps
+    the warm interpreter around; each connection submits one JSON
+    request ({"script": ..., "output": ...}) and receives the
+    properties dict back as JSON.
+    """
+    import socketserver
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            request = {}
+            try:
+                request = json.loads(self.rfile.readline())
+                outcome = run_harness(request["script"], request.get("output"),
+                                      quantize=request.get("quantize", False))
+                payload = {
+                    "ok": True,
+                    "properties": outcome["properties"],
+                    "glb_path": str(outcome["glb_path"]),
+                }
+            except SystemExit as e:
+                payload = {"ok": False, "error": f"harness exited: {e.code}"}
+            except Exception as e:
+                payload = {"ok": False, "error": str(e)}
+            # Drop modules whose source sits next to the submitted
+            # script - its local helpers - so the next run picks up
+            # edits. Installed packages keep their warm imports; that
+            # is the whole point of the daemon.
+            script = request.get("script") if isinstance(request, dict) else None
+            if script:
+                script_dir = os.path.dirname(os.path.realpath(script))
+                for name, module in list(sys.modules.items()):
+                    file = getattr(module, "__file__", None)
+                    if file and os.path.dirname(
+                            os.path.realpath(file)) == script_dir:
+                        del sys.modules[name]
+            self.wfile.write((json.dumps(payload, default=str) + "\n").encode())
+
+    # Compile the mesh-properties kernel before accepting requests so
+    # the first client doesn't pay the JIT warmup; with cache=True the
+    # machine code also persists, making later daemon starts cheap
+    if _mesh_props_kernel is not None:
+        _mesh_props_kernel(np.zeros((3, 3)),
+                           np.zeros((1, 3), dtype=np.int32))
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    with socketserver.ThreadingUnixStreamServer(socket_path, Handler) as server:
+        print(f"Harness daemon listening on {socket_path}")
+        server.serve_forever()
+
+
+def submit(socket_path, script_path, output_path=None):
+    """Send one script to a running daemon and print its reply."""
+    import socket
+
+    request = {"script": str(Path(script_path).resolve()),
+               "output": str(output_path) if output_path else None}
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(socket_path)
+        stream = sock.makefile("rw")
+        stream.write(json.dumps(request) + "\n")
+        stream.flush()
+        reply = json.loads(stream.readline())
+    if not reply.get("ok"):
+        print(f"Error: {reply.get('error')}")
+        sys.exit(1)
+    print(json.dumps(reply["properties"], indent=2, default=str))
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("script", help="Path to build123d script")
+    parser.add_argument("script", nargs="?", help="Path to build123d script")
     parser.add_argument("output", nargs="?", help="Output GLB path (default: script_name.glb)")
+    parser.add_argument("--quantize", action="store_true",
+                        help="Quantize the GLB (KHR_mesh_quantization)")
+    parser.add_argument("--no-properties", action="store_true",
+                        help="Skip property computation; just export")
+    parser.add_argument("--no-inspect", action="store_true",
+                        help="Skip the GLB inspection step")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run as a daemon on a UNIX socket")
+    parser.add_argument("--connect", action="store_true",
+                        help="Submit the script to a running daemon")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET,
+                        help="Daemon socket path")
 
     args = parser.parse_args()
-    run_harness(args.script, args.output)
+    if args.serve:
+        serve(args.socket)
+    elif args.connect:
+        if not args.script:
+            parser.error("--connect requires a script path")
+        submit(args.socket, args.script, args.output)
+    else:
+        if not args.script:
+            parser.error("a script path is required")
+        run_harness(args.script, args.output, quantize=args.quantize,
+                    properties=not args.no_properties,
+                    inspect=not args.no_inspect)